@@ -0,0 +1,95 @@
+# benchmarks/bench_bulk_import.py
+"""
+Import throughput: one add_* call per row vs the *_many bulk APIs
+(single transaction + executemany).
+
+Run from desktop_app/:
+    python -m benchmarks.bench_bulk_import [--rows 10000]
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List, Sequence
+
+from services.db import CareerDB
+
+
+def _jobs(n: int) -> List[tuple]:
+    return [(f"Company {i}", f"Role {i}", "Applied", "", "notes " * 20, "2026-01-01") for i in range(n)]
+
+
+def _reminders(n: int) -> List[tuple]:
+    return [(f"Reminder {i}", "", f"2026-{i % 12 + 1:02d}-{i % 28 + 1:02d}", "09:30", "Other") for i in range(n)]
+
+
+def _files(n: int) -> List[tuple]:
+    return [(f"stored_{i}.pdf", f"file {i}.pdf", "Other", "2026-01-01") for i in range(n)]
+
+
+def _messages(n: int) -> List[tuple]:
+    return [("user" if i % 2 else "assistant", f"message {i} " * 10) for i in range(n)]
+
+
+def _timed(fn: Callable[[], object]) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def _report(label: str, rows: int, one_by_one: float, bulk: float) -> None:
+    print(
+        f"  {label:<12} one-by-one {rows / one_by_one:10,.0f} rows/s   "
+        f"bulk {rows / bulk:10,.0f} rows/s   x{one_by_one / bulk:5.1f}"
+    )
+
+
+def _loop(fn: Callable, rows: Sequence[tuple]) -> Callable[[], None]:
+    def _run():
+        for r in rows:
+            fn(*r)
+    return _run
+
+
+def run(rows: int) -> None:
+    print(f"importing {rows:,} rows per table")
+    with tempfile.TemporaryDirectory() as tmp:
+        # fresh db per mode so both start from the same (empty) state
+        single = CareerDB(Path(tmp) / "single.db")
+        bulk = CareerDB(Path(tmp) / "bulk.db")
+        conv_single = single.ai_create_conversation("bench")
+        conv_bulk = bulk.ai_create_conversation("bench")
+
+        jobs, reminders, files, messages = _jobs(rows), _reminders(rows), _files(rows), _messages(rows)
+
+        _report(
+            "jobs", rows,
+            _timed(_loop(single.add_job, jobs)),
+            _timed(lambda: bulk.add_jobs_many(jobs)),
+        )
+        _report(
+            "reminders", rows,
+            _timed(_loop(single.add_reminder, reminders)),
+            _timed(lambda: bulk.add_reminders_many(reminders)),
+        )
+        _report(
+            "files", rows,
+            _timed(_loop(single.add_file, files)),
+            _timed(lambda: bulk.add_files_many(files)),
+        )
+        _report(
+            "ai_messages", rows,
+            _timed(_loop(lambda role, content: single.ai_add_message(conv_single, role, content), messages)),
+            _timed(lambda: bulk.ai_add_messages_many(conv_bulk, messages)),
+        )
+
+        single.close()
+        bulk.close()
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=10_000)
+    run(ap.parse_args().rows)
@@ -0,0 +1,290 @@
+# benchmarks/bench_careerdb.py
+"""
+Latency of every public CareerDB method (plus the queries CalendarPage and
+NotepadPage run) against a synthetic database, as p50/p95/p99.
+
+Run from desktop_app/:
+    python -m benchmarks.bench_careerdb [--jobs 20000 ...] [--iterations 200]
+        [--json results.json] [--baseline previous.json --threshold 25]
+
+With --baseline, a method fails the run (exit status 1) when its p50 (or
+--metric) is more than --threshold percent slower than in the baseline file.
+Methods without a case are listed so new CareerDB methods don't go unmeasured.
+"""
+from __future__ import annotations
+
+import argparse
+import inspect
+import itertools
+import json
+import platform
+import sqlite3
+import sys
+import tempfile
+import time
+from dataclasses import fields
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from benchmarks.synthetic import Volumes, seed
+from services.db import CareerDB
+
+# methods that are not per-call operations
+NOT_TIMED = {"close", "close_thread", "enable_mirror", "disable_mirror", "lock_metrics"}
+
+# whole-table reads: fewer iterations
+HEAVY = {"get_all_jobs", "get_jobs_by_status", "list_job_cards", "list_files"}
+
+Case = Tuple[str, Callable[[int], object]]
+
+# reminders written by the benchmark land outside the ranges the read cases query
+WRITE_DAY = "2031-01-01"
+
+
+def _percentile(sorted_samples: List[float], q: float) -> float:
+    # nearest rank
+    k = max(0, min(len(sorted_samples) - 1, int(round(q * len(sorted_samples) + 0.5)) - 1))
+    return sorted_samples[k]
+
+
+def _cases(db: CareerDB, volumes: Volumes, iterations: int) -> List[Case]:
+    """(label, fn(i)); i is the iteration number, for writes that need fresh ids."""
+    jobs = max(volumes.jobs, 1)
+    notes = max(volumes.notes, 1)
+    conv = 1
+    today = date(2025, 3, 12)
+    month_start = today.replace(day=1).isoformat()
+    month_end = (today.replace(day=28) + timedelta(days=4)).replace(day=1).isoformat()
+    first_key = db.list_jobs_page(page_size=50)[1]
+    files_key = db.list_files_page(order="name", page_size=60)[1]
+    notes_key = db.list_note_items_page(page_size=50)[1]
+
+    # rows for destructive cases, created up front so every call hits a real row
+    spare_jobs = db.add_jobs_many(("Spare", "Role", "Applied") for _ in range(iterations))
+    spare_files = db.add_files_many((f"spare_{i}.pdf", f"spare {i}.pdf", "Other") for i in range(iterations))
+    spare_reminders = db.add_reminders_many(
+        ("Spare", "", WRITE_DAY, "10:00", "Other") for _ in range(iterations)
+    )
+    spare_memories = [db.ai_add_memory("fact", f"spare {i}") for i in range(iterations)]
+    spare_conversations = []
+    for i in range(iterations):
+        spare_conversations.append(db.ai_create_conversation(f"spare {i}"))
+        db.ai_add_messages_many(spare_conversations[-1], (("user", "spare") for _ in range(20)))
+    with db._conn() as conn:
+        first_note = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM note_items").fetchone()[0]
+        conn.executemany(
+            "INSERT INTO note_items (title, content) VALUES (?, ?)",
+            ((f"spare {i}", "spare") for i in range(iterations)),
+        )
+
+    statuses = itertools.cycle(("Applied", "Interviewing", "Offer", "Rejected"))
+
+    def _note_get(i):
+        with db._conn() as conn:
+            return conn.execute(
+                "SELECT id, title, content, updated_at FROM note_items WHERE id=?", (i % notes + 1,)
+            ).fetchone()
+
+    def _note_insert(i):
+        with db._conn() as conn:
+            return conn.execute("INSERT INTO note_items(title, content) VALUES(?,?)", (f"bench {i}", "body")).lastrowid
+
+    def _note_update(i):
+        with db._conn() as conn:
+            conn.execute(
+                """UPDATE note_items
+                   SET title=?, content=?, updated_at=strftime('%Y-%m-%d %H:%M:%S','now')
+                   WHERE id=?""",
+                (f"edited {i}", "body", i % notes + 1),
+            )
+
+    def _note_delete(i):
+        with db._conn() as conn:
+            conn.execute("DELETE FROM note_items WHERE id=?", (first_note + i,))
+
+    return [
+        # ----- jobs
+        ("add_job", lambda i: db.add_job(f"Bench {i}", "Role", "Applied", notes="n")),
+        ("add_jobs_many[100]", lambda i: db.add_jobs_many(("Bulk", "Role", "Applied") for _ in range(100))),
+        ("get_job", lambda i: db.get_job(i % jobs + 1)),
+        ("list_job_cards", lambda i: db.list_job_cards()),
+        ("list_job_cards[10]", lambda i: db.list_job_cards(limit=10)),
+        ("get_job_card", lambda i: db.get_job_card(i % jobs + 1)),
+        ("list_jobs_page", lambda i: db.list_jobs_page(page_size=50)),
+        ("list_jobs_page[next]", lambda i: db.list_jobs_page(after_key=first_key, page_size=50)),
+        ("list_jobs_page[status]", lambda i: db.list_jobs_page(status="Applied", page_size=50)),
+        ("get_job_details", lambda i: db.get_job_details(i % jobs + 1)),
+        ("get_all_jobs", lambda i: db.get_all_jobs()),
+        ("get_jobs_by_status", lambda i: db.get_jobs_by_status("Applied")),
+        ("job_status_counts", lambda i: db.job_status_counts()),
+        ("count_jobs", lambda i: db.count_jobs()),
+        ("reject_rate", lambda i: db.reject_rate()),
+        ("job_weekly_stats", lambda i: db.job_weekly_stats()),
+        ("job_monthly_stats", lambda i: db.job_monthly_stats()),
+        ("update_job_status", lambda i: db.update_job_status(i % jobs + 1, next(statuses))),
+        ("edit_job", lambda i: db.edit_job(i % jobs + 1, "Edited", "Role", "Applied", "notes")),
+        ("delete_job", lambda i: db.delete_job(spare_jobs[i])),
+        # ----- notes
+        ("load_notes", lambda i: db.load_notes()),
+        ("save_notes", lambda i: db.save_notes(f"scratch {i}")),
+        ("list_note_items_page", lambda i: db.list_note_items_page(page_size=50)),
+        ("list_note_items_page[next]", lambda i: db.list_note_items_page(after_key=notes_key, page_size=50)),
+        ("list_note_items_page[search]", lambda i: db.list_note_items_page("python", page_size=50)),
+        ("NotepadPage._get_note", _note_get),
+        ("NotepadPage._insert_note", _note_insert),
+        ("NotepadPage._update_note", _note_update),
+        ("NotepadPage._delete_note", _note_delete),
+        # ----- files
+        ("add_file", lambda i: db.add_file(f"f_{i}.pdf", f"file {i}.pdf", "CV")),
+        ("add_files_many[100]", lambda i: db.add_files_many(("b.pdf", "b.pdf", "CV") for _ in range(100))),
+        ("list_files", lambda i: db.list_files()),
+        ("list_files[category]", lambda i: db.list_files("CV")),
+        ("list_files_page", lambda i: db.list_files_page(page_size=60)),
+        ("list_files_page[name,next]", lambda i: db.list_files_page(order="name", after_key=files_key, page_size=60)),
+        ("list_files_page[category]", lambda i: db.list_files_page(categories=["CV"], page_size=60)),
+        ("file_categories", lambda i: db.file_categories()),
+        ("delete_file", lambda i: db.delete_file(spare_files[i])),
+        # ----- reminders
+        ("due_at", lambda i: CareerDB.due_at("2025-03-12", "9:30")),
+        ("add_reminder", lambda i: db.add_reminder(f"R {i}", "", WRITE_DAY, "09:00", "Other")),
+        ("add_reminders_many[100]", lambda i: db.add_reminders_many(
+            ("Bulk", "", WRITE_DAY, "09:00", "Other") for _ in range(100))),
+        ("list_reminders_for_date", lambda i: db.list_reminders_for_date("2025-03-12")),
+        ("list_reminders_between", lambda i: db.list_reminders_between("2025-03-10", "2025-03-16")),
+        ("CalendarPage._fetch_events_in_range", lambda i: db.list_reminders_between(month_start, month_end)),
+        ("list_upcoming_reminders", lambda i: db.list_upcoming_reminders("2025-03-12 00:00")),
+        ("next_due_reminder", lambda i: db.next_due_reminder("2025-03-12 00:00")),
+        ("update_reminder", lambda i: db.update_reminder(
+            spare_reminders[i], "Edited", "", WRITE_DAY, "11:00", "Other")),
+        ("mark_notified", lambda i: db.mark_notified(spare_reminders[i])),
+        ("delete_reminder", lambda i: db.delete_reminder(spare_reminders[i])),
+        # ----- AI
+        ("ai_create_conversation", lambda i: db.ai_create_conversation(f"bench {i}")),
+        ("ai_list_conversations", lambda i: db.ai_list_conversations()),
+        ("ai_conversation_scope", lambda i: CareerDB.ai_conversation_scope(i)),
+        ("ai_delete_conversation", lambda i: db.ai_delete_conversation(spare_conversations[i])),
+        ("ai_add_message", lambda i: db.ai_add_message(conv, "user", "hello")),
+        ("ai_add_messages_many[100]", lambda i: db.ai_add_messages_many(conv, (("user", "hi") for _ in range(100)))),
+        ("ai_get_messages", lambda i: db.ai_get_messages(conv)),
+        ("ai_get_messages_page", lambda i: db.ai_get_messages_page(conv)),
+        ("ai_add_memory", lambda i: db.ai_add_memory("fact", f"bench {i}")),
+        ("ai_list_memories", lambda i: db.ai_list_memories()),
+        ("ai_search_memories", lambda i: db.ai_search_memories("python")),
+        ("ai_set_memory_pinned", lambda i: db.ai_set_memory_pinned(spare_memories[i], i % 2)),
+        ("ai_delete_memory", lambda i: db.ai_delete_memory(spare_memories[i])),
+        ("ai_get_latest_summary", lambda i: db.ai_get_latest_summary()),
+        ("ai_set_summary", lambda i: db.ai_set_summary("global", f"summary {i}")),
+    ]
+
+
+def _untimed_methods(cases: List[Case]) -> List[str]:
+    covered = {label.split("[")[0] for label, _fn in cases}
+    public = {
+        name for name, _m in inspect.getmembers(CareerDB, callable)
+        if not name.startswith("_") and name not in NOT_TIMED
+    }
+    return sorted(public - covered)
+
+
+def _time(fn: Callable[[int], object], iterations: int) -> Dict[str, float]:
+    fn(0)  # warm the page cache / statement cache
+    samples = []
+    for i in range(1, iterations + 1):
+        t0 = time.perf_counter()
+        fn(i)
+        samples.append((time.perf_counter() - t0) * 1e6)
+    samples.sort()
+    return {
+        "n": len(samples),
+        "mean_us": sum(samples) / len(samples),
+        "p50_us": _percentile(samples, 0.50),
+        "p95_us": _percentile(samples, 0.95),
+        "p99_us": _percentile(samples, 0.99),
+    }
+
+
+def run(volumes: Volumes, iterations: int) -> Dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        db = CareerDB(Path(tmp) / "bench.db")
+        t0 = time.perf_counter()
+        seed(db, volumes)
+        seeded_s = time.perf_counter() - t0
+        print(f"seeded {volumes.as_dict()} in {seeded_s:.1f}s")
+
+        # +1: the warm-up call (i=0) consumes one spare row in destructive cases
+        cases = _cases(db, volumes, iterations + 1)
+        results: Dict[str, Dict[str, float]] = {}
+        print(f"  {'method':<38}{'p50 us':>10}{'p95 us':>10}{'p99 us':>10}")
+        for label, fn in cases:
+            n = min(iterations, 30) if label.split("[")[0] in HEAVY else iterations
+            r = _time(fn, n)
+            results[label] = r
+            print(f"  {label:<38}{r['p50_us']:>10.1f}{r['p95_us']:>10.1f}{r['p99_us']:>10.1f}")
+
+        missing = _untimed_methods(cases)
+        if missing:
+            print("no benchmark case for:", ", ".join(missing))
+        db.close()
+
+    return {
+        "meta": {
+            "volumes": volumes.as_dict(),
+            "iterations": iterations,
+            "seed_seconds": round(seeded_s, 2),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict, baseline: Dict, threshold_pct: float, metric: str = "p50_us") -> List[str]:
+    """Labels slower than baseline by more than threshold_pct, as messages."""
+    regressions = []
+    for label, r in current["results"].items():
+        old = baseline.get("results", {}).get(label)
+        if not old or not old.get(metric):
+            continue
+        change = (r[metric] - old[metric]) / old[metric] * 100.0
+        if change > threshold_pct:
+            regressions.append(f"{label}: {metric} {old[metric]:.1f} -> {r[metric]:.1f} us (+{change:.0f}%)")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser()
+    for f in fields(Volumes):
+        ap.add_argument(f"--{f.name}", type=int, default=f.default)
+    ap.add_argument("--iterations", type=int, default=200)
+    ap.add_argument("--json", type=Path, help="write results here")
+    ap.add_argument("--baseline", type=Path, help="results JSON from an earlier run")
+    ap.add_argument("--threshold", type=float, default=25.0, help="allowed slowdown, percent")
+    ap.add_argument("--metric", choices=("p50_us", "p95_us", "p99_us", "mean_us"), default="p50_us")
+    args = ap.parse_args(argv)
+
+    volumes = Volumes(**{f.name: getattr(args, f.name) for f in fields(Volumes)})
+    current = run(volumes, args.iterations)
+
+    if args.json:
+        args.json.write_text(json.dumps(current, indent=2), encoding="utf-8")
+        print(f"wrote {args.json}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        if baseline.get("meta", {}).get("volumes") != current["meta"]["volumes"]:
+            print("warning: baseline was recorded with different volumes")
+        regressions = compare(current, baseline, args.threshold, args.metric)
+        if regressions:
+            print(f"{len(regressions)} regression(s) over {args.threshold:.0f}%:")
+            for line in regressions:
+                print("  " + line)
+            return 1
+        print(f"no regressions over {args.threshold:.0f}% ({args.metric})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+# benchmarks/bench_connections.py
+"""
+Per-call latency: connect-per-call (old CareerDB._conn) vs pooled connections.
+
+Run from desktop_app/:
+    python -m benchmarks.bench_connections [--calls 2000]
+"""
+from __future__ import annotations
+
+import argparse
+import sqlite3
+import statistics
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, List
+
+from services.db import CareerDB
+
+
+class _ConnectPerCallDB(CareerDB):
+    """The pre-pool behaviour: open, commit and close on every call."""
+
+    @contextmanager
+    def _conn(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _read(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+
+def _time_calls(fn: Callable[[], object], calls: int) -> List[float]:
+    out = []
+    for _ in range(calls):
+        t0 = time.perf_counter()
+        fn()
+        out.append((time.perf_counter() - t0) * 1e6)
+    return out
+
+
+def _report(label: str, samples: List[float]) -> None:
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"  {label:<28} mean {statistics.mean(samples):8.1f} us   p50 {statistics.median(samples):8.1f} us   p95 {p95:8.1f} us")
+
+
+def _seed(db: CareerDB) -> None:
+    for i in range(200):
+        db.add_job(f"Company {i}", f"Role {i}", "Applied", notes="x" * 200)
+    conv = db.ai_create_conversation("bench")
+    for i in range(100):
+        db.ai_add_message(conv, "user", f"message {i}")
+
+
+def run(calls: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        _seed(CareerDB(path))
+
+        for label, cls in (("connect-per-call", _ConnectPerCallDB), ("pooled", CareerDB)):
+            db = cls(path)
+            print(label)
+            _report("get_all_jobs", _time_calls(db.get_all_jobs, calls))
+            _report("list_reminders_for_date", _time_calls(lambda: db.list_reminders_for_date("2026-01-01"), calls))
+            _report("ai_get_messages", _time_calls(lambda: db.ai_get_messages(1, limit=16), calls))
+            _report("ai_add_message", _time_calls(lambda: db.ai_add_message(1, "user", "hi"), calls))
+            db.close()
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--calls", type=int, default=2000)
+    run(ap.parse_args().calls)
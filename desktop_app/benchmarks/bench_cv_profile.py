@@ -0,0 +1,69 @@
+# benchmarks/bench_cv_profile.py
+"""
+CV text sent per AI Buddy turn (raw attachment, clipped at 25k chars, vs
+the sections services/cv_profile.py picks for the question) and the cost of
+analysing a CV vs loading its stored profile.
+
+Run from desktop_app/:
+    python -m benchmarks.bench_cv_profile [--pages 3] [--repeats 50]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.bench_extractors import _cv_lines
+from services.cv_profile import CVProfileStore, analyze_cv, sections_for
+from services.db import CareerDB
+
+QUESTIONS = (
+    "What skills should I highlight for a data analyst role?",
+    "Summarise my education",
+    "Which projects show backend experience?",
+    "Write me a cover letter for this job",
+    "Can you review my CV?",
+)
+RAW_LIMIT = 25_000  # what AI Buddy clips an attachment to
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pages", type=int, default=3)
+    ap.add_argument("--repeats", type=int, default=50)
+    args = ap.parse_args()
+
+    cv = "\n".join(_cv_lines(random.Random(0), args.pages))
+    profile = analyze_cv(cv, "bench")
+    raw = min(len(cv), RAW_LIMIT)
+
+    print(f"CV: {len(cv)} chars, sections {list(profile.sections)}, {len(profile.achievements)} achievements")
+    print(f"  {'question':<58}{'raw':>8}{'profile':>9}{'saved':>8}")
+    for q in QUESTIONS:
+        names = sections_for(q)
+        sent = len(profile.context(names)) if names else raw
+        print(f"  {q:<58}{raw:>8}{sent:>9}{1 - sent / raw:>8.0%}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = CareerDB(Path(tmp) / "cv.db")
+        store = CVProfileStore(db)
+        store.profile("bench", cv)
+
+        t0 = time.perf_counter()
+        for _ in range(args.repeats):
+            analyze_cv(cv)
+        analyze_ms = (time.perf_counter() - t0) * 1000 / args.repeats
+
+        t0 = time.perf_counter()
+        for _ in range(args.repeats):
+            store.profile("bench", cv)
+        stored_ms = (time.perf_counter() - t0) * 1000 / args.repeats
+        db.close()
+
+    print(f"\nanalyze_cv: {analyze_ms:.2f} ms   stored profile: {stored_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# benchmarks/bench_extractors.py
+"""
+Throughput of every available extractor backend (services/extractors.py)
+on CV-sized documents; the chars/ms column seeds each Backend's
+`seed_chars_per_ms`.
+
+By default a seeded corpus of 1-3 page CVs is written as PDF (needs
+PyMuPDF), DOCX (needs python-docx) and TXT; --corpus points at a folder
+of real CVs instead (every .pdf/.docx/.txt/... in it is used).
+
+Run from desktop_app/:
+    python -m benchmarks.bench_extractors [--cvs 30] [--repeats 3] [--corpus DIR]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from benchmarks.synthetic import WORDS
+from services.extractors import _HAS_DOCX, _HAS_PYMUPDF, EXTRACTORS, LABELS, docx, fitz
+from services.file_extract import read_text
+
+SECTIONS = ("Profile", "Experience", "Education", "Skills", "Projects")
+BUDGET = 200_000
+
+
+def _cv_lines(rng: random.Random, pages: int) -> List[str]:
+    lines = ["Alex Example", "alex@example.com | 07700 900000 | London"]
+    for _ in range(pages):
+        for section in SECTIONS:
+            lines.append("")
+            lines.append(section.upper())
+            for _ in range(rng.randint(4, 7)):
+                verb = rng.choice(("Built", "Led", "Improved", "Designed", "Supported", "Worked on"))
+                lines.append(f"• {verb} " + " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 16))))
+    return lines
+
+
+def make_corpus(folder: Path, cvs: int, seed: int = 0) -> List[Path]:
+    rng = random.Random(seed)
+    paths: List[Path] = []
+    for i in range(cvs):
+        lines = _cv_lines(rng, pages=1 + i % 3)
+
+        txt = folder / f"cv_{i:03d}.txt"
+        txt.write_text("\n".join(lines), encoding="utf-8")
+        paths.append(txt)
+
+        if _HAS_DOCX:
+            d = docx.Document()
+            for line in lines:
+                d.add_paragraph(line)
+            path = folder / f"cv_{i:03d}.docx"
+            d.save(str(path))
+            paths.append(path)
+
+        if _HAS_PYMUPDF:
+            doc = fitz.open()
+            per_page = 48
+            for p in range(0, len(lines), per_page):
+                page = doc.new_page()
+                page.insert_text((56, 64), "\n".join(lines[p:p + per_page]), fontsize=10)
+            path = folder / f"cv_{i:03d}.pdf"
+            doc.save(str(path))
+            doc.close()
+            paths.append(path)
+    return paths
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--cvs", type=int, default=30)
+    ap.add_argument("--repeats", type=int, default=3)
+    ap.add_argument("--corpus", type=Path, default=None)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.corpus:
+            corpus = sorted(p for p in args.corpus.iterdir() if p.suffix.lower() in LABELS)
+        else:
+            corpus = make_corpus(Path(tmp), args.cvs)
+
+        by_ext: Dict[str, List[Path]] = {}
+        for path in corpus:
+            by_ext.setdefault(path.suffix.lower(), []).append(path)
+
+        print(f"{len(corpus)} documents, best of {args.repeats} per document")
+        print(f"  {'ext':<6}{'backend':<13}{'docs':>5}{'MB/s':>9}{'docs/s':>9}{'chars/ms':>10}"
+              f"{'mean ms':>9}{'p95 ms':>8}")
+        for ext, paths in sorted(by_ext.items()):
+            size_mb = sum(p.stat().st_size for p in paths) / 2**20
+            for backend in EXTRACTORS.backends(ext, available_only=False):
+                if not backend.available:
+                    print(f"  {ext:<6}{backend.name:<13}  (not installed)")
+                    continue
+                times: List[float] = []
+                chars = 0
+                for path in paths:
+                    best = float("inf")
+                    for _ in range(args.repeats):
+                        t0 = time.perf_counter()
+                        part = read_text(str(path), BUDGET, max_pages=None, backend=backend.name)
+                        best = min(best, time.perf_counter() - t0)
+                    chars += len(part.text)
+                    times.append(best * 1000)
+                total_s = sum(times) / 1000
+                p95 = sorted(times)[max(0, int(len(times) * 0.95) - 1)]
+                print(f"  {ext:<6}{backend.name:<13}{len(paths):>5}{size_mb / total_s:>9.1f}"
+                      f"{len(paths) / total_s:>9.0f}{chars / (total_s * 1000):>10.0f}"
+                      f"{statistics.mean(times):>9.2f}{p95:>8.2f}")
+
+        print("\nchain order now:", {ext: [b.name for b in EXTRACTORS.chain(ext)] for ext in sorted(by_ext)})
+
+
+if __name__ == "__main__":
+    main()
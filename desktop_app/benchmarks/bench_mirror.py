@@ -0,0 +1,96 @@
+# benchmarks/bench_mirror.py
+"""
+Memory mirror vs plain on-disk reads: startup cost (CareerDB() + enable_mirror)
+and per-call latency of the page read paths, plus the extra cost on writes.
+
+Run from desktop_app/:
+    python -m benchmarks.bench_mirror [--jobs 20000 ...] [--iterations 300]
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from dataclasses import fields
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from benchmarks.bench_careerdb import _time
+from benchmarks.synthetic import Volumes, seed
+from services.db import CareerDB
+
+
+def _read_cases(db: CareerDB) -> List[Tuple[str, Callable[[int], object]]]:
+    return [
+        ("list_job_cards[10]", lambda i: db.list_job_cards(limit=10)),
+        ("list_jobs_page", lambda i: db.list_jobs_page(page_size=40)),
+        ("get_job", lambda i: db.get_job(i % 1000 + 1)),
+        ("job_status_counts", lambda i: db.job_status_counts()),
+        ("job_weekly_stats", lambda i: db.job_weekly_stats()),
+        ("list_reminders_between[month]", lambda i: db.list_reminders_between("2025-03-01", "2025-04-01")),
+        ("list_files_page", lambda i: db.list_files_page(page_size=60)),
+        ("list_note_items_page[search]", lambda i: db.list_note_items_page("python", page_size=50)),
+        ("ai_get_messages_page", lambda i: db.ai_get_messages_page(1)),
+        ("ai_list_memories", lambda i: db.ai_list_memories()),
+        ("get_all_jobs", lambda i: db.get_all_jobs()),
+    ]
+
+
+def _write_cases(db: CareerDB) -> List[Tuple[str, Callable[[int], object]]]:
+    return [
+        ("add_job", lambda i: db.add_job(f"Bench {i}", "Role", "Applied")),
+        ("update_job_status", lambda i: db.update_job_status(i % 1000 + 1, ("Applied", "Offer")[i % 2])),
+    ]
+
+
+def _startup(path: Path, mirror: bool) -> float:
+    t0 = time.perf_counter()
+    db = CareerDB(path)
+    if mirror:
+        db.enable_mirror()
+    elapsed = time.perf_counter() - t0
+    db.close()
+    return elapsed
+
+
+def run(volumes: Volumes, iterations: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench.db"
+        db = CareerDB(path)
+        seed(db, volumes)
+        db.close()
+        size_mb = path.stat().st_size / 2**20
+        print(f"seeded {volumes.as_dict()} ({size_mb:.1f} MB)")
+
+        disk_s = min(_startup(path, False) for _ in range(3))
+        mirror_s = min(_startup(path, True) for _ in range(3))
+        print(f"startup: disk {disk_s * 1000:.1f} ms   mirror {mirror_s * 1000:.1f} ms")
+
+        results: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for mode in ("disk", "mirror"):
+            db = CareerDB(path)
+            if mode == "mirror" and not db.enable_mirror():
+                print("mirror not enabled (over ceiling)")
+                db.close()
+                return
+            for label, fn in _read_cases(db) + _write_cases(db):
+                n = min(iterations, 30) if label == "get_all_jobs" else iterations
+                results.setdefault(label, {})[mode] = _time(fn, n)
+            db.close()
+
+        print(f"  {'method':<32}{'disk p50':>10}{'p95':>9}{'mirror p50':>12}{'p95':>9}{'speedup':>9}")
+        for label, r in results.items():
+            d, m = r["disk"], r["mirror"]
+            print(
+                f"  {label:<32}{d['p50_us']:>10.1f}{d['p95_us']:>9.1f}"
+                f"{m['p50_us']:>12.1f}{m['p95_us']:>9.1f}{d['p50_us'] / m['p50_us']:>8.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    for f in fields(Volumes):
+        ap.add_argument(f"--{f.name}", type=int, default=f.default)
+    ap.add_argument("--iterations", type=int, default=300)
+    args = ap.parse_args()
+    run(Volumes(**{f.name: getattr(args, f.name) for f in fields(Volumes)}), args.iterations)
@@ -0,0 +1,95 @@
+# benchmarks/bench_rows.py
+"""
+Memory and build time of job rows held by a page: the old shape (plain
+tuples copied into a per-page dataclass, as ui_qt/tracker.py used to do)
+vs the services/rows.py NamedTuples CareerDB now returns.
+
+Run from desktop_app/:
+    python -m benchmarks.bench_rows [--rows 50000]
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+from benchmarks.synthetic import Volumes, seed
+from services.db import CareerDB
+from services.rows import JobCard, row_factory
+
+SQL = "SELECT id, company, role, status, date_added FROM jobs ORDER BY date_added DESC"
+
+
+@dataclass
+class Job:
+    """The page-level copy ui_qt/tracker.py built from each tuple."""
+    id: int
+    company: str
+    role: str
+    status: str
+    date_added: str
+
+
+def _tuples_plus_dataclass(db: CareerDB) -> List[Job]:
+    with db._read() as conn:
+        rows = conn.execute(SQL).fetchall()
+    return [Job(job_id, company, role, status, date_added or "")
+            for job_id, company, role, status, date_added in rows]
+
+
+def _tuples(db: CareerDB) -> List[Tuple]:
+    with db._read() as conn:
+        return conn.execute(SQL).fetchall()
+
+
+def _named_rows(db: CareerDB) -> List[JobCard]:
+    with db._read() as conn:
+        cur = conn.cursor()
+        cur.row_factory = row_factory(JobCard)
+        return cur.execute(SQL).fetchall()
+
+
+def _measure(fn: Callable[[CareerDB], list], db: CareerDB, repeats: int = 5) -> Tuple[float, float, float]:
+    """(retained MiB, peak MiB, best build ms); strings are shared by all shapes."""
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn(db)
+        best = min(best, time.perf_counter() - t0)
+    gc.collect()
+    tracemalloc.start()
+    held = fn(db)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return retained / 2**20, peak / 2**20, best * 1000
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=50_000)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = CareerDB(Path(tmp) / "rows.db")
+        seed(db, Volumes(jobs=args.rows, reminders=0, files=0, conversations=0,
+                         messages=0, memories=0, notes=0))
+        print(f"{args.rows} job rows")
+        print(f"  {'shape':<28}{'retained MiB':>14}{'peak MiB':>10}{'build ms':>10}")
+        for label, fn in (
+            ("tuples + dataclass copy", _tuples_plus_dataclass),
+            ("tuples only", _tuples),
+            ("NamedTuple row_factory", _named_rows),
+        ):
+            retained, peak, ms = _measure(fn, db)
+            print(f"  {label:<28}{retained:>14.2f}{peak:>10.2f}{ms:>10.1f}")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
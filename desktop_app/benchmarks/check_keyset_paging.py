@@ -0,0 +1,120 @@
+# benchmarks/check_keyset_paging.py
+"""
+Walks every keyset-paged listing to the end over rows with NULL / empty /
+malformed sort columns (old databases have them) and fails if a page walk
+drops or repeats a row, or orders rows differently from the old in-memory
+sorts of the tracker and file vault.
+
+Run from desktop_app/:
+    python -m benchmarks.check_keyset_paging
+"""
+from __future__ import annotations
+
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List
+
+from services.db import CareerDB, Page
+
+PAGE_SIZE = 2
+
+
+def walk(fetch: Callable[..., Page], **kwargs) -> List[tuple]:
+    rows: List[tuple] = []
+    key = None
+    while True:
+        page, key = fetch(after_key=key, page_size=PAGE_SIZE, **kwargs)
+        rows += page
+        if key is None:
+            return rows
+
+
+# the file vault's sort keys before it paged in SQL
+def _safe_date_key(s) -> datetime:
+    try:
+        return datetime.strptime(s, "%Y-%m-%d")
+    except Exception:
+        return datetime.min
+
+
+def _category_key(cat) -> str:
+    c = (cat or "").strip()
+    if c.lower() in ("cv/resume", "cv_resume", "cv-resume", "cv/resumé"):
+        return "cv"
+    return c.lower()
+
+
+FILE_SORTS = {
+    "newest": (lambda r: _safe_date_key(r.date_added), True),
+    "oldest": (lambda r: _safe_date_key(r.date_added), False),
+    "name": (lambda r: (r.original_name or "").lower(), False),
+    "name_desc": (lambda r: (r.original_name or "").lower(), True),
+    "category": (lambda r: _category_key(r.category), False),
+}
+
+
+def _seed(db: CareerDB) -> None:
+    with db._conn() as conn:
+        for i, date in enumerate(["2026-01-03", "2026-01-01", "2026-01-02", None, None, None, None]):
+            conn.execute(
+                "INSERT INTO jobs(company, role, status, link, notes, date_added) VALUES (?, ?, ?, '', '', ?)",
+                (f"Company {i}", "Role", "Applied" if i % 2 else "Interview", date),
+            )
+        files = [
+            ("a.pdf", "Alpha.pdf", "CV", "2026-01-02"),
+            ("b.pdf", None, "CV/Resume", None),
+            ("c.pdf", "beta.pdf", None, "2026-01-05"),
+            ("d.pdf", "Gamma.pdf", " Cover Letter ", "not a date"),
+            ("e.pdf", "delta.pdf", "cv_resume", ""),
+            ("f.pdf", "Epsilon.pdf", "Portfolio", None),
+            ("g.pdf", "zeta.pdf", "cover letter", "2026-01-01"),
+        ]
+        conn.executemany(
+            "INSERT INTO files(filename, original_name, category, date_added) VALUES (?, ?, ?, ?)",
+            files,
+        )
+
+
+def _check(label: str, got: List[tuple], expected: List[tuple], key=None) -> int:
+    ids = [r[0] for r in got]
+    problems = []
+    if sorted(ids) != sorted(r[0] for r in expected):
+        problems.append(f"rows {sorted(ids)} != {sorted(r[0] for r in expected)}")
+    elif key is not None and [key(r) for r in got] != [key(r) for r in expected]:
+        problems.append(f"order {[key(r) for r in got]} != {[key(r) for r in expected]}")
+    print(f"[{'ok  ' if not problems else 'FAIL'}] {label}")
+    for p in problems:
+        print(f"         {p}")
+    return bool(problems)
+
+
+def run() -> int:
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        db = CareerDB(Path(tmp) / "paging.db")
+        _seed(db)
+
+        cards = db.list_job_cards()
+        failures += _check("list_jobs_page", walk(db.list_jobs_page), cards, key=lambda r: r[0])
+        for status in ("Applied", "Interview"):
+            expected = [c for c in cards if c.status == status]
+            failures += _check(
+                f"list_jobs_page({status})", walk(db.list_jobs_page, status=status), expected,
+                key=lambda r: r[0],
+            )
+
+        files = db.list_files()
+        for order, (sort_key, descending) in FILE_SORTS.items():
+            expected = sorted(files, key=sort_key, reverse=descending)
+            failures += _check(
+                f"list_files_page({order})", walk(db.list_files_page, order=order), expected,
+                key=sort_key,
+            )
+        db.close()
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if run() else 0)
@@ -0,0 +1,170 @@
+# benchmarks/check_query_plans.py
+"""
+Runs EXPLAIN QUERY PLAN for the hot CareerDB / page queries against a freshly
+migrated database and fails if any of them falls back to a full table scan
+or a temp b-tree sort.
+
+Run from desktop_app/:
+    python -m benchmarks.check_query_plans
+"""
+from __future__ import annotations
+
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+from typing import List, Tuple
+
+from services.db import CareerDB
+from services.migrations import FILE_CATEGORY_KEY, FILE_DATE_KEY, FILE_NAME_KEY, JOB_DATE_KEY
+
+# (label, sql, params)
+HOT_QUERIES: List[Tuple[str, str, tuple]] = [
+    (
+        "get_all_jobs",
+        f"SELECT id, company, role, status, notes, date_added FROM jobs ORDER BY {JOB_DATE_KEY} DESC, id DESC",
+        (),
+    ),
+    (
+        "list_job_cards",
+        f"SELECT id, company, role, status, date_added FROM jobs ORDER BY {JOB_DATE_KEY} DESC, id DESC LIMIT ?",
+        (-1,),
+    ),
+    (
+        "list_jobs_page",
+        f"SELECT id, company, role, status, date_added, {JOB_DATE_KEY} AS _page_key FROM jobs "
+        f"WHERE {JOB_DATE_KEY} <= ? AND ({JOB_DATE_KEY}, id) < (?, ?) "
+        f"ORDER BY {JOB_DATE_KEY} DESC, id DESC LIMIT ?",
+        ("2026-01-01", "2026-01-01", 100, 41),
+    ),
+    (
+        "list_jobs_page(status)",
+        f"SELECT id, company, role, status, date_added, {JOB_DATE_KEY} AS _page_key FROM jobs "
+        f"WHERE status=? AND {JOB_DATE_KEY} <= ? AND ({JOB_DATE_KEY}, id) < (?, ?) "
+        f"ORDER BY {JOB_DATE_KEY} DESC, id DESC LIMIT ?",
+        ("Applied", "2026-01-01", "2026-01-01", 100, 41),
+    ),
+    (
+        "list_files_page(name)",
+        f"SELECT id, filename, original_name, category, date_added, {FILE_NAME_KEY} AS _page_key "
+        f"FROM files WHERE {FILE_NAME_KEY} >= ? AND ({FILE_NAME_KEY}, id) > (?, ?) "
+        f"ORDER BY {FILE_NAME_KEY} ASC, id ASC LIMIT ?",
+        ("cv", "cv", 10, 61),
+    ),
+    (
+        "list_files_page(newest)",
+        f"SELECT id, filename, original_name, category, date_added, {FILE_DATE_KEY} AS _page_key "
+        f"FROM files WHERE {FILE_DATE_KEY} <= ? AND ({FILE_DATE_KEY}, id) < (?, ?) "
+        f"ORDER BY {FILE_DATE_KEY} DESC, id DESC LIMIT ?",
+        ("2026-01-01", "2026-01-01", 10, 61),
+    ),
+    (
+        "list_files_page(category)",
+        f"SELECT id, filename, original_name, category, date_added, {FILE_CATEGORY_KEY} AS _page_key "
+        f"FROM files WHERE {FILE_CATEGORY_KEY} >= ? AND ({FILE_CATEGORY_KEY}, id) > (?, ?) "
+        f"ORDER BY {FILE_CATEGORY_KEY} ASC, id ASC LIMIT ?",
+        ("cv", "cv", 10, 61),
+    ),
+    (
+        "list_note_items_page",
+        "SELECT id, title, updated_at, updated_at AS _page_key FROM note_items "
+        "WHERE updated_at <= ? AND (updated_at, id) < (?, ?) ORDER BY updated_at DESC, id DESC LIMIT ?",
+        ("2026-01-01", "2026-01-01", 10, 51),
+    ),
+    (
+        "ai_get_messages_page",
+        "SELECT id, role, content, ts, id AS _page_key FROM ai_messages "
+        "WHERE conversation_id=? AND id < ? ORDER BY id DESC LIMIT ?",
+        (1, 500, 41),
+    ),
+    (
+        "get_jobs_by_status",
+        f"SELECT id, company, role, status, notes, date_added FROM jobs WHERE status=? "
+        f"ORDER BY {JOB_DATE_KEY} DESC, id DESC",
+        ("Applied",),
+    ),
+    (
+        "file_categories",
+        "SELECT DISTINCT category FROM files",
+        (),
+    ),
+    (
+        "list_files(category)",
+        "SELECT id, filename, original_name, category, date_added FROM files WHERE category=? ORDER BY date_added DESC",
+        ("CV",),
+    ),
+    (
+        "list_reminders_for_date",
+        "SELECT id, title, description, date, time, category FROM reminders WHERE date = ? ORDER BY time",
+        ("2026-01-01",),
+    ),
+    (
+        "list_reminders_between",
+        "SELECT id, title, description, date, time, category FROM reminders "
+        "WHERE due_at >= ? AND due_at < ? ORDER BY due_at",
+        ("2026-01-01", "2026-02-15"),
+    ),
+    (
+        "list_upcoming_reminders",
+        "SELECT id, title, description, date, time, category FROM reminders "
+        "WHERE due_at >= ? ORDER BY due_at LIMIT ?",
+        ("2026-01-01 09:00", 15),
+    ),
+    (
+        "next_due_reminder",
+        "SELECT id, title, description, date, time, category FROM reminders "
+        "WHERE due_at >= ? AND notified = 0 ORDER BY due_at LIMIT 1",
+        ("2026-01-01 09:00",),
+    ),
+    (
+        "ai_get_messages",
+        "SELECT role, content, ts FROM ai_messages WHERE conversation_id=? ORDER BY id DESC LIMIT ?",
+        (1, 30),
+    ),
+    (
+        "ai_list_memories",
+        "SELECT id, ts, type, content, importance, pinned FROM ai_memories "
+        "ORDER BY pinned DESC, importance DESC, id DESC LIMIT ?",
+        (200,),
+    ),
+    (
+        "ai_get_latest_summary",
+        "SELECT summary_text FROM ai_summaries WHERE scope=? ORDER BY id DESC LIMIT 1",
+        ("global",),
+    ),
+]
+
+
+def plan_problems(conn: sqlite3.Connection, sql: str, params: tuple) -> List[str]:
+    rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    details = [str(r[-1]) for r in rows]
+    problems = []
+    for d in details:
+        if d.startswith("SCAN") and "USING" not in d:
+            problems.append(d)
+        if "TEMP B-TREE" in d:
+            problems.append(d)
+    if not any("USING" in d and "INDEX" in d for d in details):
+        problems.append("no index used: " + " | ".join(details))
+    return problems
+
+
+def run(queries: List[Tuple[str, str, tuple]] = HOT_QUERIES) -> int:
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        db = CareerDB(Path(tmp) / "plans.db")
+        with db._conn() as conn:
+            conn.execute("ANALYZE")
+            for label, sql, params in queries:
+                problems = plan_problems(conn, sql, params)
+                status = "ok  " if not problems else "FAIL"
+                print(f"[{status}] {label}")
+                for p in problems:
+                    print(f"         {p}")
+                failures += bool(problems)
+        db.close()
+    return failures
+
+
+if __name__ == "__main__":
+    sys.exit(1 if run() else 0)
@@ -0,0 +1,175 @@
+# benchmarks/stress_multiprocess.py
+"""
+Both frontends writing to one career_buddy.db at the same time, from
+separate processes, the way the Tk app (+ tray thread) and the Qt app do.
+
+Each "tk" process runs the CustomTkinter write paths on its main thread and
+a tray/notifier thread beside it; each "qt" process runs the Qt write paths
+on a DB worker thread while its GUI thread keeps reading pages. Reports ops,
+errors and write-lock waits per process; exits 1 if any write failed or the
+database fails integrity_check.
+
+Run from desktop_app/:
+    python -m benchmarks.stress_multiprocess [--seconds 10] [--procs 2]
+    python -m benchmarks.stress_multiprocess --attempts 1   # no retry: see what breaks
+"""
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import sqlite3
+import tempfile
+import threading
+import time
+from dataclasses import asdict
+from pathlib import Path
+from random import Random
+from typing import Callable, Dict, List, Tuple
+
+from benchmarks.synthetic import Volumes, seed
+from services.db import CareerDB
+from services.db_locking import RetryPolicy
+
+STRESS_VOLUMES = Volumes(jobs=2000, reminders=500, files=200, conversations=20,
+                         messages=2000, memories=200, notes=50)
+
+Op = Tuple[str, Callable[[Random], object]]
+
+
+def _tk_ops(db: CareerDB) -> List[Op]:
+    return [
+        ("add_job", lambda r: db.add_job("Stress Co", "Tk role", "To Apply", "", "", "2031-01-01")),
+        ("update_job_status", lambda r: db.update_job_status(r.randrange(1, 2000), r.choice(("Applied", "Interviewing")))),
+        ("edit_job", lambda r: db.edit_job(r.randrange(1, 2000), "Edited Co", "Edited role", "Offer", "notes")),
+        ("add_reminder", lambda r: db.add_reminder("Stress", "tk", "2031-01-02", "09:00", "Other")),
+        ("save_notes", lambda r: db.save_notes(f"notes {r.random()}")),
+        ("journal.log", lambda r: db.journal.log("tk stress")),
+    ]
+
+
+def _tray_ops(db: CareerDB) -> List[Op]:
+    # notifier loop: poll the next reminder, mark it as notified
+    return [
+        ("next_due_reminder", lambda r: db.next_due_reminder()),
+        ("mark_notified", lambda r: db.mark_notified(r.randrange(1, 500))),
+    ]
+
+
+def _qt_worker_ops(db: CareerDB) -> List[Op]:
+    cid = db.ai_create_conversation("stress")
+    return [
+        ("update_job_status", lambda r: db.update_job_status(r.randrange(1, 2000), r.choice(("Offer", "Rejected")))),
+        ("ai_add_message", lambda r: db.ai_add_message(cid, "user", "stress message")),
+        ("ai_set_summary", lambda r: db.ai_set_summary("global", f"summary {r.random()}")),
+        ("add_files_many", lambda r: db.add_files_many([("s.pdf", "s.pdf", "Other", "2031-01-01")] * 5)),
+        ("journal.flush", lambda r: db.journal.flush()),
+    ]
+
+
+def _qt_gui_ops(db: CareerDB) -> List[Op]:
+    return [
+        ("list_jobs_page", lambda r: db.list_jobs_page(page_size=40)),
+        ("job_status_counts", lambda r: db.job_status_counts()),
+        ("list_reminders_between", lambda r: db.list_reminders_between("2025-03-01", "2025-04-01")),
+    ]
+
+
+def _loop(ops: List[Op], deadline: float, rng: Random, out: Dict) -> None:
+    while time.perf_counter() < deadline:
+        name, fn = rng.choice(ops)
+        started = time.perf_counter()
+        try:
+            fn(rng)
+        except sqlite3.Error as e:
+            out["errors"].append(f"{name}: {e}")
+        else:
+            out["ops"] += 1
+        out["latencies"].append(time.perf_counter() - started)
+
+
+def _frontend(role: str, index: int, db_path: str, seconds: float, attempts: int, results) -> None:
+    db = CareerDB(Path(db_path), RetryPolicy(attempts=attempts))
+    rng = Random(index)
+    deadline = time.perf_counter() + seconds
+    main_out: Dict = {"ops": 0, "errors": [], "latencies": []}
+    side_out: Dict = {"ops": 0, "errors": [], "latencies": []}
+    if role == "tk":
+        main_ops, side_ops = _tk_ops(db), _tray_ops(db)
+    else:
+        # GUI thread reads; writes go through the single DB worker (for_db)
+        main_ops, side_ops = _qt_gui_ops(db), _qt_worker_ops(db)
+
+    def _side() -> None:
+        try:
+            _loop(side_ops, deadline, Random(index + 1000), side_out)
+        finally:
+            db.close_thread()
+
+    side = threading.Thread(target=_side)
+    side.start()
+    _loop(main_ops, deadline, rng, main_out)
+    side.join()
+    try:
+        db.close()
+    except sqlite3.Error as e:
+        main_out["errors"].append(f"close: {e}")
+
+    latencies = sorted(main_out["latencies"] + side_out["latencies"]) or [0.0]
+    results.put({
+        "name": f"{role}{index}",
+        "ops": main_out["ops"] + side_out["ops"],
+        "errors": main_out["errors"] + side_out["errors"],
+        "p50_ms": 1000 * latencies[len(latencies) // 2],
+        "p99_ms": 1000 * latencies[int(len(latencies) * 0.99)],
+        "max_ms": 1000 * latencies[-1],
+        "locks": asdict(db.lock_metrics()),
+    })
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Multi-process write stress test for CareerDB.")
+    ap.add_argument("--seconds", type=float, default=10.0)
+    ap.add_argument("--procs", type=int, default=2, help="processes per frontend")
+    ap.add_argument("--attempts", type=int, default=RetryPolicy().attempts,
+                    help="BEGIN IMMEDIATE attempts per write (1 = no retry)")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "stress.db"
+        db = CareerDB(path)
+        seed(db, STRESS_VOLUMES)
+        db.close()
+
+        ctx = mp.get_context("spawn")  # separate interpreters, like two apps
+        results = ctx.Queue()
+        procs = [
+            ctx.Process(target=_frontend, args=(role, i, str(path), args.seconds, args.attempts, results))
+            for i in range(args.procs)
+            for role in ("tk", "qt")
+        ]
+        for p in procs:
+            p.start()
+        rows = [results.get() for _ in procs]
+        for p in procs:
+            p.join()
+
+        conn = sqlite3.connect(str(path))
+        integrity = conn.execute("PRAGMA integrity_check").fetchone()[0]
+        conn.close()
+
+    print(f"{'process':<8} {'ops':>7} {'errors':>7} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}"
+          f" {'writes':>7} {'waited':>7} {'retries':>7} {'max wait ms':>11}")
+    for r in sorted(rows, key=lambda r: r["name"]):
+        lk = r["locks"]
+        print(f"{r['name']:<8} {r['ops']:>7} {len(r['errors']):>7} {r['p50_ms']:>8.2f} {r['p99_ms']:>8.2f}"
+              f" {r['max_ms']:>8.1f} {lk['acquisitions']:>7} {lk['contended']:>7} {lk['retries']:>7}"
+              f" {1000 * lk['max_wait_s']:>11.1f}")
+    errors = [e for r in rows for e in r["errors"]]
+    for e in sorted(set(errors))[:10]:
+        print("  error:", e)
+    print(f"integrity_check: {integrity}")
+    raise SystemExit(1 if errors or integrity != "ok" else 0)
+
+
+if __name__ == "__main__":
+    main()
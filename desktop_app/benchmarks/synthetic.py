@@ -0,0 +1,115 @@
+# benchmarks/synthetic.py
+"""
+Synthetic CareerDB data at configurable volumes, for the benchmarks.
+
+    from benchmarks.synthetic import Volumes, seed
+    seed(CareerDB(path), Volumes(jobs=20_000))
+
+Everything is generated from a seeded Random, so two runs with the same
+volumes and seed produce the same database.
+"""
+from __future__ import annotations
+
+import random
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+from typing import Dict
+
+from services.db import CareerDB
+
+STATUSES = ("To Apply", "Applied", "Interviewing", "Offer", "Rejected")
+STATUS_WEIGHTS = (30, 40, 15, 5, 10)
+FILE_CATEGORIES = ("CV", "Cover Letter", "Certificate", "Other")
+REMINDER_CATEGORIES = ("Interview", "Deadline", "Assessment", "Networking", "Other")
+MEMORY_TYPES = ("fact", "preference", "goal", "skill")
+WORDS = (
+    "python data analyst backend frontend cloud platform team remote hybrid "
+    "senior junior graduate intern product design research sales ops security"
+).split()
+
+START = date(2024, 1, 1)
+SPAN_DAYS = 900
+
+
+@dataclass(frozen=True)
+class Volumes:
+    jobs: int = 20_000
+    reminders: int = 5_000
+    files: int = 2_000
+    conversations: int = 200
+    messages: int = 100_000  # spread evenly over the conversations
+    memories: int = 5_000
+    notes: int = 1_000
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def _day(rng: random.Random) -> str:
+    return (START + timedelta(days=rng.randrange(SPAN_DAYS))).isoformat()
+
+
+def seed(db: CareerDB, volumes: Volumes = Volumes(), rng_seed: int = 0) -> None:
+    """Fill `db` (normally fresh and empty) through the bulk APIs."""
+    rng = random.Random(rng_seed)
+
+    db.add_jobs_many(
+        (
+            f"Company {i}",
+            _text(rng, 2).title(),
+            rng.choices(STATUSES, STATUS_WEIGHTS)[0],
+            f"https://jobs.example.com/{i}",
+            _text(rng, rng.randrange(5, 80)),
+            _day(rng),
+        )
+        for i in range(volumes.jobs)
+    )
+
+    db.add_reminders_many(
+        (
+            f"Reminder {i}",
+            _text(rng, 8),
+            _day(rng),
+            f"{rng.randrange(8, 19):02d}:{rng.choice((0, 15, 30, 45)):02d}",
+            rng.choice(REMINDER_CATEGORIES),
+        )
+        for i in range(volumes.reminders)
+    )
+
+    db.add_files_many(
+        (f"stored_{i}.pdf", f"{_text(rng, 2)} {i}.pdf", rng.choice(FILE_CATEGORIES), _day(rng))
+        for i in range(volumes.files)
+    )
+
+    if volumes.conversations:
+        per_conv, extra = divmod(volumes.messages, volumes.conversations)
+        for c in range(volumes.conversations):
+            cid = db.ai_create_conversation(f"Chat {c}")
+            n = per_conv + (1 if c < extra else 0)
+            db.ai_add_messages_many(
+                cid,
+                (("user" if m % 2 == 0 else "assistant", _text(rng, rng.randrange(5, 60))) for m in range(n)),
+            )
+
+    # no bulk API for memories / note items: seed them in one transaction each
+    with db._conn() as conn:
+        conn.executemany(
+            "INSERT INTO ai_memories (ts, type, content, importance, pinned) VALUES (?, ?, ?, ?, ?)",
+            (
+                (_day(rng) + " 12:00:00", rng.choice(MEMORY_TYPES), _text(rng, 12),
+                 rng.randrange(1, 11), int(rng.random() < 0.05))
+                for _ in range(volumes.memories)
+            ),
+        )
+        conn.executemany(
+            "INSERT INTO note_items (title, content, updated_at) VALUES (?, ?, ?)",
+            (
+                (f"Note {i} {_text(rng, 2)}", _text(rng, rng.randrange(20, 400)), _day(rng) + " 09:00:00")
+                for i in range(volumes.notes)
+            ),
+        )
+    db.journal.flush()
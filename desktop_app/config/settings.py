@@ -1,42 +1,51 @@
 # careerbuddy/config/settings.py
-import sqlite3
+import atexit
+import threading
 from pathlib import Path
 from typing import Optional
 
+from services.settings_store import Setting, SettingsStore
+
 # The DB lives one level **above** the package (next to the repo root)
 DB_PATH = Path(__file__).resolve().parents[2] / "career_buddy.db"
 
-def _conn():
-    return sqlite3.connect(DB_PATH)
+# Known settings (typed; stored as TEXT in the `settings` table)
+GEMINI_API_KEY: Setting[Optional[str]] = Setting("gemini_api_key", None)
+THEME_MODE: Setting[str] = Setting("theme_mode", "Dark")
+# Serve reads from an in-memory copy of the db (CareerDB.enable_mirror), up to N MB
+MEMORY_MIRROR: Setting[bool] = Setting("memory_mirror", False, parse=lambda v: v == "1", dump=lambda b: "1" if b else "0")
+MEMORY_MIRROR_MAX_MB: Setting[int] = Setting("memory_mirror_max_mb", 256, parse=int)
+
+_store: Optional[SettingsStore] = None
+_store_lock = threading.Lock()
+
+
+def init(db) -> SettingsStore:
+    """Back the settings with the app's CareerDB (call once at startup)."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = SettingsStore(db)
+            atexit.register(_store.close)
+        return _store
+
+
+def store() -> SettingsStore:
+    """The shared store; opens its own CareerDB (running migrations) if init() wasn't called."""
+    if _store is None:
+        from services.db import CareerDB
+        return init(CareerDB(DB_PATH))
+    return _store
+
 
 def get_api_key() -> Optional[str]:
-    with _conn() as conn:
-        cur = conn.cursor()
-        cur.execute("SELECT value FROM settings WHERE key='gemini_api_key'")
-        row = cur.fetchone()
-        return row[0] if row else None
+    return store().get(GEMINI_API_KEY)
 
 def save_api_key(key: str) -> None:
-    with _conn() as conn:
-        cur = conn.cursor()
-        cur.execute(
-            "INSERT OR REPLACE INTO settings (key, value) VALUES ('gemini_api_key', ?)",
-            (key,),
-        )
-        conn.commit()
+    store().set(GEMINI_API_KEY, key)
 
 def get_theme_mode() -> str:
-    with _conn() as conn:
-        cur = conn.cursor()
-        cur.execute("SELECT value FROM settings WHERE key='theme_mode'")
-        row = cur.fetchone()
-        return row[0] if row else "Dark"
+    return store().get(THEME_MODE)
 
 def save_theme_mode(mode: str) -> None:
-    with _conn() as conn:
-        cur = conn.cursor()
-        cur.execute(
-            "INSERT OR REPLACE INTO settings (key, value) VALUES ('theme_mode', ?)",
-            (mode,),
-        )
-        conn.commit()
+    store().set(THEME_MODE, mode)
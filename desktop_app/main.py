@@ -1,4 +1,5 @@
 import logging
+import multiprocessing
 import os
 import json
 import time
@@ -8,7 +9,9 @@ import customtkinter as ctk
 from PIL import Image
 import pystray
 
+from services import extract_pool
 from services.db import CareerDB
+from config import settings
 from config.theme import get as theme
 
 from ui.tracker import JobTrackerFrame
@@ -33,8 +36,9 @@ def _setup_logging() -> None:
 def main() -> None:
     _setup_logging()
     db = CareerDB()
+    settings.init(db)
 
-    ctk.set_appearance_mode("Dark")
+    ctk.set_appearance_mode(settings.get_theme_mode())
     ctk.set_default_color_theme("dark-blue")
 
     root = ctk.CTk()
@@ -262,8 +266,12 @@ def main() -> None:
 
     logging.info("CareerBuddy UI started")
     root.mainloop()
+    settings.store().close()  # flush pending write-behind settings
+    extract_pool.shutdown_all()  # stop the document parser processes
+    db.close()
     logging.info("CareerBuddy UI closed")
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # document parser processes in frozen builds
     main()
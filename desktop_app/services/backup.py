@@ -0,0 +1,450 @@
+# services/backup.py
+"""
+Online backup / verified restore of career_buddy.db + the file vault.
+
+Layout under the backup root (default: career_buddy_backups/ next to the db):
+
+    career_buddy-YYYYmmdd-HHMMSS.zip   db snapshot + manifest.json (deflated)
+    objects/ab/ab12...ef.gz            vault files, content-addressed (sha256)
+    index.json                         path/size/mtime -> sha256 cache
+
+The db is copied with VACUUM INTO: one read transaction, so under WAL
+writers carry on meanwhile and the copy is a consistent snapshot that never
+restarts (the page-stepping backup API started over after every write, and
+the activity journal writes every second). Vault files are hashed (re-hashed
+only when size or mtime changed) and stored once per distinct content: a
+backup only copies new or changed files. Everything streams in 1 MiB chunks on a
+background thread.
+
+    python -m services.backup backup|list
+    python -m services.backup verify  ARCHIVE [--deep]
+    python -m services.backup restore ARCHIVE [--db PATH] [--vault DIR]
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+import zipfile
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+MANIFEST_NAME = "manifest.json"
+DB_ARCNAME = "career_buddy.db"
+FORMAT_VERSION = 1
+CHUNK = 1024 * 1024
+
+# already compressed: gzip would only burn CPU
+_STORED_EXTS = {".pdf", ".png", ".jpg", ".jpeg", ".gif", ".webp", ".zip", ".docx", ".xlsx", ".pptx", ".mp4", ".gz"}
+
+Progress = Callable[[str, int, int], None]  # (stage, done, total)
+
+
+class BackupError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class BackupReport:
+    archive: Path
+    db_bytes: int
+    files: int
+    files_copied: int
+    bytes_copied: int
+    seconds: float
+
+
+@dataclass(frozen=True)
+class RestoreReport:
+    db_restored: bool
+    files_restored: int
+    files_unchanged: int
+
+
+def _sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _integrity_ok(db_file: Path) -> bool:
+    conn = sqlite3.connect(str(db_file))
+    try:
+        return conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+    finally:
+        conn.close()
+
+
+class BackupManager:
+    def __init__(
+        self,
+        db_path: Path,
+        vault_dir: Path,
+        backup_root: Optional[Path] = None,
+        pages_per_step: int = 256,
+    ):
+        self.db_path = Path(db_path)
+        self.vault_dir = Path(vault_dir)
+        self.backup_root = Path(backup_root) if backup_root else self.db_path.parent / "career_buddy_backups"
+        self.pages_per_step = pages_per_step
+        self._running = threading.Lock()
+
+    @property
+    def objects_dir(self) -> Path:
+        return self.backup_root / "objects"
+
+    def _object_path(self, sha: str) -> Path:
+        return self.objects_dir / sha[:2] / f"{sha}.gz"
+
+    # --------------------------------------------------------------
+    def start_backup(
+        self,
+        on_done: Callable[[Optional[BackupReport], Optional[Exception]], None],
+        progress: Optional[Progress] = None,
+    ) -> bool:
+        """Run backup() on a background thread; False if one is already running."""
+        if not self._running.acquire(blocking=False):
+            return False
+
+        def _run() -> None:
+            try:
+                report = self._backup(progress)
+            except Exception as e:
+                print("Backup error:", e)
+                on_done(None, e)
+            else:
+                on_done(report, None)
+            finally:
+                self._running.release()
+
+        threading.Thread(target=_run, name="backup", daemon=True).start()
+        return True
+
+    def backup(self, progress: Optional[Progress] = None) -> BackupReport:
+        with self._running:
+            return self._backup(progress)
+
+    def _backup(self, progress: Optional[Progress]) -> BackupReport:
+        started = time.perf_counter()
+        self.backup_root.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        archive = self.backup_root / f"career_buddy-{stamp}.zip"
+
+        with tempfile.TemporaryDirectory(dir=self.backup_root) as tmp:
+            snapshot = Path(tmp) / DB_ARCNAME
+            self._snapshot_db(snapshot, progress)
+            db_sha = _sha256_file(snapshot)
+            conn = sqlite3.connect(str(snapshot))
+            try:
+                schema = conn.execute("PRAGMA user_version").fetchone()[0]
+            finally:
+                conn.close()
+
+            files, copied, copied_bytes = self._backup_vault(progress)
+
+            manifest = {
+                "format": FORMAT_VERSION,
+                "created": datetime.now().isoformat(timespec="seconds"),
+                "schema_version": schema,
+                "db": {"name": DB_ARCNAME, "size": snapshot.stat().st_size, "sha256": db_sha},
+                "vault": {"root": self.vault_dir.name, "files": files},
+            }
+            partial = Path(tmp) / archive.name
+            with zipfile.ZipFile(partial, "w", compression=zipfile.ZIP_DEFLATED, allowZip64=True) as zf:
+                zf.write(snapshot, DB_ARCNAME)
+                zf.writestr(MANIFEST_NAME, json.dumps(manifest, indent=2))
+            os.replace(partial, archive)
+
+        return BackupReport(
+            archive=archive,
+            db_bytes=manifest["db"]["size"],
+            files=len(files),
+            files_copied=copied,
+            bytes_copied=copied_bytes,
+            seconds=time.perf_counter() - started,
+        )
+
+    def _snapshot_db(self, target: Path, progress: Optional[Progress]) -> None:
+        if progress:
+            progress("database", 0, 1)
+        src = sqlite3.connect(str(self.db_path), timeout=30)
+        try:
+            # also compacts the copy: free pages are not written out
+            src.execute("VACUUM INTO ?", (str(target),))
+        finally:
+            src.close()
+        if progress:
+            progress("database", 1, 1)
+
+    # --------------------------------------------------------------
+    def _load_index(self) -> Dict[str, List]:
+        try:
+            return json.loads((self.backup_root / "index.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self, index: Dict[str, List]) -> None:
+        path = self.backup_root / "index.json"
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(index), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def _backup_vault(self, progress: Optional[Progress]) -> Tuple[List[Dict], int, int]:
+        if not self.vault_dir.is_dir():
+            return [], 0, 0
+        paths = sorted(p for p in self.vault_dir.rglob("*") if p.is_file())
+        old_index = self._load_index()
+        index: Dict[str, List] = {}
+        files: List[Dict] = []
+        copied = copied_bytes = 0
+
+        for n, path in enumerate(paths, 1):
+            rel = path.relative_to(self.vault_dir).as_posix()
+            st = path.stat()
+            cached = old_index.get(rel)
+            if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+                sha = cached[2]
+            else:
+                sha = _sha256_file(path)
+            index[rel] = [st.st_size, st.st_mtime_ns, sha]
+            files.append({"path": rel, "size": st.st_size, "sha256": sha})
+
+            obj = self._object_path(sha)
+            if not obj.exists():
+                self._store_object(path, obj)
+                copied += 1
+                copied_bytes += st.st_size
+            if progress:
+                progress("vault", n, len(paths))
+
+        self._save_index(index)
+        return files, copied, copied_bytes
+
+    def _store_object(self, src: Path, obj: Path) -> None:
+        obj.parent.mkdir(parents=True, exist_ok=True)
+        level = 0 if src.suffix.lower() in _STORED_EXTS else 6
+        tmp = obj.with_suffix(".partial")
+        with open(src, "rb") as fin, gzip.open(tmp, "wb", compresslevel=level) as fout:
+            shutil.copyfileobj(fin, fout, CHUNK)
+        os.replace(tmp, obj)
+
+    # --------------------------------------------------------------
+    def list_archives(self) -> List[Path]:
+        return sorted(self.backup_root.glob("career_buddy-*.zip"))
+
+    @staticmethod
+    def read_manifest(archive: Path) -> Dict:
+        with zipfile.ZipFile(archive) as zf:
+            return json.loads(zf.read(MANIFEST_NAME))
+
+    def verify(self, archive: Path, deep: bool = False) -> List[str]:
+        """
+        Problems found (empty = good): zip CRCs, db hash + integrity_check,
+        vault objects present (deep=True also re-hashes every object).
+        """
+        problems: List[str] = []
+        try:
+            manifest = self.read_manifest(archive)
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+            return [f"unreadable archive: {e}"]
+        if manifest.get("format") != FORMAT_VERSION:
+            problems.append(f"unknown format {manifest.get('format')}")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            try:
+                db_file = self._extract_db(archive, manifest, Path(tmp))
+            except BackupError as e:
+                problems.append(str(e))
+            else:
+                if not _integrity_ok(db_file):
+                    problems.append("database failed integrity_check")
+
+        for f in manifest.get("vault", {}).get("files", []):
+            obj = self._object_path(f["sha256"])
+            if not obj.exists():
+                problems.append(f"missing object for {f['path']}")
+            elif deep:
+                try:
+                    ok = self._object_sha(obj) == f["sha256"]
+                except (OSError, EOFError, zlib.error):
+                    ok = False
+                if not ok:
+                    problems.append(f"corrupt object for {f['path']}")
+        return problems
+
+    def _object_sha(self, obj: Path) -> str:
+        h = hashlib.sha256()
+        with gzip.open(obj, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK), b""):
+                h.update(chunk)
+        return h.hexdigest()
+
+    def _extract_db(self, archive: Path, manifest: Dict, into: Path) -> Path:
+        target = into / DB_ARCNAME
+        with zipfile.ZipFile(archive) as zf:
+            try:
+                with zf.open(manifest["db"]["name"]) as fin, open(target, "wb") as fout:
+                    shutil.copyfileobj(fin, fout, CHUNK)
+            except (KeyError, zipfile.BadZipFile) as e:  # CRC errors surface as BadZipFile
+                raise BackupError(f"database missing or damaged in archive: {e}")
+        if _sha256_file(target) != manifest["db"]["sha256"]:
+            raise BackupError("database checksum mismatch")
+        return target
+
+    # --------------------------------------------------------------
+    def restore(
+        self,
+        archive: Path,
+        db_path: Optional[Path] = None,
+        vault_dir: Optional[Path] = None,
+        progress: Optional[Progress] = None,
+        db=None,
+    ) -> RestoreReport:
+        """
+        Verify, then restore the db (online, through the backup API, so open
+        connections see the restored content) and every vault file whose
+        content differs. Files not in the backup are left alone.
+
+        The archived db is brought up to the current schema before it goes
+        live (archives from a newer CareerBuddy are refused). Its path ->
+        content hash map for the extraction cache is dropped (vault files are
+        rewritten below), and every table_versions counter is moved past both
+        the old and the archived value, so page refreshes (DataVersions) and
+        memory mirrors in every open process see the change. Pass the open
+        CareerDB as `db` to flush its journal first and reload its mirror now.
+        """
+        problems = self.verify(archive)
+        if problems:
+            raise BackupError("archive failed verification: " + "; ".join(problems))
+        manifest = self.read_manifest(archive)
+        db_path = Path(db_path or self.db_path)
+        vault_dir = Path(vault_dir or self.vault_dir)
+
+        if db is not None:
+            # pending job events belong to the data being replaced
+            db.journal.flush()
+        with tempfile.TemporaryDirectory() as tmp:
+            restored = self._extract_db(archive, manifest, Path(tmp))
+            self._prepare_restore(restored, db_path)
+            if progress:
+                progress("database", 0, 1)
+            src = sqlite3.connect(str(restored))
+            dst = sqlite3.connect(str(db_path), timeout=30)
+            try:
+                src.backup(dst, pages=self.pages_per_step)
+            finally:
+                dst.close()
+                src.close()
+            if progress:
+                progress("database", 1, 1)
+        if db is not None and db.mirror is not None:
+            db._resync_mirror(db.mirror)
+
+        files = manifest.get("vault", {}).get("files", [])
+        written = unchanged = 0
+        for n, f in enumerate(files, 1):
+            target = vault_dir / f["path"]
+            if target.is_file() and target.stat().st_size == f["size"] and _sha256_file(target) == f["sha256"]:
+                unchanged += 1
+            else:
+                self._restore_object(self._object_path(f["sha256"]), target, f["sha256"])
+                written += 1
+            if progress:
+                progress("vault", n, len(files))
+        return RestoreReport(True, written, unchanged)
+
+    @staticmethod
+    def _prepare_restore(restored: Path, live: Path) -> None:
+        """Migrate the extracted db and reset its derived state before it replaces `live`."""
+        from services.migrations import LATEST_VERSION, migrate, schema_version
+
+        old_versions: Dict[str, int] = {}
+        if live.exists():
+            conn = sqlite3.connect(str(live), timeout=30)
+            try:
+                old_versions = dict(conn.execute("SELECT name, version FROM table_versions").fetchall())
+            except sqlite3.OperationalError:
+                pass  # pre-v3 db
+            finally:
+                conn.close()
+
+        conn = sqlite3.connect(str(restored))
+        try:
+            version = schema_version(conn)
+            if version > LATEST_VERSION:
+                raise BackupError(
+                    f"archive has schema v{version}, newer than this CareerBuddy (v{LATEST_VERSION}); update first"
+                )
+            migrate(conn)
+            with conn:
+                conn.execute("DELETE FROM extraction_paths")
+                names = [r[0] for r in conn.execute("SELECT name FROM table_versions").fetchall()]
+                conn.executemany(
+                    "UPDATE table_versions SET version = MAX(version, ?) + 1 WHERE name = ?",
+                    [(old_versions.get(name, 0), name) for name in names],
+                )
+        finally:
+            conn.close()
+
+    def _restore_object(self, obj: Path, target: Path, sha: str) -> None:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(target.name + ".restoring")
+        h = hashlib.sha256()
+        try:
+            with gzip.open(obj, "rb") as fin, open(tmp, "wb") as fout:
+                for chunk in iter(lambda: fin.read(CHUNK), b""):
+                    h.update(chunk)
+                    fout.write(chunk)
+        except (EOFError, zlib.error, gzip.BadGzipFile):
+            h = hashlib.sha256(b"corrupt")
+        if h.hexdigest() != sha:
+            tmp.unlink()
+            raise BackupError(f"object for {target.name} is corrupt")
+        os.replace(tmp, target)
+
+
+def main() -> None:
+    from services.db import DB_FILE
+
+    default_vault = Path(__file__).resolve().parents[1] / "career_buddy_files"
+    ap = argparse.ArgumentParser(description="Back up / verify / restore CareerBuddy data.")
+    ap.add_argument("command", choices=("backup", "list", "verify", "restore"))
+    ap.add_argument("archive", nargs="?", type=Path)
+    ap.add_argument("--db", type=Path, default=DB_FILE)
+    ap.add_argument("--vault", type=Path, default=default_vault)
+    ap.add_argument("--root", type=Path, help="backup directory")
+    ap.add_argument("--deep", action="store_true", help="verify: re-hash every vault object")
+    args = ap.parse_args()
+
+    mgr = BackupManager(args.db, args.vault, args.root)
+    if args.command == "backup":
+        r = mgr.backup()
+        print(f"{r.archive}: {r.files} files ({r.files_copied} new, {r.bytes_copied // 1024} KiB) in {r.seconds:.1f}s")
+    elif args.command == "list":
+        for a in mgr.list_archives():
+            print(a.name)
+    elif args.archive is None:
+        ap.error(f"{args.command} needs an ARCHIVE")
+    elif args.command == "verify":
+        problems = mgr.verify(args.archive, deep=args.deep)
+        print("\n".join(problems) if problems else "OK")
+        raise SystemExit(1 if problems else 0)
+    else:
+        r = mgr.restore(args.archive, args.db, args.vault)
+        print(f"restored database; {r.files_restored} files written, {r.files_unchanged} unchanged")
+
+
+if __name__ == "__main__":
+    main()
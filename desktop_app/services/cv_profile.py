@@ -0,0 +1,240 @@
+# services/cv_profile.py
+from __future__ import annotations
+
+import json
+import re
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+# Bump when analyze_cv() changes: stored profiles from other versions are ignored.
+ANALYZER_VERSION = 1
+
+MAIN_SECTIONS = ("summary", "experience", "education", "skills", "projects")
+
+SECTION_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "summary": ("profile", "summary", "professional summary", "personal statement", "personal profile",
+                "about me", "objective", "career objective", "career summary"),
+    "experience": ("experience", "work experience", "professional experience", "relevant experience",
+                   "employment", "employment history", "work history", "career history"),
+    "education": ("education", "education and training", "qualifications", "academic background",
+                  "academic qualifications"),
+    "skills": ("skills", "technical skills", "key skills", "core skills", "skills and tools",
+               "core competencies", "competencies", "technologies"),
+    "projects": ("projects", "personal projects", "selected projects", "key projects", "portfolio"),
+}
+# other headings that end the previous section; kept under their own name
+OTHER_HEADINGS = ("certifications", "certificates", "awards", "achievements", "publications",
+                  "languages", "interests", "hobbies", "volunteering", "leadership",
+                  "activities", "courses", "training", "references", "additional information")
+_HEADINGS = {alias: name for name, aliases in SECTION_ALIASES.items() for alias in aliases}
+_HEADINGS.update({h: h for h in OTHER_HEADINGS})
+
+ACTION_VERBS = ("built", "developed", "designed", "led", "implemented", "deployed",
+                "improved", "reduced", "increased", "achieved")
+
+_BULLET = re.compile(r"^\s*(?:[•\-\*▪◦●·–]|\d+[.)])\s*")
+_TERM = re.compile(r"[a-z][a-z\+\#\-]{2,}")
+
+
+def normalize_spaces(s: str) -> str:
+    s = s.replace("\r\n", "\n").replace("\r", "\n")
+    s = re.sub(r"[ \t]+", " ", s)
+    s = re.sub(r"\n{3,}", "\n\n", s)
+    return s.strip()
+
+
+def extract_keywords(text: str) -> List[str]:
+    text = text.lower()
+    # pull “skill-like” words; keep it simple and predictable
+    raw = _TERM.findall(text)
+    stop = {
+        "the","and","with","that","this","from","your","you","for","are","our","role",
+        "will","have","has","was","were","into","over","within","using","use","used",
+        "able","work","team","teams","skills","skill","experience","experiences",
+        "job","company","position","developer","engineer","data"
+    }
+    out = []
+    for w in raw:
+        if w in stop:
+            continue
+        if len(w) > 22:
+            continue
+        out.append(w)
+    # de-dup preserving order
+    seen = set()
+    uniq = []
+    for w in out:
+        if w not in seen:
+            seen.add(w)
+            uniq.append(w)
+    return uniq[:60]
+
+
+@dataclass(frozen=True)
+class CVProfile:
+    """
+    A CV split once into sections, for prompts and the cover letter.
+
+    `sections` maps a MAIN_SECTIONS or OTHER_HEADINGS name to its text, in
+    document order; lines before the first heading are the `header`.
+    `achievements` are the lines with an action verb, bullet marks removed.
+    `terms` is every skill-like word in the CV, for keyword matching.
+    """
+    content_hash: str
+    header: str
+    sections: Dict[str, str]
+    achievements: Tuple[str, ...]
+    terms: FrozenSet[str]
+
+    def section(self, name: str) -> str:
+        return self.sections.get(name, "")
+
+    @property
+    def looks_like_cv(self) -> bool:
+        return sum(1 for name in MAIN_SECTIONS[1:] if self.sections.get(name)) >= 3
+
+    def context(self, names: Sequence[str], max_chars: int = 6_000) -> str:
+        """
+        The requested sections (plus "achievements") as prompt text, each
+        clipped to an equal share of `max_chars`.
+        """
+        parts: List[Tuple[str, str]] = []
+        for name in names:
+            if name == "achievements":
+                if self.achievements:
+                    parts.append(("KEY ACHIEVEMENTS", "\n".join(f"- {a}" for a in self.achievements[:8])))
+            elif self.sections.get(name):
+                parts.append((name.upper(), self.sections[name]))
+        share = max(200, (max_chars - len(self.header)) // max(1, len(parts)))
+        out = [self.header] if self.header else []
+        for title, text in parts:
+            if len(text) > share:
+                text = text[:share].rstrip() + " […]"
+            out.append(f"{title}:\n{text}")
+        return "\n\n".join(out)
+
+    def to_json(self) -> str:
+        return json.dumps({
+            "header": self.header,
+            "sections": self.sections,
+            "achievements": list(self.achievements),
+            "terms": sorted(self.terms),
+        })
+
+    @classmethod
+    def from_json(cls, content_hash: str, raw: str) -> "CVProfile":
+        d = json.loads(raw)
+        return cls(content_hash, d["header"], d["sections"], tuple(d["achievements"]), frozenset(d["terms"]))
+
+
+_ALIASES_LONGEST_FIRST = sorted(_HEADINGS, key=len, reverse=True)
+
+
+def _heading(line: str) -> Optional[str]:
+    s = line.strip().rstrip(":").strip()
+    if not s or len(s) > 40:
+        return None
+    key = re.sub(r"\s+", " ", re.sub(r"[^a-z& ]", " ", s.lower()).replace("&", " and ")).strip()
+    if key in _HEADINGS:
+        return _HEADINGS[key]
+    # "Technical Skills & Tools", "WORK EXPERIENCE AND INTERNSHIPS:" - only for lines
+    # styled as headings, so "Experience with Python" stays content
+    words = s.split()
+    styled = s.isupper() or line.rstrip().endswith(":") or all(w[0].isupper() for w in words if len(w) > 3)
+    if styled and len(words) <= 5:
+        for alias in _ALIASES_LONGEST_FIRST:
+            if key.startswith(alias + " "):
+                return _HEADINGS[alias]
+    return None
+
+
+def analyze_cv(text: str, content_hash: str = "") -> CVProfile:
+    """Split CV text into header, sections, achievements and terms (pure, ~1 ms per page)."""
+    text = normalize_spaces(text)
+    header: List[str] = []
+    sections: Dict[str, List[str]] = {}
+    current: Optional[str] = None
+    achievements: List[str] = []
+
+    for raw in text.split("\n"):
+        line = raw.strip()
+        name = _heading(line)
+        if name is not None:
+            current = name
+            sections.setdefault(name, [])
+            continue
+        if not line:
+            continue
+        (sections[current] if current is not None else header).append(line)
+        if any(v in line.lower() for v in ACTION_VERBS):
+            achievements.append(_BULLET.sub("", line))
+
+    return CVProfile(
+        content_hash=content_hash,
+        header="\n".join(header[:6]),
+        sections={name: "\n".join(lines) for name, lines in sections.items() if lines},
+        achievements=tuple(achievements[:20]),
+        terms=frozenset(_TERM.findall(text.lower())),
+    )
+
+
+# What a question needs from the CV; None means the whole text.
+_QUERY_SECTIONS: Tuple[Tuple[Tuple[str, ...], Tuple[str, ...]], ...] = (
+    (("skill", "stack", "tech", "tool"), ("skills",)),
+    (("educat", "degree", "universit", "school", "qualification", "grade"), ("education",)),
+    (("project", "portfolio", "github"), ("projects", "achievements")),
+    (("experience", "job", "role", "work", "career", "achiev", "interview"), ("experience", "achievements")),
+    (("cover letter", "motivation", "why"), ("summary", "achievements", "skills")),
+)
+_FULL_TEXT_WORDS = ("review", "proofread", "rewrite", "improve", "feedback", "format", "typo", "grammar",
+                    "full cv", "whole cv", "entire cv", "full resume")
+
+
+def sections_for(query: str) -> Optional[Tuple[str, ...]]:
+    """Sections a question about the CV needs, or None when it needs the full text."""
+    q = query.lower()
+    if any(w in q for w in _FULL_TEXT_WORDS):
+        return None
+    names: List[str] = ["summary"]
+    for words, wanted in _QUERY_SECTIONS:
+        if any(w in q for w in words):
+            names += [n for n in wanted if n not in names]
+    if len(names) == 1:
+        names += ["skills", "experience", "achievements"]  # general question
+    return tuple(names)
+
+
+class CVProfileStore:
+    """
+    CV profiles in career_buddy.db (migration v12), keyed by the file's
+    content hash (services/extract_cache.py), so each CV is analysed once.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self._lock = threading.Lock()
+        self._pruned = False
+
+    def profile(self, content_hash: str, text: str) -> CVProfile:
+        """Stored profile for `content_hash`, analysing `text` the first time."""
+        with self.db._read() as conn:
+            row = conn.execute(
+                "SELECT profile FROM cv_profiles WHERE content_hash=? AND analyzer_version=?",
+                (content_hash, ANALYZER_VERSION),
+            ).fetchone()
+        if row is not None:
+            return CVProfile.from_json(content_hash, row[0])
+
+        profile = analyze_cv(text, content_hash)
+        with self.db._conn() as conn:
+            with self._lock:
+                if not self._pruned:
+                    conn.execute("DELETE FROM cv_profiles WHERE analyzer_version != ?", (ANALYZER_VERSION,))
+                    self._pruned = True
+            conn.execute(
+                "INSERT OR REPLACE INTO cv_profiles (content_hash, analyzer_version, profile, created_at) VALUES (?, ?, ?, ?)",
+                (content_hash, ANALYZER_VERSION, profile.to_json(), datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+            )
+        return profile
@@ -0,0 +1,77 @@
+# services/data_version.py
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Tuple
+
+
+class DataVersions:
+    """
+    Cheap "did anything I read change?" checks, across processes.
+
+    Two layers:
+    - PRAGMA data_version on a private, never-writing connection: it changes
+      whenever ANY other connection (pooled CareerDB threads, the Tk app,
+      another process) commits. Unchanged => nothing changed anywhere, no query.
+    - table_versions (migration v3): trigger-maintained per-table counters,
+      read only when data_version moved, to tell WHICH tables changed.
+
+    A consumer (e.g. a page key) asks should_refresh(consumer, tables);
+    the answer is True only if one of its tables changed since it last refreshed.
+    """
+
+    def __init__(self, db_path: Path):
+        # Private connection: its own commits would not bump its data_version,
+        # so it must never write.
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._lock = threading.Lock()
+        self._data_version = -1
+        self._versions: Dict[str, int] = {}
+        self._seen: Dict[str, Dict[str, int]] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    # --------------------------------------------------------------
+    def current(self) -> Dict[str, int]:
+        """Latest per-table counters (re-read only if data_version moved)."""
+        with self._lock:
+            dv = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if dv != self._data_version:
+                self._versions = dict(
+                    self._conn.execute("SELECT name, version FROM table_versions").fetchall()
+                )
+                self._data_version = dv
+            return self._versions
+
+    def _snapshot(self, tables: Iterable[str]) -> Dict[str, int]:
+        versions = self.current()
+        return {t: versions.get(t, 0) for t in tables}
+
+    def mark_fresh(self, consumer: str, tables: Iterable[str]) -> None:
+        """Record that `consumer` has just (re)loaded `tables`."""
+        self._seen[consumer] = self._snapshot(tables)
+
+    def should_refresh(self, consumer: str, tables: Iterable[str]) -> bool:
+        snap = self._snapshot(tables)
+        stale = self._seen.get(consumer) != snap
+        if stale:
+            self._seen[consumer] = snap
+
+        s = self._stats.setdefault(consumer, {"performed": 0, "skipped": 0})
+        s["performed" if stale else "skipped"] += 1
+        return stale
+
+    # --------------------------------------------------------------
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {k: dict(v) for k, v in self._stats.items()}
+
+    def totals(self) -> Tuple[int, int]:
+        """(performed, skipped) across all consumers."""
+        performed = sum(s["performed"] for s in self._stats.values())
+        skipped = sum(s["skipped"] for s in self._stats.values())
+        return performed, skipped
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
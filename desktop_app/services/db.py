@@ -1,109 +1,274 @@
 # careerbuddy/services/db.py
-import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from datetime import datetime
-from typing import List, Tuple, Optional
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from services import events
+from services.data_version import DataVersions
+from services.db_locking import LockMetrics, RetryPolicy, WriteLock
+from services.db_pool import READ_PRAGMAS, WRITE_PRAGMAS, ConnectionPool
+from services.journal import ActivityJournal
+from services.mirror import MemoryMirror, RecordingConnection
+from services.migrations import (
+    FILE_CATEGORY_KEY, FILE_DATE_KEY, FILE_NAME_KEY, JOB_DATE_KEY, migrate,
+)
+from services.rollups import STAT_COLUMNS
+from services.rows import (
+    ConversationRow, FileRow, JobCard, JobRow, MemoryRow, Message, MessageRow,
+    NoteListing, ReminderRow, StatRow, row_factory,
+)
 
 DB_FILE = Path(__file__).resolve().parents[2] / "career_buddy.db"
 
+# Default memory ceiling for enable_mirror()
+MIRROR_MAX_BYTES = 256 * 1024 * 1024
+
+# Keyset cursor: (sort value, id) of the last row of the previous page.
+PageKey = Tuple[Any, int]
+Page = Tuple[List[Any], Optional[PageKey]]
+
+
+def _created_ts(date_added: str) -> str:
+    """
+    job_events timestamp for a job's creation: its date_added (at midnight, as
+    the v8 backfill does), or the current time for a job added today.
+    """
+    now = datetime.now()
+    if date_added == now.strftime("%Y-%m-%d"):
+        return now.strftime("%Y-%m-%d %H:%M:%S")
+    return date_added if len(date_added) > 10 else f"{date_added} 00:00:00"
+
 
 class CareerDB:
     """Typed, context-managed CRUD layer."""
-    def __init__(self, db_path: Path = DB_FILE):
+    def __init__(self, db_path: Path = DB_FILE, retry: RetryPolicy = RetryPolicy()):
         self.db_path = db_path
+        # Two connection roles per thread: writers (BEGIN IMMEDIATE + retry)
+        # and query_only readers, which never queue behind the write lock.
+        self._pool = ConnectionPool(db_path, WRITE_PRAGMAS)
+        self._read_pool = ConnectionPool(db_path, READ_PRAGMAS)
+        self._write_lock = WriteLock(retry)
+        # Change events are published after the write has committed.
+        self.events = events.EventBus()
+        # Optional read mirror (enable_mirror)
+        self.mirror: Optional[MemoryMirror] = None
+        self._mirror_lock = threading.Lock()
+        self._mirror_commit_lock = threading.Lock()
+        self._mirror_pending = 0     # write transactions not yet replayed
+        self._mirror_writes = 0
+        self._mirror_resyncing = False
         self._init_schema()
+        # Cross-process "what changed" counters (needs the v3 schema)
+        self.versions = DataVersions(db_path)
+        # Write-behind job_events / activity appends
+        self.journal = ActivityJournal(self)
 
     # --------------------------------------------------------------
-    from contextlib import contextmanager
-
     @contextmanager
     def _conn(self):
-        conn = sqlite3.connect(self.db_path)
+        """
+        Borrow this thread's pooled write connection, in a write transaction.
+        The write lock is taken up front (BEGIN IMMEDIATE, retried with jitter
+        while another connection/process holds it; see services/db_locking.py).
+        Commits on success, rolls back on error; the connection stays open.
+        With the memory mirror enabled, committed writes are replayed into it.
+        """
+        conn = self._pool.get()
+        if not conn.in_transaction:
+            self._write_lock.begin(conn)
+        mirror = self.mirror
+        if mirror is None:
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+            return
+
+        # mirror mode: record writes, replay them once the disk commit succeeded
+        log = []
+
+        def _commit() -> None:
+            # commit + replay under one lock so the mirror sees commits in disk order
+            # (ids are re-assigned on replay and must come out the same)
+            with self._mirror_commit_lock:
+                conn.commit()
+                if log:
+                    self._mirror_apply(mirror, list(log))
+                    log.clear()
+
+        with self._mirror_lock:
+            self._mirror_pending += 1
         try:
-            yield conn
-            conn.commit()
+            yield RecordingConnection(conn, log, _commit)
+            _commit()
+        except BaseException:
+            conn.rollback()
+            raise
         finally:
-            conn.close()
+            with self._mirror_lock:
+                self._mirror_pending -= 1
+
+    @contextmanager
+    def _read(self):
+        """
+        Connection for read-only queries: the memory mirror when it is enabled
+        and in step with the disk db, otherwise this thread's query_only
+        connection (never waits for writers under WAL).
+        """
+        mirror = self.mirror
+        if mirror is not None and mirror.ready:
+            if self.versions.current() == mirror.versions:
+                with mirror.read() as conn:
+                    yield conn
+                return
+            if self._mirror_pending == 0:
+                # nothing of ours in flight: another process wrote to the db
+                self._resync_mirror(mirror)
+        yield self._read_pool.get()
+
+    def close_thread(self) -> None:
+        """Close the calling thread's pooled connections (end of a worker thread)."""
+        self._pool.close_thread()
+        self._read_pool.close_thread()
+
+    def close(self) -> None:
+        """Flush the journal and close every pooled connection (call on app shutdown)."""
+        self.journal.close()
+        self.disable_mirror()
+        self.versions.close()
+        self._read_pool.close_all()
+        self._pool.close_all()
+
+    def lock_metrics(self) -> LockMetrics:
+        """Write-lock waits/retries/failures of this CareerDB since it was opened."""
+        return self._write_lock.metrics()
+
+    # --------------------------------------------------------------
+    def enable_mirror(self, max_bytes: int = MIRROR_MAX_BYTES) -> bool:
+        """
+        Serve reads from an in-memory copy of the db (see services/mirror.py).
+        False if the db is larger than `max_bytes`; reads then stay on disk.
+        """
+        mirror = MemoryMirror(self.db_path, max_bytes)
+        if not mirror.load():
+            return False
+        self.mirror = mirror
+        return True
+
+    def disable_mirror(self) -> None:
+        mirror, self.mirror = self.mirror, None
+        if mirror is not None:
+            mirror.close()
+
+    def _mirror_apply(self, mirror: MemoryMirror, log) -> None:
+        if not mirror.apply(log):
+            self._resync_mirror(mirror)
+            return
+        self._mirror_writes += 1
+        if self._mirror_writes % 100 == 0 and mirror.size_bytes() > mirror.max_bytes:
+            print("Memory mirror over its ceiling; reading from disk")
+            self.disable_mirror()
+
+    def _resync_mirror(self, mirror: MemoryMirror) -> None:
+        """Reload the mirror in the background; reads use disk until it's ready."""
+        with self._mirror_lock:
+            if self._mirror_resyncing:
+                return
+            self._mirror_resyncing = True
+        mirror.invalidate()
+
+        def _reload() -> None:
+            try:
+                if not mirror.load() and self.mirror is mirror:
+                    self.disable_mirror()
+            except Exception as e:
+                print("Memory mirror reload error:", e)
+            finally:
+                with self._mirror_lock:
+                    self._mirror_resyncing = False
+
+        threading.Thread(target=_reload, name="mirror-reload", daemon=True).start()
 
     # --------------------------------------------------------------
     def _init_schema(self) -> None:
         with self._conn() as conn:
+            migrate(conn, self._write_lock)
             cur = conn.cursor()
-            cur.executescript(
-                """
-                CREATE TABLE IF NOT EXISTS jobs(
-                    id INTEGER PRIMARY KEY,
-                    company TEXT,
-                    role TEXT,
-                    status TEXT,
-                    link TEXT,
-                    notes TEXT,
-                    date_added TEXT
-                );
-                CREATE TABLE IF NOT EXISTS notes(
-                    id INTEGER PRIMARY KEY,
-                    content TEXT
-                );
-                CREATE TABLE IF NOT EXISTS settings(
-                    key TEXT PRIMARY KEY,
-                    value TEXT
-                );
-                CREATE TABLE IF NOT EXISTS files(
-                    id INTEGER PRIMARY KEY,
-                    filename TEXT,
-                    original_name TEXT,
-                    category TEXT,
-                    date_added TEXT
-                );
-                CREATE TABLE IF NOT EXISTS reminders(
-                    id INTEGER PRIMARY KEY,
-                    title TEXT,
-                    description TEXT,
-                    date TEXT,
-                    time TEXT,
-                    category TEXT,
-                    notified INTEGER DEFAULT 0
-                );
-
-                -- ---------------------------
-                -- AI: conversations + memory
-                -- ---------------------------
-                CREATE TABLE IF NOT EXISTS ai_conversations(
-                    id INTEGER PRIMARY KEY,
-                    title TEXT,
-                    created_at TEXT
-                );
-
-                CREATE TABLE IF NOT EXISTS ai_messages(
-                    id INTEGER PRIMARY KEY,
-                    conversation_id INTEGER,
-                    ts TEXT,
-                    role TEXT,
-                    content TEXT,
-                    FOREIGN KEY(conversation_id) REFERENCES ai_conversations(id)
-                );
-
-                CREATE TABLE IF NOT EXISTS ai_memories(
-                    id INTEGER PRIMARY KEY,
-                    ts TEXT,
-                    type TEXT,
-                    content TEXT,
-                    importance INTEGER DEFAULT 5,
-                    pinned INTEGER DEFAULT 0
-                );
-
-                CREATE TABLE IF NOT EXISTS ai_summaries(
-                    id INTEGER PRIMARY KEY,
-                    scope TEXT,
-                    ts TEXT,
-                    summary_text TEXT
-                );
-                """
-            )
             cur.execute("SELECT COUNT(*) FROM notes")
             if cur.fetchone()[0] == 0:
                 cur.execute("INSERT INTO notes (content) VALUES ('')")
 
+    def _insert_many(self, table: str, columns: Sequence[str], rows: List[Tuple]) -> List[int]:
+        """
+        executemany in ONE write transaction; returns the new ids in input order.
+        With the write lock held (_conn() begins IMMEDIATE), INTEGER PRIMARY KEY ids
+        are handed out as MAX(id)+1, +2, ... (executemany can't return rows).
+        """
+        if not rows:
+            return []
+        placeholders = ",".join("?" * len(columns))
+        sql = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+        with self._conn() as conn:
+            first = conn.execute(f"SELECT COALESCE(MAX(id), 0) + 1 FROM {table}").fetchone()[0]
+            conn.executemany(sql, rows)
+            last = conn.execute(f"SELECT MAX(id) FROM {table}").fetchone()[0]
+            if last != first + len(rows) - 1:
+                # ids were not contiguous (e.g. MAX(id) at the rowid limit); look them up
+                cur = conn.execute(f"SELECT id FROM {table} WHERE id >= ? ORDER BY id", (first,))
+                return [r[0] for r in cur.fetchall()]
+        return list(range(first, first + len(rows)))
+
+    def _keyset_page(
+        self,
+        columns: str,
+        table: str,
+        where: Sequence[str],
+        params: Sequence[Any],
+        order: str,
+        descending: bool,
+        after_key: Optional[PageKey],
+        page_size: int,
+        row_type: type = tuple,
+    ) -> Page:
+        """
+        One page of `columns` (the first must be id) from `table`, ordered by
+        (order, id), starting after `after_key`, as `row_type` rows. Returns
+        (rows, next_key); next_key is None on the last page. Cost depends on
+        page_size only, given an index on (order) — the rowid is its implicit tail.
+        `order` must never be NULL: the cursor comparison skips NULL keys.
+        """
+        cmp = "<" if descending else ">"
+        where = list(where)
+        params = list(params)
+        if after_key is not None and order == "id":
+            where.append(f"id {cmp} ?")
+            params.append(after_key[1])
+        elif after_key is not None:
+            # the plain bound lets SQLite seek; the row value breaks ties on id
+            where.append(f"{order} {cmp}= ? AND ({order}, id) {cmp} (?, ?)")
+            params += [after_key[0], after_key[0], after_key[1]]
+        direction = "DESC" if descending else "ASC"
+        order_by = f"{order} {direction}" if order == "id" else f"{order} {direction}, id {direction}"
+        sql = (
+            f"SELECT {columns}, {order} AS _page_key FROM {table}"
+            + (f" WHERE {' AND '.join(where)}" if where else "")
+            + f" ORDER BY {order_by} LIMIT ?"
+        )
+        params.append(int(page_size) + 1)
+
+        with self._read() as conn:
+            rows = conn.execute(sql, params).fetchall()
+
+        more = len(rows) > page_size
+        rows = rows[:page_size]
+        next_key = (rows[-1][-1], rows[-1][0]) if more else None
+        new = tuple.__new__
+        return [new(row_type, r[:-1]) for r in rows], next_key
+
     # --------------------------------------------------------------
     # ----- Jobs ---------------------------------------------------
     def add_job(
@@ -124,36 +289,200 @@ class CareerDB:
                    VALUES (?,?,?,?,?,?)""",
                 (company, role, status, link, notes, date_added),
             )
-            return cur.lastrowid
+            job_id = cur.lastrowid
+        self.journal.record_job_event(job_id, None, status, _created_ts(date_added))
+        self.events.publish(events.JobAdded(job_id))
+        return job_id
+
+    def add_jobs_many(self, jobs: Iterable[Sequence]) -> List[int]:
+        """
+        Bulk add_job: each item is (company, role, status[, link[, notes[, date_added]]]).
+        One transaction, one JobsAdded event; returns the new ids in order.
+        """
+        today = datetime.now().strftime("%Y-%m-%d")
+        rows = []
+        for job in jobs:
+            company, role, status, link, notes, date_added = (tuple(job) + ("", "", None))[:6]
+            rows.append((company, role, status, link or "", notes or "", date_added or today))
+        ids = self._insert_many(
+            "jobs", ("company", "role", "status", "link", "notes", "date_added"), rows
+        )
+        if ids:
+            self.journal.record_job_events(
+                [(job_id, None, row[2], _created_ts(row[5])) for job_id, row in zip(ids, rows)]
+            )
+            self.events.publish(events.JobsAdded(tuple(ids)))
+        return ids
 
-    def get_all_jobs(self) -> List[Tuple]:
-        with self._conn() as conn:
+    def get_job(self, job_id: int) -> Optional[JobRow]:
+        """Same row shape as get_all_jobs, or None."""
+        with self._read() as conn:
             cur = conn.cursor()
+            cur.row_factory = row_factory(JobRow)
             cur.execute(
                 """SELECT id, company, role, status, notes, date_added
-                   FROM jobs ORDER BY date_added DESC"""
+                   FROM jobs WHERE id=?""",
+                (job_id,),
+            )
+            return cur.fetchone()
+
+    # ----- Job card projection (no notes/link) ---------------------
+    def list_job_cards(self, limit: Optional[int] = None) -> List[JobCard]:
+        """(id, company, role, status, date_added), newest first; served by idx_jobs_page_key."""
+        with self._read() as conn:
+            cur = conn.cursor()
+            cur.row_factory = row_factory(JobCard)
+            cur.execute(
+                f"""SELECT id, company, role, status, date_added
+                   FROM jobs ORDER BY {JOB_DATE_KEY} DESC, id DESC LIMIT ?""",
+                (-1 if limit is None else limit,),
             )
             return cur.fetchall()
 
-    def get_jobs_by_status(self, status: str) -> List[Tuple]:
-        with self._conn() as conn:
+    def get_job_card(self, job_id: int) -> Optional[JobCard]:
+        """Same row shape as list_job_cards, or None."""
+        with self._read() as conn:
             cur = conn.cursor()
+            cur.row_factory = row_factory(JobCard)
             cur.execute(
-                """SELECT id, company, role, status, notes, date_added
-                   FROM jobs WHERE status=? ORDER BY date_added DESC""",
+                """SELECT id, company, role, status, date_added
+                   FROM jobs WHERE id=?""",
+                (job_id,),
+            )
+            return cur.fetchone()
+
+    def list_jobs_page(
+        self,
+        status: Optional[str] = None,
+        after_key: Optional[PageKey] = None,
+        page_size: int = 50,
+    ) -> Page:
+        """Keyset page of job cards (list_job_cards shape), newest first."""
+        where, params = ([], []) if status is None else (["status=?"], [status])
+        return self._keyset_page(
+            "id, company, role, status, date_added", "jobs",
+            where, params, JOB_DATE_KEY, True, after_key, page_size, JobCard,
+        )
+
+    def get_job_details(self, job_id: int) -> Optional[Tuple[str, str]]:
+        """(notes, link) for one job, or None; fetched when a job is opened."""
+        with self._read() as conn:
+            cur = conn.cursor()
+            cur.execute("SELECT notes, link FROM jobs WHERE id=?", (job_id,))
+            row = cur.fetchone()
+        if row is None:
+            return None
+        return row[0] or "", row[1] or ""
+
+    def get_all_jobs(self) -> List[JobRow]:
+        with self._read() as conn:
+            cur = conn.cursor()
+            cur.row_factory = row_factory(JobRow)
+            cur.execute(
+                f"""SELECT id, company, role, status, notes, date_added
+                   FROM jobs ORDER BY {JOB_DATE_KEY} DESC, id DESC"""
+            )
+            return cur.fetchall()
+
+    def get_jobs_by_status(self, status: str) -> List[JobRow]:
+        with self._read() as conn:
+            cur = conn.cursor()
+            cur.row_factory = row_factory(JobRow)
+            cur.execute(
+                f"""SELECT id, company, role, status, notes, date_added
+                   FROM jobs WHERE status=? ORDER BY {JOB_DATE_KEY} DESC, id DESC""",
                 (status,),
             )
             return cur.fetchall()
 
+    # ----- Job aggregates (job_status_counts, kept by triggers) ------
+    def job_status_counts(self) -> Dict[str, int]:
+        """{status: number of jobs}; constant time regardless of job count."""
+        with self._read() as conn:
+            cur = conn.cursor()
+            cur.execute("SELECT status, n FROM job_status_counts WHERE n > 0")
+            return dict(cur.fetchall())
+
+    def count_jobs(self) -> int:
+        with self._read() as conn:
+            cur = conn.cursor()
+            cur.execute("SELECT COALESCE(SUM(n), 0) FROM job_status_counts")
+            return int(cur.fetchone()[0])
+
+    def reject_rate(self) -> float:
+        """Share of all jobs currently 'Rejected' (0.0 – 1.0)."""
+        with self._read() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                """SELECT COALESCE(SUM(CASE WHEN status='Rejected' THEN n END), 0),
+                          COALESCE(SUM(n), 0)
+                   FROM job_status_counts"""
+            )
+            rejected, total = cur.fetchone()
+        return (rejected / total) if total else 0.0
+
+    # ----- Job trends (job_daily_stats / job_weekly_stats, kept by triggers)
+    def job_weekly_stats(self, weeks: int = 12, today: Optional[datetime] = None) -> List[StatRow]:
+        """
+        (monday, added, applied, interviews, offers, rejections) for the last
+        `weeks` weeks up to this one, oldest first; weeks without activity are zeros.
+        """
+        today = (today or datetime.now()).date()
+        this_monday = today - timedelta(days=today.weekday())
+        first = this_monday - timedelta(weeks=weeks - 1)
+        with self._read() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                f"""SELECT week, {", ".join(STAT_COLUMNS)} FROM job_weekly_stats
+                   WHERE week >= ? ORDER BY week""",
+                (first.isoformat(),),
+            )
+            found = {r[0]: r for r in cur.fetchall()}
+        zeros = (0,) * len(STAT_COLUMNS)
+        out = []
+        for i in range(weeks):
+            week = (first + timedelta(weeks=i)).isoformat()
+            out.append(StatRow._make(found.get(week, (week,) + zeros)))
+        return out
+
+    def job_monthly_stats(self, months: int = 6, today: Optional[datetime] = None) -> List[StatRow]:
+        """Same as job_weekly_stats per calendar month ("YYYY-MM"), summed from job_daily_stats."""
+        today = (today or datetime.now()).date()
+        ym = today.year * 12 + today.month - 1 - (months - 1)
+        keys = [f"{(ym + i) // 12:04d}-{(ym + i) % 12 + 1:02d}" for i in range(months)]
+        with self._read() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                f"""SELECT substr(day, 1, 7), {", ".join(f"SUM({c})" for c in STAT_COLUMNS)}
+                   FROM job_daily_stats WHERE day >= ? GROUP BY substr(day, 1, 7)""",
+                (keys[0] + "-01",),
+            )
+            found = {r[0]: r for r in cur.fetchall()}
+        zeros = (0,) * len(STAT_COLUMNS)
+        return [StatRow._make(found.get(k, (k,) + zeros)) for k in keys]
+
     def update_job_status(self, job_id: int, new_status: str) -> None:
         with self._conn() as conn:
             cur = conn.cursor()
+            cur.execute("SELECT status FROM jobs WHERE id=?", (job_id,))
+            row = cur.fetchone()
+            if row is None:
+                return
             cur.execute("UPDATE jobs SET status=? WHERE id=?", (new_status, job_id))
+        if row[0] != new_status:
+            self.journal.record_job_event(job_id, row[0], new_status)
+            self.events.publish(events.JobStatusChanged(job_id, row[0], new_status))
 
     def delete_job(self, job_id: int) -> None:
         with self._conn() as conn:
             cur = conn.cursor()
+            cur.execute("SELECT status FROM jobs WHERE id=?", (job_id,))
+            row = cur.fetchone()
+            if row is None:
+                return
             cur.execute("DELETE FROM jobs WHERE id=?", (job_id,))
+        self.journal.record_job_event(job_id, row[0], None)
+        self.events.publish(events.JobDeleted(job_id))
 
     def edit_job(
         self,
@@ -161,22 +490,29 @@ class CareerDB:
         company: str,
         role: str,
         status: str,
-        notes: str,
-        link: str = "",
+        notes: Optional[str],
+        link: Optional[str] = "",
     ) -> None:
+        """notes/link None: keep the stored value."""
         with self._conn() as conn:
             cur = conn.cursor()
+            cur.execute("SELECT status FROM jobs WHERE id=?", (job_id,))
+            row = cur.fetchone()
             cur.execute(
                 """UPDATE jobs
-                   SET company=?, role=?, status=?, notes=?, link=?
+                   SET company=?, role=?, status=?, notes=COALESCE(?, notes), link=COALESCE(?, link)
                    WHERE id=?""",
                 (company, role, status, notes, link, job_id),
             )
+        if row is not None and row[0] != status:
+            self.journal.record_job_event(job_id, row[0], status)
+            self.events.publish(events.JobStatusChanged(job_id, row[0], status))
+        self.events.publish(events.JobUpdated(job_id))
 
     # --------------------------------------------------------------
     # ----- Notes ---------------------------------------------------
     def load_notes(self) -> str:
-        with self._conn() as conn:
+        with self._read() as conn:
             cur = conn.cursor()
             cur.execute("SELECT content FROM notes WHERE id=1")
             row = cur.fetchone()
@@ -186,6 +522,26 @@ class CareerDB:
         with self._conn() as conn:
             cur = conn.cursor()
             cur.execute("UPDATE notes SET content=? WHERE id=1", (content,))
+        self.events.publish(events.NotesSaved())
+
+    # ----- Note items (Notepad page) --------------------------------
+    def list_note_items_page(
+        self,
+        query: str = "",
+        after_key: Optional[PageKey] = None,
+        page_size: int = 50,
+    ) -> Page:
+        """Keyset page of (id, title, updated_at), most recently edited first."""
+        where: List[str] = []
+        params: List[Any] = []
+        if query.strip():
+            like = f"%{query.strip()}%"
+            where.append("(title LIKE ? OR content LIKE ?)")
+            params += [like, like]
+        return self._keyset_page(
+            "id, title, updated_at", "note_items",
+            where, params, "updated_at", True, after_key, page_size, NoteListing,
+        )
 
     # --------------------------------------------------------------
     # ----- Files ---------------------------------------------------
@@ -205,11 +561,26 @@ class CareerDB:
                    VALUES (?,?,?,?)""",
                 (filename, original_name, category, date_added),
             )
-            return cur.lastrowid
-
-    def list_files(self, category: Optional[str] = None) -> List[Tuple]:
-        with self._conn() as conn:
+            file_id = cur.lastrowid
+        self.events.publish(events.FileAdded(file_id))
+        return file_id
+
+    def add_files_many(self, files: Iterable[Sequence]) -> List[int]:
+        """Bulk add_file: each item is (filename, original_name, category[, date_added])."""
+        today = datetime.now().strftime("%Y-%m-%d")
+        rows = []
+        for f in files:
+            filename, original_name, category, date_added = (tuple(f) + (None,))[:4]
+            rows.append((filename, original_name, category, date_added or today))
+        ids = self._insert_many("files", ("filename", "original_name", "category", "date_added"), rows)
+        if ids:
+            self.events.publish(events.FilesAdded(tuple(ids)))
+        return ids
+
+    def list_files(self, category: Optional[str] = None) -> List[FileRow]:
+        with self._read() as conn:
             cur = conn.cursor()
+            cur.row_factory = row_factory(FileRow)
             if category and category != "All":
                 cur.execute(
                     """SELECT id, filename, original_name, category, date_added
@@ -223,13 +594,61 @@ class CareerDB:
                 )
             return cur.fetchall()
 
+    def file_categories(self) -> List[str]:
+        """Distinct stored file categories, as spelled in the table."""
+        with self._read() as conn:
+            return [r[0] for r in conn.execute("SELECT DISTINCT category FROM files").fetchall()]
+
+    # sort name -> (order expression, descending); the keys are never NULL
+    # and each has an index (migration v13)
+    FILE_ORDERS = {
+        "newest": (FILE_DATE_KEY, True),
+        "oldest": (FILE_DATE_KEY, False),
+        "name": (FILE_NAME_KEY, False),
+        "name_desc": (FILE_NAME_KEY, True),
+        "category": (FILE_CATEGORY_KEY, False),
+    }
+
+    def list_files_page(
+        self,
+        categories: Optional[Sequence[str]] = None,
+        order: str = "newest",
+        after_key: Optional[PageKey] = None,
+        page_size: int = 60,
+    ) -> Page:
+        """
+        Keyset page of files (list_files shape). `categories` lists the stored
+        names to match (e.g. a category plus its legacy spellings); None = all.
+        """
+        expr, descending = self.FILE_ORDERS[order]
+        where: List[str] = []
+        params: List[Any] = []
+        if categories:
+            where.append(f"category IN ({','.join('?' * len(categories))})")
+            params += list(categories)
+        return self._keyset_page(
+            "id, filename, original_name, category, date_added", "files",
+            where, params, expr, descending, after_key, page_size, FileRow,
+        )
+
     def delete_file(self, file_id: int) -> None:
         with self._conn() as conn:
             cur = conn.cursor()
             cur.execute("DELETE FROM files WHERE id=?", (file_id,))
+        self.events.publish(events.FileDeleted(file_id))
 
     # --------------------------------------------------------------
     # ----- Reminders -----------------------------------------------
+    @staticmethod
+    def due_at(date: str, time: str) -> str:
+        """Normalised "YYYY-MM-DD HH:MM" sort key (blank time = midnight)."""
+        time = (time or "").strip()
+        if not time:
+            time = "00:00"
+        elif len(time) == 4:
+            time = "0" + time
+        return f"{date} {time[:5]}"
+
     def add_reminder(
         self,
         title: str,
@@ -242,15 +661,31 @@ class CareerDB:
             cur = conn.cursor()
             cur.execute(
                 """INSERT INTO reminders
-                   (title, description, date, time, category)
-                   VALUES (?,?,?,?,?)""",
-                (title, description, date, time, category),
+                   (title, description, date, time, category, due_at)
+                   VALUES (?,?,?,?,?,?)""",
+                (title, description, date, time, category, self.due_at(date, time)),
             )
-            return cur.lastrowid
-
-    def list_reminders_for_date(self, date: str) -> List[Tuple]:
-        with self._conn() as conn:
+            reminder_id = cur.lastrowid
+        self.events.publish(events.ReminderAdded(reminder_id))
+        return reminder_id
+
+    def add_reminders_many(self, reminders: Iterable[Sequence]) -> List[int]:
+        """Bulk add_reminder: each item is (title, description, date, time, category)."""
+        rows = [
+            (title, description, date, time, category, self.due_at(date, time))
+            for title, description, date, time, category in reminders
+        ]
+        ids = self._insert_many(
+            "reminders", ("title", "description", "date", "time", "category", "due_at"), rows
+        )
+        if ids:
+            self.events.publish(events.RemindersAdded(tuple(ids)))
+        return ids
+
+    def list_reminders_for_date(self, date: str) -> List[ReminderRow]:
+        with self._read() as conn:
             cur = conn.cursor()
+            cur.row_factory = row_factory(ReminderRow)
             cur.execute(
                 """SELECT id, title, description, date, time, category
                 FROM reminders
@@ -260,6 +695,61 @@ class CareerDB:
             )
             return cur.fetchall()
 
+    def list_reminders_between(self, start: str, end: str) -> List[ReminderRow]:
+        """
+        Reminders due in [start, end], ordered by due time.
+        start/end are "YYYY-MM-DD" or "YYYY-MM-DD HH:MM"; a bare end date
+        includes that whole day.
+        """
+        # exclusive upper bound, so free-form times ("3pm") stay on their day
+        if len(end) == 10:
+            upper = (datetime.strptime(end, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
+        else:
+            upper = (datetime.strptime(end, "%Y-%m-%d %H:%M") + timedelta(minutes=1)).strftime("%Y-%m-%d %H:%M")
+        with self._read() as conn:
+            cur = conn.cursor()
+            cur.row_factory = row_factory(ReminderRow)
+            cur.execute(
+                """SELECT id, title, description, date, time, category
+                FROM reminders
+                WHERE due_at >= ? AND due_at < ?
+                ORDER BY due_at""",
+                (start, upper),
+            )
+            return cur.fetchall()
+
+    def list_upcoming_reminders(self, after: Optional[str] = None, limit: int = 50) -> List[ReminderRow]:
+        """The next `limit` reminders due at or after `after` (default: now)."""
+        after = after or datetime.now().strftime("%Y-%m-%d %H:%M")
+        with self._read() as conn:
+            cur = conn.cursor()
+            cur.row_factory = row_factory(ReminderRow)
+            cur.execute(
+                """SELECT id, title, description, date, time, category
+                FROM reminders
+                WHERE due_at >= ?
+                ORDER BY due_at
+                LIMIT ?""",
+                (after, limit),
+            )
+            return cur.fetchall()
+
+    def next_due_reminder(self, after: Optional[str] = None) -> Optional[ReminderRow]:
+        """Earliest not-yet-notified reminder due at or after `after` (default: now)."""
+        after = after or datetime.now().strftime("%Y-%m-%d %H:%M")
+        with self._read() as conn:
+            cur = conn.cursor()
+            cur.row_factory = row_factory(ReminderRow)
+            cur.execute(
+                """SELECT id, title, description, date, time, category
+                FROM reminders
+                WHERE due_at >= ? AND notified = 0
+                ORDER BY due_at
+                LIMIT 1""",
+                (after,),
+            )
+            return cur.fetchone()
+
     def update_reminder(
         self,
         reminder_id: int,
@@ -273,20 +763,23 @@ class CareerDB:
             cur = conn.cursor()
             cur.execute(
                 """UPDATE reminders
-                SET title=?, description=?, date=?, time=?, category=?
+                SET title=?, description=?, date=?, time=?, category=?, due_at=?
                 WHERE id=?""",
-                (title, description, date, time, category, reminder_id),
+                (title, description, date, time, category, self.due_at(date, time), reminder_id),
             )
+        self.events.publish(events.ReminderUpdated(reminder_id))
 
     def mark_notified(self, reminder_id: int) -> None:
         with self._conn() as conn:
             cur = conn.cursor()
             cur.execute("UPDATE reminders SET notified=1 WHERE id=?", (reminder_id,))
+        self.events.publish(events.ReminderUpdated(reminder_id))
 
     def delete_reminder(self, reminder_id: int) -> None:
         with self._conn() as conn:
             cur = conn.cursor()
             cur.execute("DELETE FROM reminders WHERE id=?", (reminder_id,))
+        self.events.publish(events.ReminderDeleted(reminder_id))
 
     # --------------------------------------------------------------
     # ----- AI: conversations, messages, memory ---------------------
@@ -297,19 +790,36 @@ class CareerDB:
                 "INSERT INTO ai_conversations (title, created_at) VALUES (?, ?)",
                 (title, datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
             )
-            return cur.lastrowid
+            conversation_id = cur.lastrowid
+        self.events.publish(events.ConversationCreated(conversation_id))
+        return conversation_id
 
-    def ai_list_conversations(self, limit: int = 50) -> List[Tuple]:
+    def ai_list_conversations(self, limit: int = 50) -> List[ConversationRow]:
         # Keep signature stable; limit is capped by caller as needed
         limit = int(limit)
-        with self._conn() as conn:
+        with self._read() as conn:
             cur = conn.cursor()
+            cur.row_factory = row_factory(ConversationRow)
             cur.execute(
                 "SELECT id, title, created_at FROM ai_conversations ORDER BY id DESC LIMIT ?",
                 (limit,),
             )
             return cur.fetchall()
 
+    def ai_delete_conversation(self, conversation_id: int) -> None:
+        """Messages and conversation summaries go with it (migration v10 trigger)."""
+        with self._conn() as conn:
+            cur = conn.cursor()
+            cur.execute("DELETE FROM ai_conversations WHERE id=?", (int(conversation_id),))
+            deleted = cur.rowcount
+        if deleted:
+            self.events.publish(events.ConversationDeleted(int(conversation_id)))
+
+    @staticmethod
+    def ai_conversation_scope(conversation_id: int) -> str:
+        """ai_summaries scope holding a conversation's compacted history."""
+        return f"conversation:{int(conversation_id)}"
+
     def ai_add_message(self, conversation_id: int, role: str, content: str) -> int:
         with self._conn() as conn:
             cur = conn.cursor()
@@ -317,13 +827,28 @@ class CareerDB:
                 "INSERT INTO ai_messages (conversation_id, ts, role, content) VALUES (?, ?, ?, ?)",
                 (int(conversation_id), datetime.now().strftime("%Y-%m-%d %H:%M:%S"), role, content),
             )
-            return cur.lastrowid
-
-    def ai_get_messages(self, conversation_id: int, limit: int = 30) -> List[Tuple]:
+            message_id = cur.lastrowid
+        self.events.publish(events.MessageAdded(int(conversation_id), message_id))
+        return message_id
+
+    def ai_add_messages_many(self, conversation_id: int, messages: Iterable[Sequence]) -> List[int]:
+        """Bulk ai_add_message: each item is (role, content[, ts])."""
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        rows = []
+        for m in messages:
+            role, content, ts = (tuple(m) + (None,))[:3]
+            rows.append((int(conversation_id), ts or now, role, content))
+        ids = self._insert_many("ai_messages", ("conversation_id", "ts", "role", "content"), rows)
+        if ids:
+            self.events.publish(events.MessagesAdded(int(conversation_id), tuple(ids)))
+        return ids
+
+    def ai_get_messages(self, conversation_id: int, limit: int = 30) -> List[Message]:
         """Returns a list of (role, content, ts) ordered oldest->newest for last N messages."""
         limit = int(limit)
-        with self._conn() as conn:
+        with self._read() as conn:
             cur = conn.cursor()
+            cur.row_factory = row_factory(Message)
             cur.execute(
                 """
                 SELECT role, content, ts
@@ -337,6 +862,24 @@ class CareerDB:
             rows = cur.fetchall()
             return list(reversed(rows))
 
+    def ai_get_messages_page(
+        self,
+        conversation_id: int,
+        before_id: Optional[int] = None,
+        page_size: int = 40,
+    ) -> Tuple[List[MessageRow], Optional[int]]:
+        """
+        (id, role, content, ts) rows ordered oldest->newest: the newest page, or
+        the page just older than `before_id`. Also returns the before_id for the
+        next older page (None when there is none).
+        """
+        rows, key = self._keyset_page(
+            "id, role, content, ts", "ai_messages",
+            ["conversation_id=?"], [int(conversation_id)],
+            "id", True, None if before_id is None else (before_id, int(before_id)), page_size, MessageRow,
+        )
+        return list(reversed(rows)), (key[1] if key else None)
+
     def ai_add_memory(self, mem_type: str, content: str, importance: int = 5, pinned: int = 0) -> int:
         with self._conn() as conn:
             cur = conn.cursor()
@@ -344,12 +887,15 @@ class CareerDB:
                 "INSERT INTO ai_memories (ts, type, content, importance, pinned) VALUES (?,?,?,?,?)",
                 (datetime.now().strftime("%Y-%m-%d %H:%M:%S"), str(mem_type), str(content), int(importance), int(pinned)),
             )
-            return cur.lastrowid
+            memory_id = cur.lastrowid
+        self.events.publish(events.MemoryAdded(memory_id))
+        return memory_id
 
-    def ai_list_memories(self, pinned_first: bool = True, limit: int = 200) -> List[Tuple]:
+    def ai_list_memories(self, pinned_first: bool = True, limit: int = 200) -> List[MemoryRow]:
         limit = int(limit)
-        with self._conn() as conn:
+        with self._read() as conn:
             cur = conn.cursor()
+            cur.row_factory = row_factory(MemoryRow)
             if pinned_first:
                 cur.execute(
                     """
@@ -372,11 +918,12 @@ class CareerDB:
                 )
             return cur.fetchall()
 
-    def ai_search_memories(self, query: str, limit: int = 30) -> List[Tuple]:
+    def ai_search_memories(self, query: str, limit: int = 30) -> List[MemoryRow]:
         q = f"%{(query or '').strip()}%"
         limit = int(limit)
-        with self._conn() as conn:
+        with self._read() as conn:
             cur = conn.cursor()
+            cur.row_factory = row_factory(MemoryRow)
             cur.execute(
                 """
                 SELECT id, ts, type, content, importance, pinned
@@ -393,14 +940,16 @@ class CareerDB:
         with self._conn() as conn:
             cur = conn.cursor()
             cur.execute("UPDATE ai_memories SET pinned=? WHERE id=?", (int(pinned), int(memory_id)))
+        self.events.publish(events.MemoryPinned(int(memory_id), bool(int(pinned))))
 
     def ai_delete_memory(self, memory_id: int) -> None:
         with self._conn() as conn:
             cur = conn.cursor()
             cur.execute("DELETE FROM ai_memories WHERE id=?", (int(memory_id),))
+        self.events.publish(events.MemoryDeleted(int(memory_id)))
 
     def ai_get_latest_summary(self, scope: str = "global") -> str:
-        with self._conn() as conn:
+        with self._read() as conn:
             cur = conn.cursor()
             cur.execute(
                 "SELECT summary_text FROM ai_summaries WHERE scope=? ORDER BY id DESC LIMIT 1",
@@ -416,4 +965,6 @@ class CareerDB:
                 "INSERT INTO ai_summaries (scope, ts, summary_text) VALUES (?, ?, ?)",
                 (str(scope), datetime.now().strftime("%Y-%m-%d %H:%M:%S"), str(summary_text)),
             )
-            return cur.lastrowid
+            summary_id = cur.lastrowid
+        self.events.publish(events.SummarySaved(str(scope)))
+        return summary_id
@@ -0,0 +1,57 @@
+# services/db_async.py
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+from services.db import CareerDB
+
+
+class AsyncCareerDB:
+    """
+    Future-returning facade over CareerDB.
+
+    Every call runs on ONE dedicated worker thread, so:
+    - the caller (e.g. the Qt GUI thread) never waits on SQLite,
+    - calls execute in submission order (a write followed by a read sees the write),
+    - the worker keeps its own pooled connection for its whole lifetime.
+
+    Usage:
+        adb = AsyncCareerDB(db)
+        fut = adb.get_all_jobs()          # any CareerDB method
+        fut = adb.submit(some_fn, arg)    # any callable touching the db
+    """
+
+    def __init__(self, db: CareerDB):
+        self.db = db
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="careerdb")
+        self._closed = False
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        if self._closed:
+            fut: Future = Future()
+            fut.set_exception(RuntimeError("AsyncCareerDB is shut down"))
+            return fut
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def __getattr__(self, name: str) -> Callable[..., Future]:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        method = getattr(self.db, name)
+        if not callable(method):
+            raise AttributeError(name)
+
+        def _call(*args: Any, **kwargs: Any) -> Future:
+            return self.submit(method, *args, **kwargs)
+
+        _call.__name__ = name
+        return _call
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if wait:
+            # release the worker's pooled connection on its own thread
+            self._executor.submit(self.db.close_thread)
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
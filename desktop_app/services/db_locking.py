@@ -0,0 +1,106 @@
+# services/db_locking.py
+from __future__ import annotations
+
+import random
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    How long a writer keeps trying for the write lock.
+
+    Each attempt first waits up to the connection's busy_timeout inside
+    SQLite; after that we back off with full jitter (a random sleep in
+    [0, min(max_delay_s, base_delay_s * 2**attempt)]) so two processes that
+    collided don't retry in lock-step.
+    """
+    attempts: int = 12
+    base_delay_s: float = 0.01
+    max_delay_s: float = 0.5
+
+    def delay(self, attempt: int, rng: random.Random) -> float:
+        return rng.uniform(0, min(self.max_delay_s, self.base_delay_s * (2 ** attempt)))
+
+
+@dataclass(frozen=True)
+class LockMetrics:
+    acquisitions: int = 0      # write transactions started
+    contended: int = 0         # ... that had to wait (busy handler or retries)
+    retries: int = 0           # extra BEGIN IMMEDIATE attempts
+    failures: int = 0          # gave up: "database is locked" reached the caller
+    total_wait_s: float = 0.0
+    max_wait_s: float = 0.0
+
+    @property
+    def mean_wait_ms(self) -> float:
+        return 1000 * self.total_wait_s / self.contended if self.contended else 0.0
+
+
+def is_busy_error(exc: BaseException) -> bool:
+    if not isinstance(exc, sqlite3.OperationalError):
+        return False
+    msg = str(exc).lower()
+    return "locked" in msg or "busy" in msg
+
+
+class WriteLock:
+    """
+    Takes the SQLite write lock up front (BEGIN IMMEDIATE) for CareerDB._conn().
+
+    A deferred transaction that reads first and then writes can fail with
+    SQLITE_BUSY straight away when another process committed meanwhile (the
+    busy handler is not consulted for that upgrade). Taking the lock at BEGIN
+    means the only place a writer can wait is here, where it is safe to retry
+    and where the wait is measured.
+    """
+
+    # waits shorter than this are normal lock hand-offs, not contention
+    CONTENDED_S = 0.002
+
+    def __init__(self, policy: RetryPolicy = RetryPolicy()):
+        self.policy = policy
+        self._rng = random.Random()
+        self._lock = threading.Lock()
+        self._acquisitions = 0
+        self._contended = 0
+        self._retries = 0
+        self._failures = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def begin(self, conn: sqlite3.Connection) -> None:
+        """BEGIN IMMEDIATE on `conn`, retrying busy errors per the policy."""
+        started = time.perf_counter()
+        attempt = 0
+        while True:
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                break
+            except sqlite3.OperationalError as e:
+                attempt += 1
+                if not is_busy_error(e) or attempt >= self.policy.attempts:
+                    with self._lock:
+                        self._failures += is_busy_error(e)
+                    raise
+                time.sleep(self.policy.delay(attempt, self._rng))
+        self._record(time.perf_counter() - started, attempt)
+
+    def _record(self, waited: float, retries: int) -> None:
+        with self._lock:
+            self._acquisitions += 1
+            self._retries += retries
+            if retries or waited >= self.CONTENDED_S:
+                self._contended += 1
+                self._total_wait += waited
+                self._max_wait = max(self._max_wait, waited)
+
+    def metrics(self) -> LockMetrics:
+        with self._lock:
+            return LockMetrics(
+                self._acquisitions, self._contended, self._retries,
+                self._failures, self._total_wait, self._max_wait,
+            )
@@ -0,0 +1,110 @@
+# services/db_pool.py
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Applied once per connection, right after it is opened.
+# WAL lets readers (Qt pages, workers) run while another thread/process writes;
+# NORMAL sync is safe under WAL and avoids an fsync on every commit.
+DEFAULT_PRAGMAS: Dict[str, object] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,        # ms to wait on a locked db before raising
+    "cache_size": -8000,         # negative = KiB -> ~8 MB page cache
+    "mmap_size": 64 * 1024 * 1024,
+    "temp_store": "MEMORY",
+}
+
+# Connection roles used by CareerDB.
+# Writers wait briefly inside SQLite and then back off with jitter in Python
+# (services/db_locking.py), so a stalled writer in another process costs at
+# most ~busy_timeout per attempt. Readers never write: under WAL they only
+# wait during checkpoints/recovery, so they keep the long timeout.
+# auto_vacuum goes first: a new file only takes it before journal_mode writes
+# the header (existing dbs switch through RetentionEngine.enable_incremental_vacuum).
+WRITE_PRAGMAS: Dict[str, object] = {"auto_vacuum": "INCREMENTAL", **DEFAULT_PRAGMAS, "busy_timeout": 250}
+READ_PRAGMAS: Dict[str, object] = {**DEFAULT_PRAGMAS, "query_only": "ON"}
+
+
+class ConnectionPool:
+    """
+    Keeps one long-lived sqlite3 connection per thread.
+
+    - The GUI thread, QThread workers and the tray thread each get their own
+      connection (sqlite connections must not be shared across threads mid-use).
+    - Pragmas are configured once, when the connection is created.
+    - Connections owned by threads that have exited are closed lazily.
+    """
+
+    def __init__(self, db_path: Path, pragmas: Dict[str, object] | None = None):
+        self.db_path = db_path
+        self.pragmas = dict(DEFAULT_PRAGMAS if pragmas is None else pragmas)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._owned: List[Tuple[threading.Thread, sqlite3.Connection]] = []
+        self.opened = 0
+
+    # --------------------------------------------------------------
+    def get(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open()
+            self._local.conn = conn
+        return conn
+
+    def _open(self) -> sqlite3.Connection:
+        # check_same_thread=False only so close_all()/pruning may close it from
+        # another thread; in normal use each connection stays on its own thread.
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        cur = conn.cursor()
+        for name, value in self.pragmas.items():
+            cur.execute(f"PRAGMA {name}={value}")
+            if name == "journal_mode":
+                cur.fetchone()
+        cur.close()
+
+        with self._lock:
+            self._prune_dead()
+            self._owned.append((threading.current_thread(), conn))
+            self.opened += 1
+        return conn
+
+    def _prune_dead(self) -> None:
+        alive = []
+        for thread, conn in self._owned:
+            if thread.is_alive():
+                alive.append((thread, conn))
+            else:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+        self._owned = alive
+
+    # --------------------------------------------------------------
+    def close_thread(self) -> None:
+        """Close the calling thread's connection (e.g. at the end of a worker)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            return
+        self._local.conn = None
+        with self._lock:
+            self._owned = [(t, c) for t, c in self._owned if c is not conn]
+        conn.close()
+
+    def close_all(self) -> None:
+        with self._lock:
+            owned, self._owned = self._owned, []
+        for _thread, conn in owned:
+            try:
+                conn.close()
+            except Exception:
+                pass
+        self._local = threading.local()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._owned)
@@ -0,0 +1,176 @@
+# services/events.py
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple, Type
+
+
+# --------------------------------------------------------------
+# Change events (published by CareerDB after the write commits)
+# --------------------------------------------------------------
+@dataclass(frozen=True)
+class ChangeEvent:
+    """Base class; subscribe to it to receive every change."""
+
+
+# ----- Jobs ---------------------------------------------------
+@dataclass(frozen=True)
+class JobAdded(ChangeEvent):
+    job_id: int
+
+
+@dataclass(frozen=True)
+class JobUpdated(ChangeEvent):
+    job_id: int
+
+
+@dataclass(frozen=True)
+class JobStatusChanged(ChangeEvent):
+    job_id: int
+    old: Optional[str]
+    new: str
+
+
+@dataclass(frozen=True)
+class JobDeleted(ChangeEvent):
+    job_id: int
+
+
+@dataclass(frozen=True)
+class JobsAdded(ChangeEvent):
+    """Bulk import; one event for the whole batch."""
+    job_ids: Tuple[int, ...]
+
+
+# ----- Notes ---------------------------------------------------
+@dataclass(frozen=True)
+class NotesSaved(ChangeEvent):
+    pass
+
+
+# ----- Files ---------------------------------------------------
+@dataclass(frozen=True)
+class FileAdded(ChangeEvent):
+    file_id: int
+
+
+@dataclass(frozen=True)
+class FileDeleted(ChangeEvent):
+    file_id: int
+
+
+@dataclass(frozen=True)
+class FilesAdded(ChangeEvent):
+    file_ids: Tuple[int, ...]
+
+
+# ----- Reminders -----------------------------------------------
+@dataclass(frozen=True)
+class ReminderAdded(ChangeEvent):
+    reminder_id: int
+
+
+@dataclass(frozen=True)
+class ReminderUpdated(ChangeEvent):
+    reminder_id: int
+
+
+@dataclass(frozen=True)
+class ReminderDeleted(ChangeEvent):
+    reminder_id: int
+
+
+@dataclass(frozen=True)
+class RemindersAdded(ChangeEvent):
+    reminder_ids: Tuple[int, ...]
+
+
+# ----- AI ------------------------------------------------------
+@dataclass(frozen=True)
+class ConversationCreated(ChangeEvent):
+    conversation_id: int
+
+
+@dataclass(frozen=True)
+class ConversationDeleted(ChangeEvent):
+    conversation_id: int
+
+
+@dataclass(frozen=True)
+class MessageAdded(ChangeEvent):
+    conversation_id: int
+    message_id: int
+
+
+@dataclass(frozen=True)
+class MessagesAdded(ChangeEvent):
+    conversation_id: int
+    message_ids: Tuple[int, ...]
+
+
+@dataclass(frozen=True)
+class MemoryAdded(ChangeEvent):
+    memory_id: int
+
+
+@dataclass(frozen=True)
+class MemoryPinned(ChangeEvent):
+    memory_id: int
+    pinned: bool
+
+
+@dataclass(frozen=True)
+class MemoryDeleted(ChangeEvent):
+    memory_id: int
+
+
+@dataclass(frozen=True)
+class SummarySaved(ChangeEvent):
+    scope: str
+
+
+JOB_EVENTS: Tuple[Type[ChangeEvent], ...] = (JobAdded, JobUpdated, JobStatusChanged, JobDeleted, JobsAdded)
+REMINDER_EVENTS: Tuple[Type[ChangeEvent], ...] = (ReminderAdded, ReminderUpdated, ReminderDeleted, RemindersAdded)
+FILE_EVENTS: Tuple[Type[ChangeEvent], ...] = (FileAdded, FileDeleted, FilesAdded)
+
+
+Handler = Callable[[ChangeEvent], None]
+
+
+class EventBus:
+    """
+    Tiny in-process pub/sub.
+
+    Handlers run synchronously on the publishing thread (which may be a DB
+    worker); UI code should subscribe through ui_qt/db_events.py, which hops
+    to the GUI thread first. Subscribing to a base class receives subclasses.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._handlers: Dict[Type[ChangeEvent], List[Handler]] = {}
+
+    def subscribe(self, event_type: Type[ChangeEvent], handler: Handler) -> Callable[[], None]:
+        with self._lock:
+            self._handlers.setdefault(event_type, []).append(handler)
+
+        def _unsubscribe() -> None:
+            with self._lock:
+                hs = self._handlers.get(event_type, [])
+                if handler in hs:
+                    hs.remove(handler)
+
+        return _unsubscribe
+
+    def publish(self, event: ChangeEvent) -> None:
+        with self._lock:
+            targets: List[Handler] = []
+            for cls in type(event).__mro__:
+                targets.extend(self._handlers.get(cls, ()))
+        for handler in targets:
+            try:
+                handler(event)
+            except Exception as e:
+                # a broken subscriber must never undo/abort a committed write
+                print("EventBus handler error:", e)
@@ -0,0 +1,167 @@
+# services/extract_cache.py
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Tuple
+
+from services.file_extract import TRUNCATED_MARK, Extraction, extract_document, extractor_version
+
+# Longest text kept per document; callers clip further (AI Buddy uses 25k).
+CACHE_MAX_CHARS = 200_000
+_CHUNK = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class CachedExtraction:
+    content_hash: str
+    label: str
+    text: str                   # up to CACHE_MAX_CHARS
+    truncated: bool             # the document had more text than was kept
+    page_count: Optional[int]
+    extract_ms: float           # what the parse cost when it ran
+
+    def clipped(self, max_chars: int) -> str:
+        """Same result as file_extract.extract_text_from_file(path, max_chars)."""
+        if len(self.text) <= max_chars and not self.truncated:
+            return self.text
+        return self.text[:max_chars] + TRUNCATED_MARK
+
+
+def content_hash(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class ExtractionCache:
+    """
+    Persistent document-text cache in career_buddy.db (migration v11).
+
+    Entries are keyed by (sha256 of the file content, extractor_version()),
+    so an edited file simply misses and a copy of a known file hits. The
+    hash itself is remembered per path with the file's size and mtime, so an
+    unchanged file is neither parsed nor re-read: a hit costs one stat and
+    two indexed lookups. Failed extractions (missing parser, unreadable
+    file) are not cached.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self.version = extractor_version()
+        self._lock = threading.Lock()
+        self._pruned = False
+        self.hits = 0
+        self.misses = 0
+
+    # --------------------------------------------------------------
+    def extract_text(self, path: str, max_chars: int = 25_000) -> Tuple[str, str]:
+        """Drop-in for file_extract.extract_text_from_file, served from the cache."""
+        entry = self.extract(path)
+        if entry is None:
+            return "MISSING", ""
+        return entry.label, entry.clipped(max_chars)
+
+    def extract(self, path: str) -> Optional[CachedExtraction]:
+        """Cached extraction for `path`, parsing it first if needed; None if missing."""
+        digest, entry = self.cached(path)
+        if digest is None or entry is not None:
+            return entry
+        started = time.perf_counter()
+        result = extract_document(path, CACHE_MAX_CHARS)
+        return self.store(digest, result, (time.perf_counter() - started) * 1000)
+
+    def cached(self, path: str) -> Tuple[Optional[str], Optional[CachedExtraction]]:
+        """(content hash, cached entry or None) without parsing; (None, None) if missing."""
+        digest = self.content_hash(Path(path))
+        if digest is None:
+            return None, None
+        entry = self.lookup(digest)
+        with self._lock:
+            if entry is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return digest, entry
+
+    def store(self, digest: str, result: Extraction, extract_ms: float) -> CachedExtraction:
+        """Record a parse of the file with `digest` (done here or in a worker process)."""
+        entry = CachedExtraction(
+            content_hash=digest,
+            label=result.label,
+            text=result.text[:CACHE_MAX_CHARS],
+            truncated=result.truncated or len(result.text) > CACHE_MAX_CHARS,
+            page_count=result.page_count,
+            extract_ms=extract_ms,
+        )
+        if not result.failed:
+            self._store(entry)
+        return entry
+
+    def lookup(self, digest: str) -> Optional[CachedExtraction]:
+        with self.db._read() as conn:
+            row = conn.execute(
+                """SELECT label, text, truncated, page_count, extract_ms
+                   FROM extraction_cache WHERE content_hash=? AND extractor_version=?""",
+                (digest, self.version),
+            ).fetchone()
+        if row is None:
+            return None
+        label, text, truncated, page_count, extract_ms = row
+        return CachedExtraction(digest, label, text, bool(truncated), page_count, extract_ms or 0.0)
+
+    # --------------------------------------------------------------
+    def content_hash(self, path: Path) -> Optional[str]:
+        """sha256 of the file, re-read only when its size or mtime changed."""
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        key = str(path.resolve())
+        with self.db._read() as conn:
+            row = conn.execute(
+                "SELECT size, mtime_ns, content_hash FROM extraction_paths WHERE path=?", (key,)
+            ).fetchone()
+        if row is not None and row[0] == st.st_size and row[1] == st.st_mtime_ns:
+            return row[2]
+
+        try:
+            digest = content_hash(path)
+        except OSError:
+            return None
+        with self.db._conn() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO extraction_paths (path, size, mtime_ns, content_hash) VALUES (?, ?, ?, ?)",
+                (key, st.st_size, st.st_mtime_ns, digest),
+            )
+            if row is not None and row[2] != digest:
+                # the file changed: drop the old text unless another path still has that content
+                for table in ("extraction_cache", "cv_profiles"):
+                    conn.execute(
+                        f"""DELETE FROM {table} WHERE content_hash=?
+                            AND NOT EXISTS (SELECT 1 FROM extraction_paths WHERE content_hash=?)""",
+                        (row[2], row[2]),
+                    )
+        return digest
+
+    def _store(self, entry: CachedExtraction) -> None:
+        with self.db._conn() as conn:
+            if not self._pruned:
+                # results of other extractor versions can never be served again
+                conn.execute("DELETE FROM extraction_cache WHERE extractor_version != ?", (self.version,))
+                self._pruned = True
+            conn.execute(
+                """INSERT OR REPLACE INTO extraction_cache
+                       (content_hash, extractor_version, label, text, truncated, page_count, extract_ms, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    entry.content_hash, self.version, entry.label, entry.text, int(entry.truncated),
+                    entry.page_count, entry.extract_ms, datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                ),
+            )
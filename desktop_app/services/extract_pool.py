@@ -0,0 +1,250 @@
+# services/extract_pool.py
+from __future__ import annotations
+
+import heapq
+import itertools
+import multiprocessing as mp
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple
+
+from services.extract_cache import CACHE_MAX_CHARS, CachedExtraction, ExtractionCache
+from services.extractors import EXTRACTORS, LABELS
+from services.file_extract import Extraction, extract_document
+
+# Lower runs first.
+INTERACTIVE = 0     # the user is waiting (attach, upload)
+BACKGROUND = 10     # pre-extraction of imported vault files
+
+# what prefetch() queues; anything else would only yield an empty UNKNOWN entry
+DOCUMENT_EXTS = frozenset(LABELS)
+
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = "queued", "running", "done", "failed", "cancelled"
+
+
+def _parse(path: str, chain: Sequence[str]) -> Tuple[Extraction, float]:
+    """
+    Runs in a worker process, with the backend order chosen by the parent:
+    the worker's own EXTRACTORS never sees the parent's measurements.
+    """
+    started = time.perf_counter()
+    result = extract_document(path, CACHE_MAX_CHARS, chain=chain)
+    return result, (time.perf_counter() - started) * 1000
+
+
+class ExtractionJob:
+    """
+    Handle for one submitted document. `future` resolves to the
+    CachedExtraction (None if the file is missing) unless the job is cancelled.
+    """
+
+    def __init__(self, service: "ExtractionService", job_id: int, path: str, priority: int):
+        self._service = service
+        self.id = job_id
+        self.path = path
+        self.priority = priority
+        self.state = QUEUED
+        self.future: Future = Future()
+
+    def cancel(self) -> bool:
+        return self._service.cancel(self)
+
+    def __repr__(self) -> str:
+        return f"ExtractionJob({self.id}, {self.path!r}, {self.state})"
+
+
+class ExtractionService:
+    """
+    Document text extraction off the calling thread, parsed in worker
+    processes (PyMuPDF / python-docx hold the GIL for most of a parse).
+
+    - Every job checks the ExtractionCache first; only misses reach the pool.
+    - Jobs wait in a priority queue and are handed to the pool one free
+      worker at a time, so an interactive request overtakes a backlog of
+      background pre-extractions instead of queueing behind it.
+    - cancel() drops a queued job; a job already parsing is finished (and
+      cached) but its result is not delivered.
+    - `on_state(job)` is called from service threads on every state change;
+      progress() gives (done, total) for the current batch (reset once idle).
+
+    The pool (spawned processes) starts on the first cache miss.
+    """
+
+    def __init__(
+        self,
+        db,
+        workers: Optional[int] = None,
+        on_state: Optional[Callable[[ExtractionJob], None]] = None,
+    ):
+        self.db = db
+        self.cache = ExtractionCache(db)
+        self.workers = workers or max(1, min(4, (os.cpu_count() or 2) - 1))
+        self.on_state = on_state
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._cond = threading.Condition()
+        self._heap: List[Tuple[int, int, ExtractionJob]] = []
+        self._ids = itertools.count(1)
+        self._running = 0
+        self._batch_total = 0
+        self._batch_done = 0
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    # --------------------------------------------------------------
+    def submit(self, path: str, priority: int = INTERACTIVE) -> ExtractionJob:
+        job = ExtractionJob(self, next(self._ids), str(path), priority)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("ExtractionService is closed")
+            heapq.heappush(self._heap, (priority, job.id, job))
+            self._batch_total += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="extract-dispatch", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+        self._notify(job)
+        return job
+
+    def prefetch(self, paths: Iterable[str]) -> List[ExtractionJob]:
+        """Queue documents for background extraction (e.g. right after a vault import)."""
+        return [self.submit(p, BACKGROUND) for p in paths if Path(p).suffix.lower() in DOCUMENT_EXTS]
+
+    def cancel(self, job: ExtractionJob) -> bool:
+        with self._cond:
+            if job.state not in (QUEUED, RUNNING):
+                return False
+            # a queued job stays in the heap and is skipped; a running one is
+            # left to finish. Either way it counts as settled for progress now.
+            job.state = CANCELLED
+            self._batch_done += 1
+        job.future.cancel()
+        self._notify(job)
+        return True
+
+    def progress(self) -> Tuple[int, int]:
+        with self._cond:
+            return self._batch_done, self._batch_total
+
+    def close(self, wait: bool = True) -> None:
+        with self._cond:
+            self._closed = True
+            pending = [job for _p, _i, job in self._heap]
+            self._heap.clear()
+            self._cond.notify_all()
+        for job in pending:
+            self.cancel(job)
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+
+    # --------------------------------------------------------------
+    def _run(self) -> None:
+        try:
+            while True:
+                with self._cond:
+                    while not self._closed and (not self._heap or self._running >= self.workers):
+                        self._cond.wait()
+                    if self._closed:
+                        return
+                    _prio, _id, job = heapq.heappop(self._heap)
+                    if job.state == CANCELLED:
+                        self._end_batch_if_idle()
+                        continue
+                    job.state = RUNNING
+                    self._running += 1
+                self._notify(job)
+                self._start(job)
+        finally:
+            self.db.close_thread()
+
+    def _start(self, job: ExtractionJob) -> None:
+        try:
+            digest, entry = self.cache.cached(job.path)
+            if digest is None or entry is not None:
+                self._finish(job, entry, None)
+                return
+            with self._cond:
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(self.workers, mp_context=mp.get_context("spawn"))
+                pool = self._pool
+            chain = [b.name for b in EXTRACTORS.chain(Path(job.path).suffix.lower())]
+            fut = pool.submit(_parse, job.path, chain)
+        except Exception as e:
+            self._finish(job, None, e)
+            return
+        fut.add_done_callback(lambda f, j=job, d=digest, p=pool: self._parsed(j, d, p, f))
+
+    def _parsed(self, job: ExtractionJob, digest: str, pool: ProcessPoolExecutor, fut: Future) -> None:
+        # pool callback thread: cache the result even if the job was cancelled meanwhile
+        try:
+            result, elapsed_ms = fut.result()
+            # the worker's own registry is lost with it: keep every try's timing here
+            for attempt in result.attempts:
+                EXTRACTORS.record(*attempt)
+            entry = self.cache.store(digest, result, elapsed_ms)
+        except BrokenProcessPool as e:
+            # a worker died (crashing parser, killed process): start a fresh pool next time
+            with self._cond:
+                if self._pool is pool:
+                    self._pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
+            self._finish(job, None, e)
+        except Exception as e:
+            self._finish(job, None, e)
+        else:
+            self._finish(job, entry, None)
+
+    def _finish(self, job: ExtractionJob, entry: Optional[CachedExtraction], error: Optional[BaseException]) -> None:
+        with self._cond:
+            self._running -= 1
+            delivered = job.state == RUNNING
+            if delivered:
+                job.state = FAILED if error is not None else DONE
+                self._batch_done += 1
+            self._end_batch_if_idle()
+            self._cond.notify_all()
+        if not delivered:
+            return  # cancelled while parsing
+        if error is not None:
+            print("Extraction error:", job.path, error)
+            if job.future.set_running_or_notify_cancel():
+                job.future.set_exception(error)
+        elif job.future.set_running_or_notify_cancel():
+            job.future.set_result(entry)
+        self._notify(job)
+
+    def _end_batch_if_idle(self) -> None:
+        # caller holds self._cond
+        if not self._heap and self._running == 0:
+            self._batch_done = self._batch_total = 0
+
+    def _notify(self, job: ExtractionJob) -> None:
+        if self.on_state is not None:
+            try:
+                self.on_state(job)
+            except Exception as e:
+                print("Extraction state callback error:", e)
+
+
+_SERVICES: "weakref.WeakKeyDictionary[Any, ExtractionService]" = weakref.WeakKeyDictionary()
+
+
+def service_for(db) -> ExtractionService:
+    """Shared ExtractionService (one process pool) per CareerDB instance."""
+    svc = _SERVICES.get(db)
+    if svc is None:
+        svc = ExtractionService(db)
+        _SERVICES[db] = svc
+    return svc
+
+
+def shutdown_all() -> None:
+    for svc in list(_SERVICES.values()):
+        svc.close()
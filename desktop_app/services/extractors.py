@@ -0,0 +1,222 @@
+# services/extractors.py
+from __future__ import annotations
+
+import codecs
+import io
+import mmap
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+# Optional PDF extraction via PyMuPDF (fitz)
+try:
+    import fitz  # PyMuPDF
+    _HAS_PYMUPDF = True
+except Exception:
+    fitz = None  # type: ignore
+    _HAS_PYMUPDF = False
+
+# Optional PDF fallback (pure Python, ~20x slower than PyMuPDF on CVs)
+try:
+    from pdfminer.high_level import extract_pages as pdfminer_extract_pages
+    from pdfminer.layout import LTTextContainer
+    _HAS_PDFMINER = True
+except Exception:
+    pdfminer_extract_pages = None  # type: ignore
+    LTTextContainer = None  # type: ignore
+    _HAS_PDFMINER = False
+
+# Optional DOCX extraction
+try:
+    import docx  # python-docx
+    _HAS_DOCX = True
+except Exception:
+    docx = None  # type: ignore
+    _HAS_DOCX = False
+
+
+TEXT_EXTS = {".txt", ".md", ".csv", ".log", ".rtf"}
+LABELS: Dict[str, str] = {".pdf": "PDF", ".docx": "DOCX", **{ext: "TEXT" for ext in TEXT_EXTS}}
+
+# text files at least this big are read through a memory map, a chunk at a time
+MMAP_MIN_BYTES = 1024 * 1024
+_TEXT_CHUNK = 64 * 1024
+
+# (unit, text) pieces from `start`; a backend may fill meta["page_count"]
+Pieces = Callable[[Path, int, Dict[str, Any]], Iterator[Tuple[int, str]]]
+
+
+@dataclass(frozen=True)
+class Backend:
+    """
+    One way to read one family of formats. `pieces` yields one PDF page,
+    DOCX paragraph or decoded text chunk at a time with its separator
+    already attached, so "".join() of the pieces is the document text and
+    a reader that stops early never parses the rest.
+    """
+    name: str
+    label: str
+    exts: FrozenSet[str]
+    available: bool
+    pieces: Pieces
+    # chars/ms on CVs from benchmarks/bench_extractors.py: the speed assumed
+    # until this process has measured enough runs of its own
+    seed_chars_per_ms: float = 0.0
+    preference: int = 0     # tie-break between equally fast backends (lower first)
+
+
+@dataclass(frozen=True)
+class BackendMetrics:
+    name: str
+    calls: int
+    failures: int
+    total_ms: float
+    max_ms: float
+    chars: int
+
+    @property
+    def mean_ms(self) -> float:
+        ok = self.calls - self.failures
+        return self.total_ms / ok if ok else 0.0
+
+    @property
+    def chars_per_ms(self) -> float:
+        return self.chars / self.total_ms if self.total_ms else 0.0
+
+
+class ExtractorRegistry:
+    """
+    Backends per file extension, tried in order until one succeeds.
+
+    Fastest first. A backend's speed is its measured throughput (chars/ms,
+    times its success rate) once it has MIN_SAMPLES runs in this process,
+    and its benchmark seed until then, so a fallback that only runs when the
+    first choice fails is still ranked. Runs in extraction worker processes
+    are recorded here by the parent (services/extract_pool.py), which also
+    picks the chain the workers use. Unavailable backends (parser not
+    installed) are never tried.
+    """
+
+    MIN_SAMPLES = 5
+
+    def __init__(self):
+        self._backends: List[Backend] = []
+        self._lock = threading.Lock()
+        self._stats: Dict[str, List[float]] = {}  # name -> [calls, failures, total_ms, max_ms, chars]
+
+    def register(self, backend: Backend) -> None:
+        with self._lock:
+            names = [b.name for b in self._backends]
+            if backend.name in names:
+                self._backends[names.index(backend.name)] = backend  # replace in place
+            else:
+                self._backends.append(backend)
+            self._stats.setdefault(backend.name, [0, 0, 0.0, 0.0, 0])
+
+    def get(self, name: str) -> Backend:
+        for b in self._backends:
+            if b.name == name:
+                return b
+        raise KeyError(f"No extractor backend named {name!r}")
+
+    def backends(self, ext: Optional[str] = None, available_only: bool = True) -> List[Backend]:
+        return [
+            b for b in self._backends
+            if (ext is None or ext in b.exts) and (b.available or not available_only)
+        ]
+
+    def chain(self, ext: str) -> List[Backend]:
+        """Available backends for `ext`, fastest first."""
+        metrics = self.metrics()
+        return sorted(self.backends(ext), key=lambda b: (-self._speed(b, metrics.get(b.name)), b.preference))
+
+    def _speed(self, backend: Backend, m: Optional[BackendMetrics]) -> float:
+        if m is None or m.calls < self.MIN_SAMPLES:
+            return backend.seed_chars_per_ms
+        ok = m.calls - m.failures
+        measured = m.chars_per_ms if ok else 0.0
+        return measured * ok / m.calls
+
+    def record(self, name: str, elapsed_ms: float, chars: int, ok: bool) -> None:
+        with self._lock:
+            s = self._stats.setdefault(name, [0, 0, 0.0, 0.0, 0])
+            s[0] += 1
+            if not ok:
+                s[1] += 1
+                return
+            s[2] += elapsed_ms
+            s[3] = max(s[3], elapsed_ms)
+            s[4] += chars
+
+    def metrics(self) -> Dict[str, BackendMetrics]:
+        with self._lock:
+            return {
+                name: BackendMetrics(name, int(s[0]), int(s[1]), s[2], s[3], int(s[4]))
+                for name, s in self._stats.items()
+            }
+
+
+# ------------------------------------------------------------------
+# Backends
+# ------------------------------------------------------------------
+def _pymupdf_pieces(path: Path, start: int, meta: Dict[str, Any]) -> Iterator[Tuple[int, str]]:
+    doc = fitz.open(str(path))
+    try:
+        meta["page_count"] = doc.page_count
+        for i in range(start, doc.page_count):
+            yield i, ("\n" if i else "") + doc.load_page(i).get_text("text")
+    finally:
+        doc.close()
+
+
+def _pdfminer_pieces(path: Path, start: int, meta: Dict[str, Any]) -> Iterator[Tuple[int, str]]:
+    pages = pdfminer_extract_pages(str(path), page_numbers=range(start, sys.maxsize))
+    for i, page in enumerate(pages, start):
+        text = "".join(el.get_text() for el in page if isinstance(el, LTTextContainer))
+        yield i, ("\n" if i else "") + text
+
+
+def _docx_pieces(path: Path, start: int, meta: Dict[str, Any]) -> Iterator[Tuple[int, str]]:
+    paragraphs = docx.Document(str(path)).paragraphs
+    for i in range(start, len(paragraphs)):
+        t = (paragraphs[i].text or "").strip()
+        if t:
+            yield i, ("\n" if i else "") + t
+
+
+def _text_pieces(path: Path, start: int, meta: Dict[str, Any]) -> Iterator[Tuple[int, str]]:
+    """Units are byte offsets; big files are memory-mapped rather than read whole."""
+    with open(path, "rb") as f:
+        size = path.stat().st_size
+        # pages in on demand: a 500 MB log costs a chunk, not 500 MB
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size >= MMAP_MIN_BYTES else f.read()
+        try:
+            n = len(buf)
+            decoder = io.IncrementalNewlineDecoder(
+                codecs.getincrementaldecoder("utf-8")(errors="ignore"), translate=True
+            )
+            pos = start
+            while pos < n:
+                # a split multi-byte character is still in the decoder: resume from its first byte
+                unit = pos - len(decoder.getstate()[0])
+                chunk = buf[pos:pos + _TEXT_CHUNK]
+                pos += len(chunk)
+                text = decoder.decode(chunk, final=pos >= n)
+                if text:
+                    yield unit, text
+        finally:
+            if isinstance(buf, mmap.mmap):
+                buf.close()
+
+
+EXTRACTORS = ExtractorRegistry()
+EXTRACTORS.register(Backend("pymupdf", "PDF", frozenset({".pdf"}), _HAS_PYMUPDF, _pymupdf_pieces,
+                            seed_chars_per_ms=1644, preference=0))
+EXTRACTORS.register(Backend("pdfminer", "PDF", frozenset({".pdf"}), _HAS_PDFMINER, _pdfminer_pieces,
+                            seed_chars_per_ms=85, preference=1))
+EXTRACTORS.register(Backend("python-docx", "DOCX", frozenset({".docx"}), _HAS_DOCX, _docx_pieces,
+                            seed_chars_per_ms=344))
+EXTRACTORS.register(Backend("text", "TEXT", frozenset(TEXT_EXTS), True, _text_pieces,
+                            seed_chars_per_ms=168656))
@@ -1,86 +1,176 @@
 # services/file_extract.py
 from __future__ import annotations
 
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterator, List, Optional, Sequence, Tuple
 
-# Optional PDF extraction via PyMuPDF (fitz)
-try:
-    import fitz  # PyMuPDF
-    _HAS_PYMUPDF = True
-except Exception:
-    fitz = None  # type: ignore
-    _HAS_PYMUPDF = False
+from services.extractors import EXTRACTORS, LABELS, Backend
 
-# Optional DOCX extraction
-try:
-    import docx  # python-docx
-    _HAS_DOCX = True
-except Exception:
-    docx = None  # type: ignore
-    _HAS_DOCX = False
+# first 6 pages is usually enough for CVs; read_text() can continue past it
+PDF_MAX_PAGES = 6
 
+TRUNCATED_MARK = "\n\n[...truncated...]"
 
-TEXT_EXTS = {".txt", ".md", ".csv", ".log", ".rtf"}
+# (backend name, elapsed ms, chars, ok) for each backend a read tried, in order
+Attempt = Tuple[str, float, int, bool]
 
+# Bump when the extraction logic changes: cached results (services/extract_cache.py)
+# from other versions are ignored.
+EXTRACTOR_VERSION = 2
 
-def extract_text_from_file(path: str, max_chars: int = 25_000) -> Tuple[str, str]:
+
+def extractor_version() -> str:
+    """EXTRACTOR_VERSION plus which extractor backends are available."""
+    return f"{EXTRACTOR_VERSION}:" + ",".join(sorted(b.name for b in EXTRACTORS.backends()))
+
+
+@dataclass(frozen=True)
+class Extraction:
+    label: str                      # "PDF", "DOCX", "TEXT", "UNKNOWN", "MISSING"
+    text: str                       # stripped, at most the requested budget
+    page_count: Optional[int] = None
+    failed: bool = False            # every backend failed or none is installed: don't cache
+    truncated: bool = False         # the document has more text than was read
+    backend: Optional[str] = None   # which services/extractors.py backend produced it
+    attempts: Tuple[Attempt, ...] = ()
+
+
+@dataclass(frozen=True)
+class ReadPosition:
     """
-    Returns (label, extracted_text).
-    label is a short type label e.g. "PDF", "DOCX", "TEXT", "UNKNOWN".
-    extracted_text is truncated to max_chars.
+    Where a read_text() slice stopped. `unit` is a PDF page, a DOCX
+    paragraph or a byte offset into a text file; `char` counts characters
+    of that unit already returned.
+    """
+    unit: int = 0
+    char: int = 0
+
+
+@dataclass(frozen=True)
+class TextSlice:
+    label: str
+    text: str
+    next: Optional[ReadPosition]    # pass back to read_text() to continue; None at the end
+    page_count: Optional[int] = None
+    failed: bool = False
+    backend: Optional[str] = None
+    attempts: Tuple[Attempt, ...] = ()
+
+
+def read_text(
+    path: str,
+    max_chars: int,
+    start: Optional[ReadPosition] = None,
+    max_pages: Optional[int] = None,
+    backend: Optional[str] = None,
+    chain: Optional[Sequence[str]] = None,
+) -> TextSlice:
+    """
+    Up to `max_chars` of text from `start`, reading only as far into the
+    document as that needs. `next` is set when more text remains (also when
+    this call read `max_pages` PDF pages) and continues exactly where this
+    slice ended.
+
+    Backends come from EXTRACTORS.chain(), or from `chain` (names, in
+    order; a worker process gets its parent's choice this way), or are just
+    `backend`, by name. A backend that raises is reported and the next one
+    is tried; every try is timed into EXTRACTORS and listed in `attempts`.
+    Never raises.
     """
     p = Path(path)
     ext = p.suffix.lower()
-
     if not p.exists():
-        return "MISSING", ""
+        return TextSlice("MISSING", "", None, failed=True)
+    label = LABELS.get(ext)
+    if label is None:
+        return TextSlice("UNKNOWN", "", None)  # images etc.
 
-    # TEXT
-    if ext in TEXT_EXTS:
-        try:
-            text = p.read_text(encoding="utf-8", errors="ignore")
-            return "TEXT", _clip(text, max_chars)
-        except Exception:
-            return "TEXT", ""
-
-    # DOCX
-    if ext == ".docx":
-        if not _HAS_DOCX or docx is None:
-            return "DOCX", ""
+    pos = start or ReadPosition()
+    if backend:
+        chain = [backend]
+    backends = [EXTRACTORS.get(name) for name in chain] if chain is not None else EXTRACTORS.chain(ext)
+    attempts: List[Attempt] = []
+    for b in backends:
+        meta = {}
+        started = time.perf_counter()
         try:
-            d = docx.Document(str(p))
-            parts = []
-            for para in d.paragraphs:
-                t = (para.text or "").strip()
-                if t:
-                    parts.append(t)
-            text = "\n".join(parts)
-            return "DOCX", _clip(text, max_chars)
-        except Exception:
-            return "DOCX", ""
-
-    # PDF
-    if ext == ".pdf":
-        if not _HAS_PYMUPDF or fitz is None:
-            return "PDF", ""
-        try:
-            doc = fitz.open(str(p))
-            parts = []
-            for i in range(min(doc.page_count, 6)):  # first 6 pages is usually enough for CVs
-                page = doc.load_page(i)
-                parts.append(page.get_text("text"))
-            text = "\n".join(parts)
-            return "PDF", _clip(text, max_chars)
-        except Exception:
-            return "PDF", ""
-
-    # Other / unsupported (images etc.)
-    return "UNKNOWN", ""
-
-
-def _clip(text: str, max_chars: int) -> str:
-    t = (text or "").strip()
-    if len(t) <= max_chars:
-        return t
-    return t[:max_chars] + "\n\n[...truncated...]"
+            text, nxt = _read_slice(b, p, pos, max_chars, max_pages, meta)
+        except Exception as e:
+            attempts.append((b.name, (time.perf_counter() - started) * 1000, 0, False))
+            EXTRACTORS.record(*attempts[-1])
+            print(f"Extraction error ({b.name}):", path, e)
+            continue
+        attempts.append((b.name, (time.perf_counter() - started) * 1000, len(text), True))
+        EXTRACTORS.record(*attempts[-1])
+        return TextSlice(label, text, nxt, meta.get("page_count"), backend=b.name, attempts=tuple(attempts))
+    return TextSlice(label, "", None, failed=True, attempts=tuple(attempts))
+
+
+def _read_slice(
+    b: Backend, p: Path, pos: ReadPosition, max_chars: int, max_pages: Optional[int], meta: dict,
+) -> Tuple[str, Optional[ReadPosition]]:
+    fresh = pos == ReadPosition()
+    parts: List[str] = []
+    room = max_chars
+    skip = pos.char
+    nxt: Optional[ReadPosition] = None
+    pieces: Iterator[Tuple[int, str]] = b.pieces(p, pos.unit, meta)
+    try:
+        for unit, piece in pieces:
+            if max_pages is not None and b.label == "PDF" and unit >= pos.unit + max_pages:
+                nxt = ReadPosition(unit)
+                break
+            offset = 0
+            if skip:
+                if len(piece) <= skip:
+                    skip -= len(piece)
+                    continue
+                offset, piece, skip = skip, piece[skip:], 0
+            if fresh and not parts:
+                # leading whitespace doesn't count against the budget
+                stripped = piece.lstrip()
+                offset += len(piece) - len(stripped)
+                piece = stripped
+                if not piece:
+                    continue
+            if len(piece) > room:
+                parts.append(piece[:room])
+                nxt = ReadPosition(unit, offset + room)
+                break
+            parts.append(piece)
+            room -= len(piece)
+    finally:
+        pieces.close()  # releases the open PDF / memory map now, not at garbage collection
+
+    text = "".join(parts)
+    if nxt is None:
+        text = text.rstrip()
+    return text, nxt
+
+
+def extract_document(
+    path: str,
+    max_chars: int,
+    max_pages: Optional[int] = PDF_MAX_PAGES,
+    chain: Optional[Sequence[str]] = None,
+) -> Extraction:
+    """Text of a document up to `max_chars`, read no further than that; never raises."""
+    part = read_text(path, max_chars, max_pages=max_pages, chain=chain)
+    return Extraction(
+        part.label, part.text, page_count=part.page_count, failed=part.failed,
+        truncated=part.next is not None, backend=part.backend, attempts=part.attempts,
+    )
+
+
+def extract_text_from_file(path: str, max_chars: int = 25_000) -> Tuple[str, str]:
+    """
+    Returns (label, extracted_text).
+    label is a short type label e.g. "PDF", "DOCX", "TEXT", "UNKNOWN".
+    extracted_text is truncated to max_chars.
+    """
+    result = extract_document(path, max_chars)
+    if result.truncated:
+        return result.label, result.text + TRUNCATED_MARK
+    return result.label, result.text
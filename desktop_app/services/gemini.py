@@ -9,7 +9,7 @@ try:
 except Exception:
     GEMINI_INSTALLED = False
 
-from config.settings import get_api_key
+from config.settings import GEMINI_API_KEY, get_api_key, store as settings_store
 from config.theme import get as theme
 
 log = logging.getLogger(__name__)
@@ -36,6 +36,8 @@ class LLMClient:
     def __init__(self):
         self._use_gemini = False
         self._init_backend()
+        # switch backend as soon as an API key is saved/cleared (reads are cached)
+        settings_store().subscribe(GEMINI_API_KEY, lambda _key, _value: self._init_backend())
 
     # -----------------------------------------------------------------
     def _init_backend(self) -> None:
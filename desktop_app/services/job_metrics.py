@@ -0,0 +1,267 @@
+# services/job_metrics.py
+from __future__ import annotations
+
+import statistics
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+    _HAS_NUMPY = True
+except Exception:
+    np = None  # type: ignore
+    _HAS_NUMPY = False
+
+
+# Funnel order; "Rejected" is an exit, not a stage.
+FUNNEL = ("To Apply", "Applied", "Interviewing", "Offer")
+STAGES = FUNNEL + ("Rejected",)
+_CODE = {s: i for i, s in enumerate(STAGES)}
+_K = len(STAGES)
+_DAY = 86400.0
+
+
+@dataclass(frozen=True)
+class DwellStats:
+    """Days spent in `from_status` before moving to `to_status`."""
+    from_status: str
+    to_status: str
+    n: int
+    median_days: float
+    p90_days: float
+
+
+@dataclass(frozen=True)
+class FlowSnapshot:
+    dwell: Tuple[DwellStats, ...]
+    # (stage, next stage, jobs that reached stage, fraction that reached next)
+    conversion: Tuple[Tuple[str, str, int, float], ...]
+    # (monday "YYYY-MM-DD", transitions into Applied), oldest first
+    weekly_applied: Tuple[Tuple[str, int], ...]
+    events: int
+
+
+class _Column:
+    """Append-only float column (amortised doubling when numpy is available)."""
+
+    def __init__(self):
+        self._n = 0
+        self._buf = np.empty(64) if _HAS_NUMPY else []
+
+    def extend(self, values) -> None:
+        if not _HAS_NUMPY:
+            self._buf.extend(values)
+            self._n = len(self._buf)
+            return
+        k = len(values)
+        if self._n + k > len(self._buf):
+            grown = np.empty(max(2 * len(self._buf), self._n + k))
+            grown[: self._n] = self._buf[: self._n]
+            self._buf = grown
+        self._buf[self._n: self._n + k] = values
+        self._n += k
+
+    def __len__(self) -> int:
+        return self._n
+
+    def median_p90(self) -> Tuple[float, float]:
+        if _HAS_NUMPY:
+            med, p90 = np.percentile(self._buf[: self._n], (50, 90))
+            return float(med), float(p90)
+        data = sorted(self._buf)
+        return statistics.median(data), _percentile(data, 0.90)
+
+
+def _percentile(sorted_data: Sequence[float], q: float) -> float:
+    # linear interpolation, same as numpy's default
+    pos = (len(sorted_data) - 1) * q
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_data) - 1)
+    return sorted_data[lo] + (sorted_data[hi] - sorted_data[lo]) * (pos - lo)
+
+
+class JobFlowMetrics:
+    """
+    Time-in-stage, funnel conversion and weekly velocity from `job_events`.
+
+    Kept incrementally: refresh() reads only events with id > the last one
+    seen and folds them into running state (per-job current stage, per-pair
+    dwell columns, per-job furthest funnel stage, per-week counters). With
+    numpy each batch is processed as columnar arrays; without it the same
+    fold runs as a plain loop.
+
+    refresh() is serialised by a lock; AnalyticsPage calls it on the DB worker.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self._lock = threading.Lock()
+        self._last_id = 0
+        self._events = 0
+        # job_id -> (stage code, entered at epoch seconds)
+        self._current: Dict[int, Tuple[int, float]] = {}
+        # pair code (from * _K + to) -> dwell days
+        self._dwell: Dict[int, _Column] = {}
+        self._dwell_cache: Dict[int, Tuple[float, float]] = {}
+        # job_id -> furthest FUNNEL index reached; histogram of those values
+        self._furthest: Dict[int, int] = {}
+        self._furthest_hist = [0] * len(FUNNEL)
+        # monday-aligned week number -> transitions into Applied
+        self._weekly: Counter = Counter()
+
+    # --------------------------------------------------------------
+    def refresh(self) -> FlowSnapshot:
+        """Fold in new job_events and return the current figures."""
+        with self._lock:
+            with self.db._read() as conn:
+                rows = conn.execute(
+                    """SELECT id, job_id, from_status, to_status,
+                              CAST(strftime('%s', ts) AS INTEGER)
+                       FROM job_events WHERE id > ? ORDER BY id""",
+                    (self._last_id,),
+                ).fetchall()
+            if rows:
+                # unparseable timestamps come back NULL: skip them
+                batch = [r for r in rows if r[4] is not None]
+                if batch:
+                    (self._ingest_numpy if _HAS_NUMPY else self._ingest_python)(batch)
+                self._last_id = rows[-1][0]
+                self._events += len(batch)
+            return self._snapshot()
+
+    # --------------------------------------------------------------
+    def _ingest_python(self, rows: List[Tuple]) -> None:
+        new_dwell: Dict[int, List[float]] = {}
+        for _id, job_id, frm, to, t in rows:
+            prev = self._current.get(job_id)
+            f, c = _CODE.get(frm, -1), _CODE.get(to, -1)
+            if prev is not None and f >= 0 and c >= 0 and prev[0] == f:
+                new_dwell.setdefault(f * _K + c, []).append((t - prev[1]) / _DAY)
+
+            if to is None:
+                self._current.pop(job_id, None)
+                continue
+            self._current[job_id] = (c, float(t))
+
+            if c == _CODE["Applied"] and f != c:
+                self._weekly[(t // 86400 + 3) // 7] += 1
+            if 0 <= c < len(FUNNEL):
+                self._raise_furthest(job_id, c)
+
+        for pair, values in new_dwell.items():
+            self._dwell.setdefault(pair, _Column()).extend(values)
+            self._dwell_cache.pop(pair, None)
+
+    def _ingest_numpy(self, rows: List[Tuple]) -> None:
+        n = len(rows)
+        _ids, job_ids, frms, tos, ts = zip(*rows)
+        job = np.fromiter(job_ids, dtype=np.int64, count=n)
+        t = np.fromiter(ts, dtype=np.float64, count=n)
+        f = np.fromiter((_CODE.get(s, -1) for s in frms), dtype=np.int64, count=n)
+        c = np.fromiter((_CODE.get(s, -1) for s in tos), dtype=np.int64, count=n)
+        deleted = np.fromiter((s is None for s in tos), dtype=bool, count=n)
+
+        # group by job, keeping event order inside each job (rows come ordered by id)
+        order = np.argsort(job, kind="stable")
+        job, t, f, c, deleted = job[order], t[order], f[order], c[order], deleted[order]
+        first = np.ones(n, dtype=bool)
+        first[1:] = job[1:] != job[:-1]
+        last = np.ones(n, dtype=bool)
+        last[:-1] = first[1:]
+
+        # previous stage/entry time: shifted within a job, carried state at group starts
+        prev_c = np.empty(n, dtype=np.int64)
+        prev_t = np.empty(n)
+        prev_c[1:], prev_t[1:] = c[:-1], t[:-1]
+        # a deletion inside the batch ends the job's history
+        prev_c[1:][deleted[:-1]] = -1
+        for i in np.flatnonzero(first):
+            state = self._current.get(int(job[i]))
+            prev_c[i], prev_t[i] = state if state is not None else (-1, 0.0)
+
+        # dwell: leaving the stage we know the job was in, into a known stage
+        ok = (prev_c >= 0) & (prev_c == f) & (c >= 0)
+        if ok.any():
+            pair = f[ok] * _K + c[ok]
+            days = (t[ok] - prev_t[ok]) / _DAY
+            by_pair = np.argsort(pair, kind="stable")
+            pair, days = pair[by_pair], days[by_pair]
+            keys, starts = np.unique(pair, return_index=True)
+            for key, chunk in zip(keys.tolist(), np.split(days, starts[1:])):
+                self._dwell.setdefault(key, _Column()).extend(chunk)
+                self._dwell_cache.pop(key, None)
+
+        # weekly velocity: transitions into Applied
+        applied = (c == _CODE["Applied"]) & (f != c)
+        if applied.any():
+            weeks, counts = np.unique((t[applied] // 86400 + 3) // 7, return_counts=True)
+            self._weekly.update(dict(zip(weeks.astype(np.int64).tolist(), counts.tolist())))
+
+        # furthest funnel stage per job in this batch
+        funnel_c = np.where((c >= 0) & (c < len(FUNNEL)), c, -1)
+        group_starts = np.flatnonzero(first)
+        furthest = np.maximum.reduceat(funnel_c, group_starts)
+        for j, r in zip(job[group_starts].tolist(), furthest.tolist()):
+            if r >= 0:
+                self._raise_furthest(j, r)
+
+        # carry each job's final state into the next batch
+        for i in np.flatnonzero(last):
+            j = int(job[i])
+            if deleted[i]:
+                self._current.pop(j, None)
+            else:
+                self._current[j] = (int(c[i]), float(t[i]))
+
+    def _raise_furthest(self, job_id: int, rank: int) -> None:
+        old = self._furthest.get(job_id)
+        if old is not None and old >= rank:
+            return
+        if old is not None:
+            self._furthest_hist[old] -= 1
+        self._furthest_hist[rank] += 1
+        self._furthest[job_id] = rank
+
+    # --------------------------------------------------------------
+    def _snapshot(self, weeks: int = 12) -> FlowSnapshot:
+        dwell = []
+        for pair in sorted(self._dwell):
+            stats = self._dwell_cache.get(pair)
+            if stats is None:
+                stats = self._dwell[pair].median_p90()
+                self._dwell_cache[pair] = stats
+            dwell.append(DwellStats(
+                STAGES[pair // _K], STAGES[pair % _K], len(self._dwell[pair]), stats[0], stats[1],
+            ))
+
+        # reached[k]: jobs whose furthest stage is k or later
+        reached = []
+        total = 0
+        for n in reversed(self._furthest_hist):
+            total += n
+            reached.append(total)
+        reached.reverse()
+        conversion = tuple(
+            (FUNNEL[k], FUNNEL[k + 1], reached[k], (reached[k + 1] / reached[k]) if reached[k] else 0.0)
+            for k in range(len(FUNNEL) - 1)
+        )
+
+        return FlowSnapshot(
+            dwell=tuple(dwell),
+            conversion=conversion,
+            weekly_applied=self.weekly_applied(weeks),
+            events=self._events,
+        )
+
+    def weekly_applied(self, weeks: int = 12, today: Optional[date] = None) -> Tuple[Tuple[str, int], ...]:
+        """Last `weeks` Monday-aligned weeks up to today (zeros included)."""
+        today = today or date.today()
+        this_week = (today.toordinal() - date(1970, 1, 1).toordinal() + 3) // 7
+        epoch_monday = date(1970, 1, 1) - timedelta(days=3)
+        return tuple(
+            ((epoch_monday + timedelta(weeks=w)).isoformat(), self._weekly.get(w, 0))
+            for w in range(this_week - weeks + 1, this_week + 1)
+        )
@@ -0,0 +1,122 @@
+# services/journal.py
+from __future__ import annotations
+
+import threading
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+
+def _now() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+class ActivityJournal:
+    """
+    Write-behind journal for `job_events` (structured status transitions)
+    and `activity` (free-text "Recent Moves" lines).
+
+    record_job_event()/log() only append to an in-memory queue, so callers
+    (e.g. a drag-and-drop handler) never wait on SQLite. A background thread
+    flushes the queue every `flush_interval` seconds, or sooner once
+    `max_pending` entries are waiting, in one transaction; close() flushes
+    whatever is left (CareerDB.close() calls it).
+    """
+
+    def __init__(self, db, flush_interval: float = 1.0, max_pending: int = 500):
+        self.db = db
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # one writer at a time, keeps order
+        self._job_events: List[Tuple[int, Optional[str], Optional[str], str]] = []
+        self._activity: List[Tuple[str, str]] = []
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    # --------------------------------------------------------------
+    def record_job_event(
+        self,
+        job_id: int,
+        from_status: Optional[str],
+        to_status: Optional[str],
+        ts: Optional[str] = None,
+    ) -> None:
+        """from_status=None: job created; to_status=None: job deleted."""
+        self._enqueue(job_events=[(int(job_id), from_status, to_status, ts or _now())])
+
+    def record_job_events(self, rows: List[Tuple[int, Optional[str], Optional[str], str]]) -> None:
+        self._enqueue(job_events=list(rows))
+
+    def log(self, message: str, ts: Optional[str] = None) -> None:
+        self._enqueue(activity=[(ts or _now(), message)])
+
+    def _enqueue(self, job_events=(), activity=()) -> None:
+        with self._lock:
+            self._job_events.extend(job_events)
+            self._activity.extend(activity)
+            pending = len(self._job_events) + len(self._activity)
+            if self._closed:
+                # after shutdown there is no flusher; write through
+                self._wake.set()
+            elif self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="journal", daemon=True)
+                self._thread.start()
+        if self._closed:
+            self.flush()
+        elif pending >= self.max_pending:
+            self._wake.set()
+
+    # --------------------------------------------------------------
+    def recent_activity(self, limit: int = 30) -> List[Tuple[str, str]]:
+        """(ts, message) newest first, including entries not flushed yet."""
+        with self._lock:
+            pending = list(reversed(self._activity))[:limit]
+        if len(pending) >= limit:
+            return pending
+        with self.db._read() as conn:
+            rows = conn.execute(
+                "SELECT ts, message FROM activity ORDER BY id DESC LIMIT ?",
+                (limit - len(pending),),
+            ).fetchall()
+        return pending + rows
+
+    # --------------------------------------------------------------
+    def flush(self) -> None:
+        with self._flush_lock:
+            with self._lock:
+                job_events, self._job_events = self._job_events, []
+                activity, self._activity = self._activity, []
+            if not job_events and not activity:
+                return
+            try:
+                with self.db._conn() as conn:
+                    conn.executemany(
+                        "INSERT INTO job_events (job_id, from_status, to_status, ts) VALUES (?, ?, ?, ?)",
+                        job_events,
+                    )
+                    conn.executemany("INSERT INTO activity (ts, message) VALUES (?, ?)", activity)
+            except Exception as e:
+                # put them back in front; the next flush retries
+                with self._lock:
+                    self._job_events[:0] = job_events
+                    self._activity[:0] = activity
+                print("ActivityJournal flush error:", e)
+
+    def _run(self) -> None:
+        try:
+            while not self._closed:
+                self._wake.wait(self.flush_interval)
+                self._wake.clear()
+                self.flush()
+        finally:
+            self.db.close_thread()
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+        self._wake.set()
+        if thread is not None:
+            thread.join(timeout=5)
+        self.flush()
@@ -0,0 +1,516 @@
+# services/migrations.py
+from __future__ import annotations
+
+import sqlite3
+from typing import Callable, Iterator, List, Optional, Tuple, Union
+
+from services.db_locking import RetryPolicy, WriteLock
+
+# A step is either a SQL script or a callable that receives the connection
+# (use a callable when the migration needs Python-side backfilling).
+Step = Union[str, Callable[[sqlite3.Connection], None]]
+
+
+# --------------------------------------------------------------
+# v1: baseline schema (what CareerDB / the pages used to create ad hoc)
+# --------------------------------------------------------------
+_V1_BASELINE = """
+CREATE TABLE IF NOT EXISTS jobs(
+    id INTEGER PRIMARY KEY,
+    company TEXT,
+    role TEXT,
+    status TEXT,
+    link TEXT,
+    notes TEXT,
+    date_added TEXT
+);
+CREATE TABLE IF NOT EXISTS notes(
+    id INTEGER PRIMARY KEY,
+    content TEXT
+);
+CREATE TABLE IF NOT EXISTS settings(
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS files(
+    id INTEGER PRIMARY KEY,
+    filename TEXT,
+    original_name TEXT,
+    category TEXT,
+    date_added TEXT
+);
+CREATE TABLE IF NOT EXISTS reminders(
+    id INTEGER PRIMARY KEY,
+    title TEXT,
+    description TEXT,
+    date TEXT,
+    time TEXT,
+    category TEXT,
+    notified INTEGER DEFAULT 0
+);
+
+-- ---------------------------
+-- AI: conversations + memory
+-- ---------------------------
+CREATE TABLE IF NOT EXISTS ai_conversations(
+    id INTEGER PRIMARY KEY,
+    title TEXT,
+    created_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS ai_messages(
+    id INTEGER PRIMARY KEY,
+    conversation_id INTEGER,
+    ts TEXT,
+    role TEXT,
+    content TEXT,
+    FOREIGN KEY(conversation_id) REFERENCES ai_conversations(id)
+);
+
+CREATE TABLE IF NOT EXISTS ai_memories(
+    id INTEGER PRIMARY KEY,
+    ts TEXT,
+    type TEXT,
+    content TEXT,
+    importance INTEGER DEFAULT 5,
+    pinned INTEGER DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS ai_summaries(
+    id INTEGER PRIMARY KEY,
+    scope TEXT,
+    ts TEXT,
+    summary_text TEXT
+);
+
+-- ---------------------------
+-- Page-owned tables (were created lazily by ui_qt pages)
+-- ---------------------------
+CREATE TABLE IF NOT EXISTS activity(
+    id INTEGER PRIMARY KEY,
+    ts TEXT,
+    message TEXT
+);
+
+CREATE TABLE IF NOT EXISTS note_items(
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    content TEXT NOT NULL,
+    updated_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%d %H:%M:%S','now'))
+);
+"""
+
+
+# --------------------------------------------------------------
+# v2: indexes for the hot access paths
+# --------------------------------------------------------------
+_V2_INDEXES = """
+-- get_all_jobs (ORDER BY date_added DESC)
+CREATE INDEX IF NOT EXISTS idx_jobs_date_added ON jobs(date_added);
+-- get_jobs_by_status (WHERE status=? ORDER BY date_added DESC)
+CREATE INDEX IF NOT EXISTS idx_jobs_status_date ON jobs(status, date_added);
+
+-- list_files (ORDER BY date_added DESC, optional WHERE category=?)
+CREATE INDEX IF NOT EXISTS idx_files_date_added ON files(date_added);
+CREATE INDEX IF NOT EXISTS idx_files_category_date ON files(category, date_added);
+
+-- list_reminders_for_date + CalendarPage range query (date range, ORDER BY date, time)
+CREATE INDEX IF NOT EXISTS idx_reminders_date_time ON reminders(date, time);
+
+-- ai_get_messages (WHERE conversation_id=? ORDER BY id DESC LIMIT ?)
+CREATE INDEX IF NOT EXISTS idx_ai_messages_conv ON ai_messages(conversation_id, id);
+
+-- ai_list_memories (ORDER BY pinned DESC, importance DESC, id DESC)
+CREATE INDEX IF NOT EXISTS idx_ai_memories_rank ON ai_memories(pinned, importance, id);
+
+-- ai_get_latest_summary (WHERE scope=? ORDER BY id DESC LIMIT 1)
+CREATE INDEX IF NOT EXISTS idx_ai_summaries_scope ON ai_summaries(scope, id);
+
+-- NotepadPage list (ORDER BY updated_at DESC)
+CREATE INDEX IF NOT EXISTS idx_note_items_updated ON note_items(updated_at);
+"""
+
+
+# --------------------------------------------------------------
+# v3: per-table modification counters (cross-process change detection)
+# --------------------------------------------------------------
+# Tables whose writes bump table_versions.version (see services/data_version.py).
+VERSIONED_TABLES = (
+    "jobs", "reminders", "files", "notes", "note_items", "activity",
+    "ai_conversations", "ai_messages", "ai_memories", "ai_summaries", "settings",
+)
+
+
+def _v3_table_versions(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS table_versions(
+            name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID
+        """
+    )
+    for table in VERSIONED_TABLES:
+        conn.execute("INSERT OR IGNORE INTO table_versions(name, version) VALUES (?, 0)", (table,))
+        for op in ("INSERT", "UPDATE", "DELETE"):
+            conn.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{table}_ver_{op.lower()}
+                AFTER {op} ON {table}
+                BEGIN
+                    UPDATE table_versions SET version = version + 1 WHERE name = '{table}';
+                END
+                """
+            )
+
+
+# --------------------------------------------------------------
+# v4: reminders.due_at ("YYYY-MM-DD HH:MM", indexed) for range/upcoming queries
+# --------------------------------------------------------------
+# Must match CareerDB.due_at(); a blank time sorts as midnight.
+_DUE_AT_EXPR = """{r}.date || ' ' || CASE
+    WHEN {r}.time IS NULL OR {r}.time = '' THEN '00:00'
+    WHEN length({r}.time) = 4 THEN '0' || {r}.time
+    ELSE substr({r}.time, 1, 5)
+END"""
+
+_V4_DUE_AT = f"""
+ALTER TABLE reminders ADD COLUMN due_at TEXT;
+UPDATE reminders SET due_at = {_DUE_AT_EXPR.format(r="reminders")};
+CREATE INDEX IF NOT EXISTS idx_reminders_due_at ON reminders(due_at);
+
+-- CareerDB fills due_at itself; these keep writers that only set date/time in sync.
+CREATE TRIGGER IF NOT EXISTS trg_reminders_due_at_insert
+AFTER INSERT ON reminders WHEN NEW.due_at IS NULL
+BEGIN
+    UPDATE reminders SET due_at = {_DUE_AT_EXPR.format(r="NEW")} WHERE id = NEW.id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_reminders_due_at_update
+AFTER UPDATE OF date, time ON reminders WHEN NEW.due_at IS OLD.due_at
+BEGIN
+    UPDATE reminders SET due_at = {_DUE_AT_EXPR.format(r="NEW")} WHERE id = NEW.id;
+END;
+"""
+
+
+# --------------------------------------------------------------
+# v5: job_status_counts (trigger-maintained per-status totals for Analytics)
+# --------------------------------------------------------------
+# NULL status is counted under ''.
+_V5_JOB_STATUS_COUNTS = """
+CREATE TABLE IF NOT EXISTS job_status_counts(
+    status TEXT PRIMARY KEY,
+    n INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+DELETE FROM job_status_counts;
+INSERT INTO job_status_counts(status, n)
+SELECT COALESCE(status, ''), COUNT(*) FROM jobs GROUP BY COALESCE(status, '');
+
+CREATE TRIGGER IF NOT EXISTS trg_jobs_status_count_insert
+AFTER INSERT ON jobs
+BEGIN
+    INSERT INTO job_status_counts(status, n) VALUES (COALESCE(NEW.status, ''), 1)
+    ON CONFLICT(status) DO UPDATE SET n = n + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_jobs_status_count_delete
+AFTER DELETE ON jobs
+BEGIN
+    UPDATE job_status_counts SET n = n - 1 WHERE status = COALESCE(OLD.status, '');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_jobs_status_count_update
+AFTER UPDATE OF status ON jobs WHEN OLD.status IS NOT NEW.status
+BEGIN
+    UPDATE job_status_counts SET n = n - 1 WHERE status = COALESCE(OLD.status, '');
+    INSERT INTO job_status_counts(status, n) VALUES (COALESCE(NEW.status, ''), 1)
+    ON CONFLICT(status) DO UPDATE SET n = n + 1;
+END;
+"""
+
+
+# --------------------------------------------------------------
+# v6: covering index for the job card projection (no notes)
+# --------------------------------------------------------------
+# notes sits before date_added in the row, so reading date_added from the table
+# walks long notes' overflow pages; the card query is served from this index alone.
+_V6_JOB_CARDS_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_jobs_cards ON jobs(date_added, status, company, role);
+-- prefix of idx_jobs_cards
+DROP INDEX IF EXISTS idx_jobs_date_added;
+"""
+
+
+# --------------------------------------------------------------
+# v7: indexes for keyset pagination
+# --------------------------------------------------------------
+_V7_PAGE_INDEXES = """
+-- list_jobs_page / list_job_cards: (date_added, id) ordering, still covering
+CREATE INDEX IF NOT EXISTS idx_jobs_page ON jobs(date_added, id, status, company, role);
+DROP INDEX IF EXISTS idx_jobs_cards;
+
+-- list_files_page(order="name" / "name_desc")
+CREATE INDEX IF NOT EXISTS idx_files_name ON files(original_name COLLATE NOCASE);
+"""
+
+
+# --------------------------------------------------------------
+# v8: job_events (structured status transitions, appended by ActivityJournal)
+# --------------------------------------------------------------
+# from_status NULL = job created, to_status NULL = job deleted. No FK to jobs:
+# history outlives the job. Existing jobs get a "created" event at date_added
+# so stage durations have a starting point.
+def _v8_job_events(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS job_events(
+            id INTEGER PRIMARY KEY,
+            job_id INTEGER NOT NULL,
+            from_status TEXT,
+            to_status TEXT,
+            ts TEXT NOT NULL
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_job_events_job_ts ON job_events(job_id, ts)")
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_job_events_ts ON job_events(ts)")
+    conn.execute(
+        """
+        INSERT INTO job_events(job_id, from_status, to_status, ts)
+        SELECT id, NULL, status, COALESCE(date_added, date('now')) || ' 00:00:00'
+        FROM jobs ORDER BY id
+        """
+    )
+
+    conn.execute("INSERT OR IGNORE INTO table_versions(name, version) VALUES ('job_events', 0)")
+    for op in ("INSERT", "UPDATE", "DELETE"):
+        conn.execute(
+            f"""
+            CREATE TRIGGER IF NOT EXISTS trg_job_events_ver_{op.lower()}
+            AFTER {op} ON job_events
+            BEGIN
+                UPDATE table_versions SET version = version + 1 WHERE name = 'job_events';
+            END
+            """
+        )
+
+
+# --------------------------------------------------------------
+# v9: job_daily_stats / job_weekly_stats (trend rollups, see services/rollups.py)
+# --------------------------------------------------------------
+def _v9_job_rollups(conn: sqlite3.Connection) -> None:
+    from services.rollups import STAT_COLUMNS, STATUS_COLUMNS, WEEK_EXPR, rebuild
+
+    counters = ",\n".join(f"    {c} INTEGER NOT NULL DEFAULT 0" for c in STAT_COLUMNS)
+    for table, key in (("job_daily_stats", "day"), ("job_weekly_stats", "week")):
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {table}(\n    {key} TEXT PRIMARY KEY,\n{counters}\n) WITHOUT ROWID")
+
+    day = "date(NEW.date_added)"
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_jobs_rollup_insert
+        AFTER INSERT ON jobs WHEN {day} IS NOT NULL
+        BEGIN
+            INSERT INTO job_daily_stats(day, added) VALUES ({day}, 1)
+            ON CONFLICT(day) DO UPDATE SET added = added + 1;
+            INSERT INTO job_weekly_stats(week, added) VALUES ({WEEK_EXPR.format(d=day)}, 1)
+            ON CONFLICT(week) DO UPDATE SET added = added + 1;
+        END
+        """
+    )
+    day = "date(OLD.date_added)"
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_jobs_rollup_delete
+        AFTER DELETE ON jobs WHEN {day} IS NOT NULL
+        BEGIN
+            UPDATE job_daily_stats SET added = added - 1 WHERE day = {day};
+            UPDATE job_weekly_stats SET added = added - 1 WHERE week = {WEEK_EXPR.format(d=day)};
+        END
+        """
+    )
+
+    day = "date(NEW.ts)"
+    columns = ", ".join(STATUS_COLUMNS.values())
+    values = ", ".join(f"NEW.to_status = '{status}'" for status in STATUS_COLUMNS)
+    updates = ", ".join(f"{c} = {c} + excluded.{c}" for c in STATUS_COLUMNS.values())
+    statuses = ", ".join(f"'{status}'" for status in STATUS_COLUMNS)
+    conn.execute(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS trg_job_events_rollup_insert
+        AFTER INSERT ON job_events
+        WHEN NEW.to_status IN ({statuses}) AND NEW.from_status IS NOT NEW.to_status
+             AND {day} IS NOT NULL
+        BEGIN
+            INSERT INTO job_daily_stats(day, {columns}) VALUES ({day}, {values})
+            ON CONFLICT(day) DO UPDATE SET {updates};
+            INSERT INTO job_weekly_stats(week, {columns}) VALUES ({WEEK_EXPR.format(d=day)}, {values})
+            ON CONFLICT(week) DO UPDATE SET {updates};
+        END
+        """
+    )
+
+    rebuild(conn)
+
+
+# --------------------------------------------------------------
+# v10: deleting a conversation removes its messages and summaries
+# --------------------------------------------------------------
+# ai_messages' FOREIGN KEY has no ON DELETE CASCADE (and foreign_keys is off);
+# changing it would mean rebuilding the table, so the cascade is a trigger.
+_V10_AI_CONVERSATION_CASCADE = """
+CREATE TRIGGER IF NOT EXISTS trg_ai_conversations_delete_cascade
+AFTER DELETE ON ai_conversations
+BEGIN
+    DELETE FROM ai_messages WHERE conversation_id = OLD.id;
+    DELETE FROM ai_summaries WHERE scope = 'conversation:' || OLD.id;
+END;
+"""
+
+
+# --------------------------------------------------------------
+# v11: document text extraction cache (services/extract_cache.py)
+# --------------------------------------------------------------
+# Keyed by file content, so renamed/copied files hit and edited files miss;
+# extraction_paths remembers the hash per path so unchanged files aren't re-read.
+_V11_EXTRACTION_CACHE = """
+CREATE TABLE IF NOT EXISTS extraction_cache(
+    content_hash TEXT NOT NULL,
+    extractor_version TEXT NOT NULL,
+    label TEXT NOT NULL,
+    text TEXT NOT NULL,
+    truncated INTEGER NOT NULL DEFAULT 0,
+    page_count INTEGER,
+    extract_ms REAL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (content_hash, extractor_version)
+);
+
+CREATE TABLE IF NOT EXISTS extraction_paths(
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    content_hash TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_extraction_paths_hash ON extraction_paths(content_hash);
+"""
+
+_V12_CV_PROFILES = """
+CREATE TABLE IF NOT EXISTS cv_profiles(
+    content_hash TEXT NOT NULL,
+    analyzer_version INTEGER NOT NULL,
+    profile TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (content_hash, analyzer_version)
+);
+"""
+
+
+# --------------------------------------------------------------
+# v13: non-NULL sort keys for keyset pagination
+# --------------------------------------------------------------
+# A row-value cursor never matches NULL, so pages are ordered by expressions
+# that cannot be NULL. CareerDB orders by these exact strings so SQLite can
+# use the expression indexes below; edit both together.
+JOB_DATE_KEY = "COALESCE(date_added, '')"
+# files: what the vault displays. Unparseable / missing dates sort as the
+# oldest (the old _safe_date_key), legacy "CV/Resume" spellings group as "cv".
+FILE_DATE_KEY = "CASE WHEN date(date_added) = date_added THEN date_added ELSE '' END"
+FILE_NAME_KEY = "COALESCE(original_name, '') COLLATE NOCASE"
+FILE_CATEGORY_KEY = (
+    "CASE WHEN lower(trim(category, ' ' || char(9, 10, 13))) IN "
+    "('cv/resume', 'cv_resume', 'cv-resume', 'cv/resumé', 'cv/resumÉ') THEN 'cv' "
+    "ELSE lower(trim(COALESCE(category, ''), ' ' || char(9, 10, 13))) END"
+)
+
+_V13_PAGE_SORT_KEYS = f"""
+-- list_jobs_page / list_job_cards / get_all_jobs, still covering for cards
+CREATE INDEX IF NOT EXISTS idx_jobs_page_key ON jobs({JOB_DATE_KEY}, id, status, company, role, date_added);
+DROP INDEX IF EXISTS idx_jobs_page;
+-- list_jobs_page(status) / get_jobs_by_status
+CREATE INDEX IF NOT EXISTS idx_jobs_status_page_key ON jobs(status, {JOB_DATE_KEY});
+DROP INDEX IF EXISTS idx_jobs_status_date;
+
+-- list_files_page(order=...)
+CREATE INDEX IF NOT EXISTS idx_files_date_key ON files({FILE_DATE_KEY});
+CREATE INDEX IF NOT EXISTS idx_files_name_key ON files({FILE_NAME_KEY});
+DROP INDEX IF EXISTS idx_files_name;
+CREATE INDEX IF NOT EXISTS idx_files_category_key ON files({FILE_CATEGORY_KEY});
+"""
+
+
+# Append-only. Never edit a shipped step; add a new version instead.
+MIGRATIONS: List[Tuple[int, str, Step]] = [
+    (1, "baseline schema", _V1_BASELINE),
+    (2, "hot-path indexes", _V2_INDEXES),
+    (3, "table modification counters", _v3_table_versions),
+    (4, "reminders.due_at", _V4_DUE_AT),
+    (5, "job_status_counts", _V5_JOB_STATUS_COUNTS),
+    (6, "job cards covering index", _V6_JOB_CARDS_INDEX),
+    (7, "keyset pagination indexes", _V7_PAGE_INDEXES),
+    (8, "job_events", _v8_job_events),
+    (9, "job trend rollups", _v9_job_rollups),
+    (10, "conversation delete cascade", _V10_AI_CONVERSATION_CASCADE),
+    (11, "extraction cache", _V11_EXTRACTION_CACHE),
+    (12, "cv profiles", _V12_CV_PROFILES),
+    (13, "non-NULL page sort keys", _V13_PAGE_SORT_KEYS),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    return int(conn.execute("PRAGMA user_version").fetchone()[0])
+
+
+def _statements(script: str) -> Iterator[str]:
+    """Split a migration script into statements (trigger bodies and comments may hold ';')."""
+    buf = ""
+    for part in script.split(";"):
+        buf += part + ";"
+        if sqlite3.complete_statement(buf):
+            if buf.strip(" \t\r\n;"):
+                yield buf
+            buf = ""
+
+
+def migrate(conn: sqlite3.Connection, lock: Optional[WriteLock] = None) -> int:
+    """
+    Bring the database up to LATEST_VERSION.
+    Each step runs in its own transaction together with its user_version bump,
+    so a failed step leaves the db at the previous version.
+
+    The write lock is taken through `lock` (retried like any CareerDB writer)
+    and user_version is re-read under it: when several processes open a fresh
+    db at once, only the first to get the lock applies a step, the others see
+    the new version and skip it.
+    Returns the resulting version.
+    """
+    lock = lock or WriteLock(RetryPolicy())
+    conn.commit()
+    current = schema_version(conn)
+
+    for version, _name, step in MIGRATIONS:
+        if version <= current:
+            continue
+        lock.begin(conn)
+        try:
+            current = schema_version(conn)
+            if version > current:
+                if callable(step):
+                    step(conn)
+                else:
+                    # not executescript(): it would COMMIT and drop the lock first
+                    for statement in _statements(step):
+                        conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {int(version)}")
+                current = version
+            conn.commit()
+        except Exception:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+
+    return current
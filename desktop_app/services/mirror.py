@@ -0,0 +1,170 @@
+# services/mirror.py
+from __future__ import annotations
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Statement kinds replayed into the mirror after the disk commit.
+_WRITE_VERBS = ("INSERT", "UPDATE", "DELETE", "REPLACE", "CREATE", "DROP", "ALTER")
+
+Statement = Tuple[str, Any, bool]  # (sql, params, is_executemany)
+
+
+def _is_write(sql: str) -> bool:
+    return sql.lstrip().upper().startswith(_WRITE_VERBS)
+
+
+class RecordingCursor:
+    """sqlite3.Cursor stand-in that logs write statements for MemoryMirror.apply()."""
+
+    def __init__(self, cursor: sqlite3.Cursor, log: List[Statement]):
+        self._cursor = cursor
+        self._log = log
+
+    def execute(self, sql: str, params: Any = ()):
+        self._cursor.execute(sql, params)
+        if _is_write(sql):
+            self._log.append((sql, params, False))
+        return self
+
+    def executemany(self, sql: str, seq: Iterable[Any]):
+        rows = list(seq)  # replayed later: generators must be materialised
+        self._cursor.executemany(sql, rows)
+        if _is_write(sql):
+            self._log.append((sql, rows, True))
+        return self
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __getattr__(self, name: str):
+        return getattr(self._cursor, name)
+
+
+class RecordingConnection:
+    """
+    sqlite3.Connection stand-in handed out by CareerDB._conn() in mirror mode.
+    commit() goes through `on_commit`, which commits and replays in one step.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, log: List[Statement], on_commit: Callable[[], None]):
+        self._conn = conn
+        self._log = log
+        self._on_commit = on_commit
+
+    def commit(self) -> None:
+        self._on_commit()
+
+    def cursor(self) -> RecordingCursor:
+        return RecordingCursor(self._conn.cursor(), self._log)
+
+    def execute(self, sql: str, params: Any = ()) -> RecordingCursor:
+        return self.cursor().execute(sql, params)
+
+    def executemany(self, sql: str, seq: Iterable[Any]) -> RecordingCursor:
+        return self.cursor().executemany(sql, seq)
+
+    def __getattr__(self, name: str):
+        return getattr(self._conn, name)
+
+
+class MemoryMirror:
+    """
+    A :memory: copy of the database (sqlite3 backup API) for reads.
+
+    CareerDB replays every committed write into it (same statements, same
+    triggers, so ids and derived tables match) and compares table_versions
+    with the disk db before serving a read; on a mismatch it reads from disk
+    and reloads the mirror. One connection, serialised by a lock: reads from
+    memory are short enough that a pool isn't worth it.
+    """
+
+    def __init__(self, db_path: Path, max_bytes: int):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self.versions: Dict[str, int] = {}
+        self.ready = False
+
+    # --------------------------------------------------------------
+    def disk_bytes(self) -> int:
+        src = sqlite3.connect(str(self.db_path))
+        try:
+            page_size = src.execute("PRAGMA page_size").fetchone()[0]
+            used = src.execute("PRAGMA page_count").fetchone()[0] - src.execute("PRAGMA freelist_count").fetchone()[0]
+            return page_size * used
+        finally:
+            src.close()
+
+    def load(self) -> bool:
+        """(Re)copy the disk db; False if it is over the memory ceiling."""
+        with self._lock:
+            self.ready = False
+        size = self.disk_bytes()
+        if size > self.max_bytes:
+            print(f"Memory mirror disabled: database is {size // 2**20} MB, ceiling {self.max_bytes // 2**20} MB")
+            return False
+
+        mem = sqlite3.connect(":memory:", check_same_thread=False)
+        src = sqlite3.connect(str(self.db_path))
+        try:
+            # the copy is built without holding the mirror lock: reads use disk meanwhile
+            src.backup(mem, pages=1024)
+        finally:
+            src.close()
+        versions = dict(mem.execute("SELECT name, version FROM table_versions").fetchall())
+
+        with self._lock:
+            old, self._conn = self._conn, mem
+            self.versions = versions
+            self.ready = True
+        if old is not None:
+            old.close()
+        return True
+
+    def size_bytes(self) -> int:
+        with self._lock:
+            if self._conn is None:
+                return 0
+            page_size = self._conn.execute("PRAGMA page_size").fetchone()[0]
+            return page_size * self._conn.execute("PRAGMA page_count").fetchone()[0]
+
+    # --------------------------------------------------------------
+    @contextmanager
+    def read(self):
+        with self._lock:
+            yield self._conn
+
+    def apply(self, statements: List[Statement]) -> bool:
+        """Replay a committed disk transaction; False (and not ready) if it fails."""
+        with self._lock:
+            if not self.ready or self._conn is None:
+                return False
+            try:
+                with self._conn:
+                    for sql, params, many in statements:
+                        if many:
+                            self._conn.executemany(sql, params)
+                        else:
+                            self._conn.execute(sql, params)
+                self.versions = dict(self._conn.execute("SELECT name, version FROM table_versions").fetchall())
+                return True
+            except sqlite3.Error as e:
+                print("Memory mirror out of sync:", e)
+                self.ready = False
+                return False
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self.ready = False
+
+    def close(self) -> None:
+        with self._lock:
+            self.ready = False
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,265 @@
+# services/retention.py
+from __future__ import annotations
+
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from services import events
+
+# (previous summary, [(role, content, ts), ...] oldest first) -> new summary
+Summarizer = Callable[[str, List[Tuple[str, str, str]]], str]
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    compact_after_days: int = 30      # conversation idle this long -> compact
+    keep_recent: int = 20             # newest messages always stay in the hot db
+    archive: bool = True              # move compacted messages to the archive db (else delete)
+    vacuum_pages: int = 2000          # pages returned to the OS per run
+    interval_s: float = 6 * 3600
+    initial_delay_s: float = 120.0    # don't compete with startup
+
+
+@dataclass(frozen=True)
+class RetentionReport:
+    conversations_compacted: int = 0
+    messages_archived: int = 0
+    messages_deleted: int = 0
+    pages_freed: int = 0
+
+
+def extractive_summary(previous: str, rows: List[Tuple[str, str, str]], max_chars: int = 4000) -> str:
+    """
+    Offline default: keeps what the user asked, one line per message, newest
+    kept when over budget. Pass an LLM-backed Summarizer for real summaries.
+    """
+    lines = [ln for ln in previous.splitlines() if ln.strip()]
+    for role, content, ts in rows:
+        if role != "user":
+            continue
+        text = " ".join(str(content).split())
+        if text:
+            lines.append(f"- [{str(ts)[:10]}] {text[:200]}")
+    out: List[str] = []
+    size = 0
+    for ln in reversed(lines):
+        size += len(ln) + 1
+        if size > max_chars:
+            break
+        out.append(ln)
+    return "\n".join(reversed(out))
+
+
+class RetentionEngine:
+    """
+    Keeps ai_messages from growing forever, on a background schedule:
+
+    1. Conversations idle for `compact_after_days` with more than
+       `keep_recent` messages are compacted: the older messages are folded
+       into the conversation's ai_summaries row (scope "conversation:<id>")
+       and then moved to the archive database (or deleted).
+    2. Freed pages are handed back with PRAGMA incremental_vacuum, once the
+       db is in auto_vacuum=INCREMENTAL mode (new dbs are; older ones switch
+       through enable_incremental_vacuum(), a user-triggered maintenance step).
+
+    start() begins the schedule, run_once() does one pass now, close() stops
+    the thread (call before CareerDB.close()).
+    """
+
+    def __init__(
+        self,
+        db,
+        policy: RetentionPolicy = RetentionPolicy(),
+        archive_path: Optional[Path] = None,
+        summarizer: Summarizer = extractive_summary,
+    ):
+        self.db = db
+        self.policy = policy
+        self.archive_path = archive_path or Path(db.db_path).with_name(
+            Path(db.db_path).stem + "_archive.db"
+        )
+        self.summarizer = summarizer
+        self._run_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_report: Optional[RetentionReport] = None
+
+    # --------------------------------------------------------------
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="retention", daemon=True)
+            self._thread.start()
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+            self._thread = None
+
+    def _run(self) -> None:
+        try:
+            delay = self.policy.initial_delay_s
+            while not self._stop.wait(delay):
+                try:
+                    self.last_report = self.run_once()
+                except Exception as e:
+                    print("Retention run error:", e)
+                delay = self.policy.interval_s
+        finally:
+            self.db.close_thread()
+
+    # --------------------------------------------------------------
+    def run_once(self, now: Optional[datetime] = None) -> RetentionReport:
+        with self._run_lock:
+            compacted = archived = deleted = 0
+            for conversation_id, cutoff_id in self._candidates(now or datetime.now()):
+                if self._stop.is_set():
+                    break
+                n = self._compact(conversation_id, cutoff_id)
+                compacted += 1
+                if self.policy.archive:
+                    archived += n
+                else:
+                    deleted += n
+            freed = self._incremental_vacuum()
+            return RetentionReport(compacted, archived, deleted, freed)
+
+    def _candidates(self, now: datetime) -> List[Tuple[int, int]]:
+        """(conversation_id, first message id to keep) for idle, long conversations."""
+        idle_before = (now - timedelta(days=self.policy.compact_after_days)).strftime("%Y-%m-%d %H:%M:%S")
+        keep = self.policy.keep_recent
+        with self.db._read() as conn:
+            rows = conn.execute(
+                """
+                SELECT c.id,
+                       (SELECT ts FROM ai_messages m
+                         WHERE m.conversation_id = c.id ORDER BY m.id DESC LIMIT 1),
+                       (SELECT id FROM ai_messages m
+                         WHERE m.conversation_id = c.id ORDER BY m.id DESC LIMIT 1 OFFSET ?)
+                FROM ai_conversations c
+                """,
+                (max(keep - 1, 0),),
+            ).fetchall()
+            out = []
+            for cid, last_ts, keep_from in rows:
+                if last_ts is None or keep_from is None or last_ts >= idle_before:
+                    continue
+                older = conn.execute(
+                    "SELECT 1 FROM ai_messages WHERE conversation_id=? AND id < ? LIMIT 1",
+                    (cid, keep_from),
+                ).fetchone()
+                if older:
+                    out.append((cid, keep_from))
+        return out
+
+    def _compact(self, conversation_id: int, keep_from: int) -> int:
+        scope = self.db.ai_conversation_scope(conversation_id)
+        with self.db._read() as conn:
+            rows = conn.execute(
+                """SELECT role, content, ts FROM ai_messages
+                   WHERE conversation_id=? AND id < ? ORDER BY id""",
+                (conversation_id, keep_from),
+            ).fetchall()
+            previous = conn.execute(
+                "SELECT summary_text FROM ai_summaries WHERE scope=? ORDER BY id DESC LIMIT 1",
+                (scope,),
+            ).fetchone()
+        # summarising may be slow (e.g. an LLM); no transaction is open meanwhile
+        summary = self.summarizer(previous[0] if previous else "", rows)
+
+        conn = self.db._pool.get()
+        attached = False
+        try:
+            if self.policy.archive:
+                conn.commit()
+                conn.execute("ATTACH DATABASE ? AS archive", (str(self.archive_path),))
+                attached = True
+                conn.execute(
+                    """CREATE TABLE IF NOT EXISTS archive.ai_messages(
+                           id INTEGER PRIMARY KEY,
+                           conversation_id INTEGER,
+                           ts TEXT,
+                           role TEXT,
+                           content TEXT,
+                           archived_at TEXT
+                       )"""
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS archive.idx_archive_messages_conv "
+                    "ON ai_messages(conversation_id, id)"
+                )
+                conn.commit()
+
+            with self.db._conn() as tx:
+                if self.policy.archive:
+                    # OR IGNORE: a crash between the two databases' commits can't duplicate rows.
+                    # Same transaction, but through `conn`, not `tx`: in mirror mode tx
+                    # records statements for replay, and the mirror has no archive schema.
+                    conn.execute(
+                        """INSERT OR IGNORE INTO archive.ai_messages
+                               (id, conversation_id, ts, role, content, archived_at)
+                           SELECT id, conversation_id, ts, role, content, ?
+                           FROM main.ai_messages WHERE conversation_id=? AND id < ?""",
+                        (datetime.now().strftime("%Y-%m-%d %H:%M:%S"), conversation_id, keep_from),
+                    )
+                cur = tx.execute(
+                    "DELETE FROM main.ai_messages WHERE conversation_id=? AND id < ?",
+                    (conversation_id, keep_from),
+                )
+                moved = cur.rowcount
+                tx.execute("DELETE FROM main.ai_summaries WHERE scope=?", (scope,))
+                tx.execute(
+                    "INSERT INTO main.ai_summaries (scope, ts, summary_text) VALUES (?, ?, ?)",
+                    (scope, datetime.now().strftime("%Y-%m-%d %H:%M:%S"), summary),
+                )
+        finally:
+            if attached:
+                conn.execute("DETACH DATABASE archive")
+
+        self.db.events.publish(events.SummarySaved(scope))
+        return moved
+
+    # --------------------------------------------------------------
+    def incremental_vacuum_enabled(self) -> bool:
+        # own connection: a pooled one can report the header from before a VACUUM
+        conn = sqlite3.connect(str(self.db.db_path))
+        try:
+            return conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        finally:
+            conn.close()
+
+    def enable_incremental_vacuum(self) -> None:
+        """
+        Maintenance action (user-triggered): switch an existing db to
+        auto_vacuum=INCREMENTAL. That takes one full VACUUM, which holds the
+        write lock for as long as it runs, so the scheduled runs never do it;
+        until then they leave freed pages in place. New dbs start incremental
+        (services/db_pool.py).
+        """
+        with self._run_lock:
+            self.db.journal.flush()
+            conn = sqlite3.connect(str(self.db.db_path), timeout=30)
+            try:
+                conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                conn.execute("VACUUM")
+            finally:
+                conn.close()
+
+    def _incremental_vacuum(self) -> int:
+        conn = self.db._pool.get()
+        conn.commit()
+        try:
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                return 0
+            before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            conn.execute(f"PRAGMA incremental_vacuum({int(self.policy.vacuum_pages)})").fetchall()
+            after = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            return before - after
+        except sqlite3.OperationalError as e:
+            # e.g. another connection kept the db busy past busy_timeout: next run
+            print("Retention vacuum skipped:", e)
+            return 0
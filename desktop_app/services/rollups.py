@@ -0,0 +1,112 @@
+# services/rollups.py
+"""
+job_daily_stats / job_weekly_stats: per-day and per-week counters behind the
+Analytics trend charts.
+
+Kept current by triggers (migration v9): `added` counts the jobs that exist
+per date_added (inserts add, deletes subtract); a job_events row moving a job
+into Applied / Interviewing / Offer / Rejected counts on the day of its ts,
+and stays counted after the job is deleted (stage moves are history).
+
+rebuild() recomputes both tables from jobs + job_events in one streaming
+pass (e.g. after importing an old database):
+
+    python -m services.rollups [--db path/to/career_buddy.db]
+"""
+from __future__ import annotations
+
+import argparse
+import sqlite3
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List
+
+# counter columns, in table order
+STAT_COLUMNS = ("added", "applied", "interviews", "offers", "rejections")
+
+# job_events.to_status -> counter column
+STATUS_COLUMNS = {
+    "Applied": "applied",
+    "Interviewing": "interviews",
+    "Offer": "offers",
+    "Rejected": "rejections",
+}
+
+# SQLite expression for the Monday of a date's week (matches week_start()).
+WEEK_EXPR = "date({d}, 'weekday 0', '-6 days')"
+
+
+def week_start(day: date) -> date:
+    return day - timedelta(days=day.weekday())
+
+
+def rebuild(conn: sqlite3.Connection) -> int:
+    """
+    Replace both rollup tables with totals recomputed from history.
+    Runs on the caller's transaction; returns the number of source rows read.
+    """
+    col = {c: i for i, c in enumerate(STAT_COLUMNS)}
+    daily: Dict[str, List[int]] = {}
+    seen = 0
+
+    # one cursor over both sources; rows are consumed as they are stepped
+    cur = conn.execute(
+        """SELECT 'job', date(date_added), NULL, NULL FROM jobs
+           UNION ALL
+           SELECT 'event', date(ts), from_status, to_status FROM job_events"""
+    )
+    for source, day, frm, to in cur:
+        seen += 1
+        if day is None:
+            continue
+        if source == "job":
+            daily.setdefault(day, [0] * len(STAT_COLUMNS))[col["added"]] += 1
+            continue
+        column = STATUS_COLUMNS.get(to)
+        if column is not None and frm != to:
+            daily.setdefault(day, [0] * len(STAT_COLUMNS))[col[column]] += 1
+
+    weekly: Dict[str, List[int]] = {}
+    for day, counts in daily.items():
+        week = week_start(date.fromisoformat(day)).isoformat()
+        acc = weekly.setdefault(week, [0] * len(STAT_COLUMNS))
+        for i, n in enumerate(counts):
+            acc[i] += n
+
+    cols = ", ".join(STAT_COLUMNS)
+    marks = ", ".join("?" * (len(STAT_COLUMNS) + 1))
+    conn.execute("DELETE FROM job_daily_stats")
+    conn.execute("DELETE FROM job_weekly_stats")
+    conn.executemany(
+        f"INSERT INTO job_daily_stats (day, {cols}) VALUES ({marks})",
+        [(day, *counts) for day, counts in sorted(daily.items())],
+    )
+    conn.executemany(
+        f"INSERT INTO job_weekly_stats (week, {cols}) VALUES ({marks})",
+        [(week, *counts) for week, counts in sorted(weekly.items())],
+    )
+    return seen
+
+
+def main() -> None:
+    from services.db import DB_FILE, CareerDB
+
+    ap = argparse.ArgumentParser(description="Rebuild job_daily_stats / job_weekly_stats from history.")
+    ap.add_argument("--db", type=Path, default=DB_FILE)
+    args = ap.parse_args()
+
+    db = CareerDB(args.db)
+    try:
+        # pending journal rows first, so the rebuild sees every transition
+        db.journal.flush()
+        with db._conn() as conn:
+            rows = rebuild(conn)
+            days = conn.execute("SELECT COUNT(*) FROM job_daily_stats").fetchone()[0]
+            weeks = conn.execute("SELECT COUNT(*) FROM job_weekly_stats").fetchone()[0]
+        print(f"Rebuilt rollups from {rows} rows: {days} days, {weeks} weeks.")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
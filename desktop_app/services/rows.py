@@ -0,0 +1,114 @@
+# services/rows.py
+"""
+Row types returned by CareerDB, shared by the Qt pages and the Tk frames.
+
+They are NamedTuples: immutable, slotted (no per-row __dict__) and still
+tuples, so existing positional unpacking keeps working while new code reads
+fields by name. CareerDB builds them straight from the cursor with
+row_factory(), so a fetched row is never copied into a page-level dataclass.
+"""
+from __future__ import annotations
+
+import sqlite3
+from functools import lru_cache
+from typing import Callable, NamedTuple, Optional, Tuple, Type, TypeVar
+
+R = TypeVar("R", bound=tuple)
+
+
+@lru_cache(maxsize=None)
+def row_factory(cls: Type[R]) -> Callable[[sqlite3.Cursor, Tuple], R]:
+    """cursor.row_factory that builds `cls` without going through cls(*row)."""
+    new = tuple.__new__
+
+    def factory(_cursor: sqlite3.Cursor, row: Tuple) -> R:
+        return new(cls, row)
+
+    return factory
+
+
+class JobRow(NamedTuple):
+    id: int
+    company: str
+    role: str
+    status: str
+    notes: Optional[str]
+    date_added: str
+
+
+class JobCard(NamedTuple):
+    """Board projection of a job: no notes/link."""
+    id: int
+    company: str
+    role: str
+    status: str
+    date_added: str
+
+
+class FileRow(NamedTuple):
+    id: int
+    filename: str
+    original_name: str
+    category: str
+    date_added: str
+
+
+class ReminderRow(NamedTuple):
+    id: int
+    title: str
+    description: Optional[str]
+    date: str
+    time: Optional[str]
+    category: Optional[str]
+
+
+class NoteListing(NamedTuple):
+    """Notepad list entry; the body is loaded when a note is opened."""
+    id: int
+    title: str
+    updated_at: str
+
+
+class NoteItem(NamedTuple):
+    id: int
+    title: str
+    content: str
+    updated_at: str
+
+
+class ConversationRow(NamedTuple):
+    id: int
+    title: str
+    created_at: str
+
+
+class Message(NamedTuple):
+    role: str
+    content: str
+    ts: str
+
+
+class MessageRow(NamedTuple):
+    id: int
+    role: str
+    content: str
+    ts: str
+
+
+class MemoryRow(NamedTuple):
+    id: int
+    ts: str
+    type: str
+    content: str
+    importance: int
+    pinned: int
+
+
+class StatRow(NamedTuple):
+    """One period of job_weekly_stats / job_monthly_stats."""
+    period: str
+    added: int
+    applied: int
+    interviews: int
+    offers: int
+    rejections: int
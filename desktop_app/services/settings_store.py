@@ -0,0 +1,176 @@
+# services/settings_store.py
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Setting(Generic[T]):
+    """A typed key in the `settings` table (values are stored as TEXT)."""
+    key: str
+    default: T
+    parse: Callable[[str], T] = str  # type: ignore[assignment]
+    dump: Callable[[T], str] = str   # type: ignore[assignment]
+
+
+Subscriber = Callable[[str, Any], None]
+
+
+class SettingsStore:
+    """
+    In-memory settings with debounced write-behind.
+
+    - The whole `settings` table is read up front; get() serves from memory.
+    - At most every `recheck_s` seconds, get() asks DataVersions whether
+      the table changed (one PRAGMA data_version while nothing was written)
+      and re-reads it if so, so values saved by the other frontend process
+      (Tk/Qt) show up; subscribers of changed keys are notified.
+    - set() updates the cache, notifies subscribers (on the caller's thread)
+      and schedules a flush; changes within `flush_delay` seconds are written
+      together in one transaction.
+    - flush()/close() write anything pending immediately (call on shutdown).
+    """
+
+    def __init__(self, db, flush_delay: float = 0.5, recheck_s: float = 1.0):
+        self.db = db
+        self.flush_delay = flush_delay
+        self.recheck_s = recheck_s
+        self._lock = threading.Lock()
+        self._version: Optional[int] = None
+        self._next_check = 0.0
+        self._values: Dict[str, str] = {}
+        self._dirty: Dict[str, Optional[str]] = {}  # None = delete
+        self._timer: Optional[threading.Timer] = None
+        self._subscribers: Dict[Optional[str], List[Subscriber]] = {}
+        self._known: Dict[str, Setting] = {}  # to parse values changed by another process
+        self.reload()
+
+    # --------------------------------------------------------------
+    def reload(self) -> None:
+        """Re-read the table (e.g. after another process changed settings)."""
+        # version first: a write landing in between is picked up by the next check
+        version = self.db.versions.current().get("settings")
+        with self.db._read() as conn:
+            rows = conn.execute("SELECT key, value FROM settings").fetchall()
+        with self._lock:
+            old = self._values
+            self._values = {k: v for k, v in rows if v is not None}
+            # unflushed local writes win over what's on disk
+            for k, v in self._dirty.items():
+                if v is None:
+                    self._values.pop(k, None)
+                else:
+                    self._values[k] = v
+            self._version = version
+            self._next_check = time.monotonic() + self.recheck_s
+            changed = [k for k in old.keys() | self._values.keys() if old.get(k) != self._values.get(k)]
+        for key in changed:
+            setting = self._known.get(key)
+            self._notify(key, self.get(setting) if setting is not None else self._values.get(key))
+
+    def _check_external(self) -> None:
+        now = time.monotonic()
+        if now < self._next_check:
+            return
+        self._next_check = now + self.recheck_s
+        try:
+            if self.db.versions.current().get("settings") != self._version:
+                self.reload()
+        except Exception as e:
+            print("Settings reload error:", e)
+
+    def get(self, setting: Setting[T]) -> T:
+        self._check_external()
+        raw = self._values.get(setting.key)
+        if raw is None:
+            return setting.default
+        try:
+            return setting.parse(raw)
+        except (TypeError, ValueError):
+            return setting.default
+
+    def set(self, setting: Setting[T], value: T) -> None:
+        raw = None if value is None else setting.dump(value)
+        with self._lock:
+            self._known.setdefault(setting.key, setting)
+            if self._values.get(setting.key) == raw:
+                return
+            if raw is None:
+                self._values.pop(setting.key, None)
+            else:
+                self._values[setting.key] = raw
+            self._dirty[setting.key] = raw
+            self._schedule_flush()
+        self._notify(setting.key, self.get(setting))
+
+    # --------------------------------------------------------------
+    def subscribe(self, setting: Optional[Setting], handler: Subscriber) -> Callable[[], None]:
+        """handler(key, new_value) on change; setting=None receives every key."""
+        key = None if setting is None else setting.key
+        with self._lock:
+            if setting is not None:
+                self._known[key] = setting
+            self._subscribers.setdefault(key, []).append(handler)
+
+        def _unsubscribe() -> None:
+            with self._lock:
+                hs = self._subscribers.get(key, [])
+                if handler in hs:
+                    hs.remove(handler)
+
+        return _unsubscribe
+
+    def _notify(self, key: str, value: Any) -> None:
+        with self._lock:
+            targets = list(self._subscribers.get(key, ())) + list(self._subscribers.get(None, ()))
+        for handler in targets:
+            try:
+                handler(key, value)
+            except Exception as e:
+                print("Settings subscriber error:", e)
+
+    # --------------------------------------------------------------
+    def _schedule_flush(self) -> None:
+        # caller holds self._lock
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(self.flush_delay, self._flush_from_timer)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            pending, self._dirty = self._dirty, {}
+        if not pending:
+            return
+
+        upserts = [(k, v) for k, v in pending.items() if v is not None]
+        deletes = [(k,) for k, v in pending.items() if v is None]
+        try:
+            with self.db._conn() as conn:
+                conn.executemany("INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)", upserts)
+                conn.executemany("DELETE FROM settings WHERE key=?", deletes)
+        except Exception:
+            with self._lock:
+                # keep them for the next flush unless newer values arrived meanwhile
+                for k, v in pending.items():
+                    self._dirty.setdefault(k, v)
+            raise
+
+    def _flush_from_timer(self) -> None:
+        try:
+            self.flush()
+        finally:
+            # timer threads are one-shot; don't leave their connection pooled
+            self.db.close_thread()
+
+    def close(self) -> None:
+        self.flush()
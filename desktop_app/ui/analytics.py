@@ -99,14 +99,11 @@ class AnalyticsDashboardFrame(BaseCTkFrame):
     # ------------------------------------------------------------------
     def refresh(self):
         # Gather counts from the DB
-        rows = self.db.get_all_jobs()
-        total = len(rows)
+        total = self.db.count_jobs()
 
         # Count per status
-        counts = {status: 0 for status in KANBAN_COLORS}
-        for _, _, _, status, _, _ in rows:
-            if status in counts:
-                counts[status] += 1
+        status_counts = self.db.job_status_counts()
+        counts = {status: status_counts.get(status, 0) for status in KANBAN_COLORS}
 
         # Update stat cards
         self.stat_labels["total"].configure(text=str(total))
@@ -184,8 +184,12 @@ class CalendarFrame(BaseCTkFrame):
 
     # ------------------------------------------------------------------
     def _fetch_reminder_dates(self) -> set[str]:
-        """Return a set of date strings (YYYY‑MM‑DD) that have any reminder."""
-        rows = self.db.list_upcoming_reminders(limit=1000)
+        """Return a set of date strings (YYYY‑MM‑DD) in the shown month that have any reminder."""
+        first = self.current_date.replace(day=1)
+        last_day = calendar.monthrange(first.year, first.month)[1]
+        rows = self.db.list_reminders_between(
+            first.strftime("%Y-%m-%d"), first.replace(day=last_day).strftime("%Y-%m-%d")
+        )
         return {row[3] for row in rows}  # row[3] = date column
 
     # ------------------------------------------------------------------
@@ -344,7 +348,10 @@ class CalendarFrame(BaseCTkFrame):
     def _check_due_reminders(self):
         """Fire a desktop notification for any reminder that is due in the next minute."""
         now = datetime.datetime.now()
-        rows = self.db.list_upcoming_reminders(limit=100)
+        rows = self.db.list_reminders_between(
+            now.strftime("%Y-%m-%d %H:%M"),
+            (now + datetime.timedelta(minutes=1)).strftime("%Y-%m-%d %H:%M"),
+        )
         for rid, title, desc, date, time, cat in rows:
             try:
                 due = datetime.datetime.strptime(f"{date} {time}", "%Y-%m-%d %H:%M")
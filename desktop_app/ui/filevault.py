@@ -5,6 +5,7 @@ import datetime
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import customtkinter as ctk
+from services import extract_pool
 from services.db import CareerDB
 from ui.base import BaseCTkFrame
 from config.theme import get as theme
@@ -117,6 +118,9 @@ class FileStorageFrame(BaseCTkFrame):
             self._load_files()
         except Exception as exc:
             messagebox.showerror("Error", f"Failed to save file: {exc}")
+            return
+        # read the document in the background so later uses hit the extraction cache
+        extract_pool.service_for(self.db).prefetch([dest])
 
     # ------------------------------------------------------------------
     def _load_files(self):
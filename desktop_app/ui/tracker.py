@@ -430,7 +430,7 @@ class EditJobDialog(ctk.CTkToplevel):
         self.grab_set()
 
         # Load current job values
-        with db._conn() as conn:
+        with db._read() as conn:
             cur = conn.cursor()
             cur.execute(
                 "SELECT company, role, status, notes FROM jobs WHERE id=?",
@@ -4,7 +4,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from unicodedata import name
 
 from PySide6.QtCore import Qt, Signal, QThread, QTimer, QEvent
@@ -14,9 +14,11 @@ from PySide6.QtWidgets import (
     QTextEdit, QScrollArea, QSizePolicy, QComboBox, QMessageBox, QFileDialog
 )
 
+from ui_qt.async_db import for_db
 from ui_qt.base import palette
+from ui_qt.extraction import extraction_for
+from services.cv_profile import CVProfile, CVProfileStore, sections_for
 from services.ollama_client import OllamaClient
-from services.file_extract import extract_text_from_file
 
 
 # -----------------------------
@@ -104,6 +106,7 @@ class Attachment:
     label: str     # PDF/DOCX/TEXT/UNKNOWN
     text: str      # extracted
     added_at: str
+    profile: Optional[CVProfile] = None  # set once a CV has been split into sections
 
 
 # -----------------------------
@@ -113,11 +116,19 @@ class AIBuddyPage(QWidget):
     def __init__(self, db):
         super().__init__()
         self.db = db
+        # CV/JD text is parsed in worker processes and cached by file content
+        self.extraction = extraction_for(db)
+        self._extract_job = None
+        # CVs split into sections once per file: prompts carry only what a question needs
+        self.cv_profiles = CVProfileStore(db)
 
         self.client = OllamaClient()
         self.default_model = "deepseek-r1:8b"
 
         self._conversation_id: Optional[int] = None
+        # keyset cursor for older history (None = nothing older to load)
+        self._history_before: Optional[int] = None
+        self._history_loading = False
         self._assistant_bubble: Optional[ChatBubble] = None
         self._assistant_buffer: str = ""
         self._worker: Optional[OllamaStreamWorker] = None
@@ -215,6 +226,7 @@ class AIBuddyPage(QWidget):
         self.chat_l.addStretch(1)
 
         self.scroll.setWidget(self.chat_host)
+        self.scroll.verticalScrollBar().valueChanged.connect(self._on_chat_scrolled)
         pl.addWidget(self.scroll, 1)
 
         # Composer
@@ -398,14 +410,8 @@ class AIBuddyPage(QWidget):
     def _init_chat(self):
         self.refresh_models()
 
-        # reuse latest conversation if exists
-        convs = self.db.ai_list_conversations(1)
-        if convs:
-            self._conversation_id = int(convs[0][0])
-        else:
-            self._conversation_id = int(self.db.ai_create_conversation("AI Buddy"))
-
-        self._load_history()
+        # reuse latest conversation if exists (looked up on the DB worker)
+        for_db(self.db).call(self._open_latest_conversation, on_result=self._load_history)
         self._refresh_attach_label()
 
         if not self.client.is_running():
@@ -422,6 +428,7 @@ class AIBuddyPage(QWidget):
             return
 
         self._conversation_id = int(self.db.ai_create_conversation("AI Buddy"))
+        self._history_before = None
 
         # clear UI bubbles
         while self.chat_l.count() > 1:
@@ -432,7 +439,18 @@ class AIBuddyPage(QWidget):
 
         self._add_bubble("assistant", "New chat started. How can I help?")
 
-    def _load_history(self):
+    def _open_latest_conversation(self) -> Tuple[int, Tuple[List[Tuple], Optional[int]]]:
+        """DB worker: latest conversation id (created if none) + its newest history page."""
+        convs = self.db.ai_list_conversations(1)
+        if convs:
+            conversation_id = int(convs[0][0])
+        else:
+            conversation_id = int(self.db.ai_create_conversation("AI Buddy"))
+        return conversation_id, self.db.ai_get_messages_page(conversation_id, page_size=40)
+
+    def _load_history(self, data: Tuple[int, Tuple[List[Tuple], Optional[int]]]):
+        self._conversation_id, (rows, self._history_before) = data
+
         # clear bubbles (leave stretch at end)
         while self.chat_l.count() > 1:
             item = self.chat_l.takeAt(0)
@@ -440,14 +458,35 @@ class AIBuddyPage(QWidget):
             if w:
                 w.deleteLater()
 
-        if not self._conversation_id:
-            return
-
-        rows = self.db.ai_get_messages(self._conversation_id, limit=40)  # (role, content, ts)
-        for role, content, _ts in rows:
+        for _id, role, content, _ts in rows:
             self._add_bubble(str(role), str(content))
 
-        self._scroll_to_bottom()
+        self._scroll_to_bottom(force=True)
+
+    def _on_chat_scrolled(self, value: int):
+        if value <= 40 and self._history_before is not None and not self._history_loading:
+            self._history_loading = True
+            for_db(self.db).call(
+                self.db.ai_get_messages_page,
+                self._conversation_id,
+                self._history_before,
+                40,
+                on_result=lambda page, cid=self._conversation_id: self._prepend_history(cid, page),
+            )
+
+    def _prepend_history(self, conversation_id: int, page: Tuple[List[Tuple], Optional[int]]):
+        self._history_loading = False
+        if conversation_id != self._conversation_id:
+            return  # switched chats meanwhile
+        rows, self._history_before = page
+
+        sb = self.scroll.verticalScrollBar()
+        old_max, old_value = sb.maximum(), sb.value()
+        for i, (_id, role, content, _ts) in enumerate(rows):
+            self.chat_l.insertWidget(i, ChatBubble(str(role), str(content)))
+
+        # keep the message the user was looking at in place
+        QTimer.singleShot(0, lambda: sb.setValue(old_value + sb.maximum() - old_max))
 
     # ----------------------------
     # Models
@@ -495,7 +534,17 @@ class AIBuddyPage(QWidget):
         if not path:
             return
 
-        label, text = extract_text_from_file(path, max_chars=25_000)
+        self.btn_upload.setEnabled(False)
+        self._extract_job = self.extraction.extract(
+            path,
+            on_result=lambda entry, p=path: self._on_uploaded(p, entry),
+            on_error=lambda e, p=path: self._on_uploaded(p, None),
+        )
+
+    def _on_uploaded(self, path: str, entry):
+        self._extract_job = None
+        self.btn_upload.setEnabled(not (self._worker and self._worker.isRunning()))
+        label, text = (entry.label, entry.clipped(25_000)) if entry else ("MISSING", "")
         name = Path(path).name
 
         if not text:
@@ -504,7 +553,7 @@ class AIBuddyPage(QWidget):
                 "Could not read file",
                 f"I couldn't extract text from:\n\n{name}\n\n"
                 f"Type detected: {label}\n\n"
-                "PDF text extraction requires PyMuPDF (fitz).\n"
+                "PDF text extraction requires PyMuPDF (fitz) or pdfminer.six.\n"
                 "DOCX extraction requires python-docx.\n\n"
                 "You can still paste the text manually if needed.",
             )
@@ -518,12 +567,36 @@ class AIBuddyPage(QWidget):
         )
         self._attachments.append(att)
         self._refresh_attach_label()
+        self._analyze_attachment(att, entry, is_cv=any(k in name.lower() for k in ("cv", "resume")))
 
         # tiny confirmation bubble
         self._add_bubble("assistant", f"Attached: {name} ({label})")
         self._scroll_to_bottom()
 
+    def _analyze_attachment(self, att: Attachment, entry, is_cv: bool, then: Optional[Callable[[], None]] = None):
+        """Load (or build once) the section profile of an attached CV on the DB worker."""
+        if entry is None or not entry.text.strip():
+            if then:
+                then()
+            return
+
+        def apply(profile: CVProfile):
+            if is_cv or profile.looks_like_cv:
+                att.profile = profile
+            if then:
+                then()
+
+        for_db(self.db).call(
+            self.cv_profiles.profile, entry.content_hash, entry.text,
+            on_result=apply, on_error=lambda _e: then() if then else None,
+        )
+
     def clear_attachments(self):
+        if self._extract_job is not None:
+            self._extract_job.cancel()
+            self._extract_job = None
+            self.btn_upload.setEnabled(True)
+            self.btn_send.setEnabled(True)
         self._attachments.clear()
         self._refresh_attach_label()
 
@@ -572,14 +645,20 @@ class AIBuddyPage(QWidget):
 
         self.attach_row.addStretch(1)
 
-    def _attachments_context(self) -> str:
+    def _attachments_context(self, user_text: str = "") -> str:
         if not self._attachments:
             return ""
 
+        wanted = sections_for(user_text)
         lines = []
         lines.append("Attached documents below are available to you as text. Use them directly as ground truth.")
         for a in self._attachments[-3:]:  # keep prompt light
-            if a.text.strip():
+            if a.profile is not None and wanted is not None:
+                others = [n for n in a.profile.sections if n not in wanted]
+                note = f"; also in the CV, ask if needed: {', '.join(others)}" if others else ""
+                lines.append(f"\n--- {a.name} ({a.label}, CV sections relevant to this question{note}) ---\n"
+                             f"{a.profile.context(wanted)}")
+            elif a.text.strip():
                 lines.append(f"\n--- {a.name} ({a.label}) ---\n{a.text.strip()}")
             else:
                 lines.append(f"\n--- {a.name} ({a.label}) ---\n[No extracted text available]")
@@ -644,18 +723,16 @@ class AIBuddyPage(QWidget):
 
         # Jobs
         try:
-            jobs = self.db.get_all_jobs()[:10]
+            jobs = self.db.list_job_cards(limit=10)
         except Exception:
             jobs = []
 
         if jobs:
             lines.append("\nRecent job applications:")
-            for jid, company, role, status, notes, date_added in jobs:
-                company = company or ""
-                role = role or ""
-                status = status or ""
-                date_added = date_added or ""
-                lines.append(f"- #{jid}: {company} — {role} ({status}) added {date_added}")
+            for j in jobs:
+                lines.append(
+                    f"- #{j.id}: {j.company or ''} — {j.role or ''} ({j.status or ''}) added {j.date_added or ''}"
+                )
         else:
             lines.append("\nRecent job applications: none")
 
@@ -663,11 +740,10 @@ class AIBuddyPage(QWidget):
         rem_lines = []
         try:
             today = datetime.now().date()
-            for i in range(0, 7):
-                d = (today + timedelta(days=i)).strftime("%Y-%m-%d")
-                rs = self.db.list_reminders_for_date(d)
-                for rid, title, desc, date, time, category in rs:
-                    rem_lines.append(f"- {date} {time} — {title} [{category}]")
+            end = (today + timedelta(days=6)).strftime("%Y-%m-%d")
+            rs = self.db.list_reminders_between(today.strftime("%Y-%m-%d"), end)
+            for r in rs:
+                rem_lines.append(f"- {r.date} {r.time} — {r.title} [{r.category}]")
         except Exception:
             rem_lines = []
 
@@ -679,14 +755,14 @@ class AIBuddyPage(QWidget):
 
         # Files
         try:
-            files = self.db.list_files("All")[:10]
+            files, _ = self.db.list_files_page(page_size=10)
         except Exception:
             files = []
 
         if files:
             lines.append("\nRecent File Vault items:")
-            for fid, filename, original_name, category, date_added in files:
-                lines.append(f"- #{fid}: {original_name} [{category}] added {date_added}")
+            for f in files:
+                lines.append(f"- #{f.id}: {f.original_name} [{f.category}] added {f.date_added}")
         else:
             lines.append("\nRecent File Vault items: none")
 
@@ -720,7 +796,8 @@ class AIBuddyPage(QWidget):
     # ----------------------------
     # Message building (history + memory + context + attachments)
     # ----------------------------
-    def _build_messages(self, user_text: str) -> List[Dict[str, str]]:
+    def _build_messages(self, conversation_id: Optional[int], user_text: str, att_ctx: str) -> List[Dict[str, str]]:
+        """Runs on the DB worker thread; att_ctx is snapshotted on the GUI thread."""
         msgs: List[Dict[str, str]] = []
 
         # 1) app context
@@ -733,14 +810,19 @@ class AIBuddyPage(QWidget):
         if mem_ctx:
             msgs.append({"role": "system", "content": mem_ctx})
 
+        # 2b) older part of this conversation, compacted by RetentionEngine
+        if conversation_id:
+            earlier = self.db.ai_get_latest_summary(self.db.ai_conversation_scope(conversation_id))
+            if earlier:
+                msgs.append({"role": "system", "content": "Earlier in this conversation (summary):\n" + earlier})
+
         # 3) attachments context (CV/JD)
-        att_ctx = self._attachments_context()
         if att_ctx:
             msgs.append({"role": "system", "content": att_ctx})
 
         # 4) short recent history
-        if self._conversation_id:
-            rows = self.db.ai_get_messages(self._conversation_id, limit=16)
+        if conversation_id:
+            rows = self.db.ai_get_messages(conversation_id, limit=16)
             for role, content, _ts in rows:
                 r = str(role)
                 if r not in ("user", "assistant"):
@@ -850,6 +932,8 @@ class AIBuddyPage(QWidget):
     def send(self):
         if self._worker and self._worker.isRunning():
             return
+        if not self.btn_send.isEnabled():
+            return  # previous turn is still being prepared
 
         text = self.txt.toPlainText().strip()
         if not text:
@@ -860,17 +944,16 @@ class AIBuddyPage(QWidget):
             self.txt.clear()
             return
         
-        # If user asks about CV and none attached, auto-load from File Vault
+        # If user asks about CV and none attached, auto-load from File Vault first
         if ("cv" in text.lower() or "resume" in text.lower()) and not self._attachments:
-            self.attach_cv_from_vault()
-
-
-        if not self._conversation_id:
-            self._conversation_id = int(self.db.ai_create_conversation("AI Buddy"))
+            self.btn_send.setEnabled(False)
+            self.btn_upload.setEnabled(False)
+            self.attach_cv_from_vault(on_done=lambda _ok, t=text: self._send_text(t))
+            return
 
-        # Save user message
-        self.db.ai_add_message(self._conversation_id, "user", text)
+        self._send_text(text)
 
+    def _send_text(self, text: str):
         # Add bubbles
         self._add_bubble("user", text)
         self._assistant_buffer = ""
@@ -883,7 +966,28 @@ class AIBuddyPage(QWidget):
 
         model = self.cmb_model.currentText().strip() or self.default_model
         system = self._system_prompt()
-        messages = self._build_messages(text)
+
+        # Save + build the prompt on the DB worker, then start streaming
+        for_db(self.db).call(
+            self._prepare_turn,
+            self._conversation_id,
+            text,
+            self._attachments_context(text),
+            on_result=lambda r, m=model, sp=system: self._start_stream(m, sp, r),
+            on_error=lambda e: self._on_error(str(e)),
+        )
+
+    def _prepare_turn(self, conversation_id: Optional[int], text: str, att_ctx: str) -> Tuple[int, List[Dict[str, str]]]:
+        """DB worker: ensure a conversation, save the user message, build messages."""
+        if not conversation_id:
+            conversation_id = int(self.db.ai_create_conversation("AI Buddy"))
+
+        # Save user message
+        self.db.ai_add_message(conversation_id, "user", text)
+        return conversation_id, self._build_messages(conversation_id, text, att_ctx)
+
+    def _start_stream(self, model: str, system: str, prepared: Tuple[int, List[Dict[str, str]]]):
+        self._conversation_id, messages = prepared
 
         self._worker = OllamaStreamWorker(self.client, model=model, system=system, messages=messages)
         self._worker.token.connect(self._on_token)
@@ -917,7 +1021,7 @@ class AIBuddyPage(QWidget):
             self._assistant_bubble.set_text(final)
 
         if self._conversation_id:
-            self.db.ai_add_message(self._conversation_id, "assistant", final)
+            for_db(self.db).call(self.db.ai_add_message, self._conversation_id, "assistant", final)
 
         self._scroll_to_bottom()
 
@@ -946,6 +1050,7 @@ class AIBuddyPage(QWidget):
     def _vault_find_best_cv(self) -> Optional[Tuple[int, str, str, str, str]]:
         """
         Returns best match from DB: (file_id, filename, original_name, category, date_added)
+        Runs on the DB worker thread (attach_cv_from_vault): no widget access here.
         """
         rows = self.db.list_files("All")
         if not rows:
@@ -966,17 +1071,44 @@ class AIBuddyPage(QWidget):
 
         return None
 
-    def attach_cv_from_vault(self) -> bool:
-        best = self._vault_find_best_cv()
+    def attach_cv_from_vault(self, on_done: Optional[Callable[[bool], None]] = None) -> None:
+        """Attach the best CV match from the File Vault; `on_done(ok)` runs once it is read."""
+        def failed(e: BaseException) -> None:
+            print("Vault CV lookup error:", e)
+            self._on_vault_cv_found(None, on_done)
+
+        for_db(self.db).call(
+            self._vault_find_best_cv,
+            on_result=lambda best: self._on_vault_cv_found(best, on_done),
+            on_error=failed,
+        )
+
+    def _on_vault_cv_found(self, best, on_done: Optional[Callable[[bool], None]]) -> None:
         if not best:
             self._add_bubble("assistant", "I couldn't find a CV in your File Vault. Upload one first.")
             self._scroll_to_bottom()
-            return False
+            if on_done:
+                on_done(False)
+            return
 
         file_id, stored_name, original_name, category, _date_added = best
         full_path = Path(self.db.db_path).resolve().parents[1] / "career_buddy_files" / str(stored_name)
 
-        label, text = extract_text_from_file(str(full_path), max_chars=25_000)
+        def done(entry):
+            self._extract_job = None
+            att = self._attach_vault_cv(full_path, str(original_name), entry)
+            if att is None:
+                if on_done:
+                    on_done(False)
+                return
+            self._analyze_attachment(att, entry, is_cv=True, then=lambda: on_done(True) if on_done else None)
+
+        self._extract_job = self.extraction.extract(
+            str(full_path), on_result=done, on_error=lambda _e: done(None),
+        )
+
+    def _attach_vault_cv(self, full_path: Path, original_name: str, entry) -> Optional[Attachment]:
+        label, text = (entry.label, entry.clipped(25_000)) if entry else ("MISSING", "")
 
         if not text.strip():
             self._add_bubble(
@@ -985,7 +1117,7 @@ class AIBuddyPage(QWidget):
                 "Try uploading a text-based PDF/DOCX, or paste your CV text here."
             )
             self._scroll_to_bottom()
-            return False
+            return None
 
         att = Attachment(
             path=str(full_path),
@@ -1000,7 +1132,7 @@ class AIBuddyPage(QWidget):
 
         self._add_bubble("assistant", f"Loaded from File Vault ✅ {original_name} ({label})")
         self._scroll_to_bottom()
-        return True
+        return att
 
     def show_commands_menu(self):
         from PySide6.QtWidgets import QMenu
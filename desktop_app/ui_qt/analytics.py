@@ -1,9 +1,7 @@
 # ui_qt/analytics.py
 from __future__ import annotations
 
-import sqlite3
 from dataclasses import dataclass
-from datetime import datetime
 from typing import Dict, List, Tuple
 
 from PySide6.QtCore import Qt
@@ -12,7 +10,8 @@ from PySide6.QtWidgets import (
     QListWidgetItem, QSizePolicy
 )
 
-from services.db import DB_FILE
+from services.job_metrics import FlowSnapshot, JobFlowMetrics
+from ui_qt.async_db import for_db
 from ui_qt.base import palette
 
 
@@ -42,54 +41,6 @@ RANKS = {
 }
 
 
-def _ensure_activity_table() -> None:
-    """Create a lightweight activity table if missing (no DB migration needed)."""
-    conn = sqlite3.connect(DB_FILE)
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            """
-            CREATE TABLE IF NOT EXISTS activity(
-                id INTEGER PRIMARY KEY,
-                ts TEXT,
-                message TEXT
-            )
-            """
-        )
-        conn.commit()
-    finally:
-        conn.close()
-
-
-def log_activity(message: str) -> None:
-    """Call from other pages (tracker) to record moves."""
-    _ensure_activity_table()
-    conn = sqlite3.connect(DB_FILE)
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            "INSERT INTO activity (ts, message) VALUES (?, ?)",
-            (datetime.now().strftime("%Y-%m-%d %H:%M:%S"), message),
-        )
-        conn.commit()
-    finally:
-        conn.close()
-
-
-def fetch_recent_activity(limit: int = 30) -> List[Tuple[str, str]]:
-    _ensure_activity_table()
-    conn = sqlite3.connect(DB_FILE)
-    try:
-        cur = conn.cursor()
-        cur.execute(
-            "SELECT ts, message FROM activity ORDER BY id DESC LIMIT ?",
-            (limit,),
-        )
-        return cur.fetchall()
-    finally:
-        conn.close()
-
-
 class StatCard(QFrame):
     def __init__(self, title: str, value: str, badge: str, accent: str):
         super().__init__()
@@ -136,11 +87,18 @@ class AnalyticsPage(QWidget):
     - Hand of 4 stat cards
     - Status distribution bars
     - Recent Moves activity log (no deck duplication)
+    - Pipeline: stage conversion + time-in-stage
+    - Trends from the job_daily_stats / job_weekly_stats rollups
     """
 
+    # MainWindow re-runs refresh() on the next visit only if one of these tables changed
+    refresh_tables = ("jobs", "activity", "job_events")
+
     def __init__(self, db):
         super().__init__()
         self.db = db
+        # folds in new job_events on each refresh (DB worker only)
+        self.flow = JobFlowMetrics(db)
 
         root = QVBoxLayout(self)
         root.setContentsMargins(0, 0, 0, 0)
@@ -210,6 +168,43 @@ class AnalyticsPage(QWidget):
         mid.addWidget(self.panel_moves, 2)
         root.addLayout(mid, 1)
 
+        # Bottom: Pipeline (conversion + time in stage) + trends
+        bottom = QHBoxLayout()
+        bottom.setSpacing(12)
+
+        self.panel_flow = QFrame()
+        self.panel_flow.setObjectName("panel")
+        flow_lay = QVBoxLayout(self.panel_flow)
+        flow_lay.setContentsMargins(14, 12, 14, 12)
+        flow_lay.setSpacing(6)
+
+        flow_title = QLabel("Pipeline")
+        flow_title.setStyleSheet("color:white; font-weight:950;")
+        flow_lay.addWidget(flow_title)
+
+        self.flow_rows_container = QVBoxLayout()
+        self.flow_rows_container.setSpacing(4)
+        flow_lay.addLayout(self.flow_rows_container, 1)
+
+        self.panel_trends = QFrame()
+        self.panel_trends.setObjectName("panel")
+        trends_lay = QVBoxLayout(self.panel_trends)
+        trends_lay.setContentsMargins(14, 12, 14, 12)
+        trends_lay.setSpacing(6)
+
+        trends_title = QLabel("Trends")
+        trends_title.setStyleSheet("color:white; font-weight:950;")
+        trends_lay.addWidget(trends_title)
+
+        self.trends_label = QLabel("")
+        self.trends_label.setStyleSheet(f"color:{palette['muted']}; font-weight:750;")
+        self.trends_label.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        trends_lay.addWidget(self.trends_label, 1)
+
+        bottom.addWidget(self.panel_flow, 3)
+        bottom.addWidget(self.panel_trends, 2)
+        root.addLayout(bottom)
+
         self.setStyleSheet(f"""
             QFrame#panel {{
                 background: rgba(0,0,0,0.18);
@@ -231,18 +226,33 @@ class AnalyticsPage(QWidget):
     # Data + UI building
     # --------------------------
     def refresh(self):
-        jobs = self.db.get_all_jobs()  # (id, company, role, status, notes, date_added)
-        total = len(jobs)
+        for_db(self.db).call(self._load, on_result=self._apply, key="analytics.refresh")
+
+    def _load(self):
+        # runs on the DB worker thread: no widget access here
+        # aggregates come from job_status_counts: no job rows are read
+        counts = self.db.job_status_counts()
+        # pending transitions must be in job_events before the flow fold reads them
+        self.db.journal.flush()
+        return (
+            counts,
+            self.db.count_jobs(),
+            self.db.reject_rate(),
+            self.db.journal.recent_activity(limit=30),
+            self.flow.refresh(),
+            # trend charts come from the rollup tables, not from jobs
+            self.db.job_weekly_stats(weeks=8),
+            self.db.job_monthly_stats(months=6),
+        )
+
+    def _apply(self, data):
+        status_counts, total, rate, activity, flow, weekly, monthly = data
 
-        counts: Dict[str, int] = {k: 0 for k in KANBAN}
-        for _id, _company, _role, status, _notes, _date in jobs:
-            if status in counts:
-                counts[status] += 1
+        counts: Dict[str, int] = {k: status_counts.get(k, 0) for k in KANBAN}
 
         interviews = counts.get("Interviewing", 0)
         offers = counts.get("Offer", 0)
-        rejected = counts.get("Rejected", 0)
-        reject_rate = int(round((rejected / total) * 100)) if total else 0
+        reject_rate = int(round(rate * 100))
 
         # Update stat cards
         self._set_stat_value(self.card_total, str(total))
@@ -254,7 +264,11 @@ class AnalyticsPage(QWidget):
         self._rebuild_distribution(counts, total)
 
         # Recent moves
-        self._rebuild_moves()
+        self._rebuild_moves(activity)
+
+        # Pipeline + trends
+        self._rebuild_flow(flow)
+        self._rebuild_trends(weekly, monthly)
 
     def _set_stat_value(self, stat_card: StatCard, value: str):
         # the value label is the 2nd widget in stat_card layout
@@ -312,9 +326,8 @@ class AnalyticsPage(QWidget):
 
             self.dist_rows_container.addWidget(row)
 
-    def _rebuild_moves(self):
+    def _rebuild_moves(self, rows: List[Tuple[str, str]]):
         self.moves_list.clear()
-        rows = fetch_recent_activity(limit=30)
         if not rows:
             it = QListWidgetItem("No activity yet. Move a job to see history here.")
             it.setFlags(Qt.NoItemFlags)
@@ -324,3 +337,50 @@ class AnalyticsPage(QWidget):
         for ts, msg in rows:
             item = QListWidgetItem(f"{ts}  •  {msg}")
             self.moves_list.addItem(item)
+
+    def _rebuild_flow(self, flow: FlowSnapshot):
+        while self.flow_rows_container.count():
+            item = self.flow_rows_container.takeAt(0)
+            w = item.widget()
+            if w:
+                w.deleteLater()
+
+        dwell = {(d.from_status, d.to_status): d for d in flow.dwell}
+        for stage, nxt, reached, rate in flow.conversion:
+            line = f"{SUITS[stage]} {stage} → {SUITS[nxt]} {nxt}:  {int(round(rate * 100))}% of {reached}"
+            d = dwell.get((stage, nxt))
+            if d is not None:
+                line += f"  •  median {d.median_days:.1f}d, p90 {d.p90_days:.1f}d"
+            lbl = QLabel(line)
+            lbl.setStyleSheet(f"color:{palette['text']}; font-weight:750;")
+            self.flow_rows_container.addWidget(lbl)
+
+        # application velocity: jobs moved to Applied per week, oldest to newest
+        weeks = flow.weekly_applied[-8:]
+        if weeks:
+            peak = max(n for _w, n in weeks)
+            spark = "".join("▁▂▃▄▅▆▇█"[min(7, int(7 * n / peak))] if peak else "▁" for _w, n in weeks)
+            avg = sum(n for _w, n in weeks) / len(weeks)
+            lbl = QLabel(f"Applied per week:  {spark}  this week {weeks[-1][1]}  •  avg {avg:.1f}/wk")
+            lbl.setToolTip("\n".join(f"Week of {w}: {n}" for w, n in weeks))
+            lbl.setStyleSheet(f"color:{palette['muted']}; font-weight:750;")
+            self.flow_rows_container.addWidget(lbl)
+
+    def _rebuild_trends(self, weekly: List[Tuple], monthly: List[Tuple]):
+        # rows: (period, added, applied, interviews, offers, rejections)
+        def _bars(title: str, rows: List[Tuple[str, int]]) -> List[str]:
+            peak = max((n for _p, n in rows), default=0)
+            out = [title]
+            for period, n in rows:
+                bar = "█" * (int(round(12 * n / peak)) if peak else 0)
+                out.append(f"  {period}  {bar} {n}")
+            return out
+
+        lines = _bars("Added per week", [(r[0][5:], r[1]) for r in weekly])
+        lines += _bars("Interviews per month", [(r[0], r[3]) for r in monthly])
+        offers, running = [], 0
+        for r in monthly:
+            running += r[4]
+            offers.append((r[0], running))
+        lines += _bars("Offers (running total)", offers)
+        self.trends_label.setText("\n".join(lines))
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+import multiprocessing
 import os
 import sys
 import time
@@ -13,7 +14,11 @@ from PySide6.QtWidgets import (
     QLabel, QPushButton, QSizeGrip
 )
 
+from config import settings
 from services.db import CareerDB
+from services.retention import RetentionEngine
+from ui_qt.async_db import shutdown_all as shutdown_async_db
+from ui_qt.extraction import shutdown_all as shutdown_extraction
 from ui_qt.base import palette
 from ui_qt.main_window import MainWindow
 
@@ -169,13 +174,23 @@ def main():
 
     # Persisted DB
     db = CareerDB()
+    prefs = settings.init(db)
+    if prefs.get(settings.MEMORY_MIRROR):
+        db.enable_mirror(prefs.get(settings.MEMORY_MIRROR_MAX_MB) * 1024 * 1024)
+    app.aboutToQuit.connect(shutdown_async_db)  # drain the DB worker before closing
+    app.aboutToQuit.connect(shutdown_extraction)  # stop the document parser processes
+    app.aboutToQuit.connect(prefs.close)        # flush write-behind settings
+    retention = RetentionEngine(db)             # compacts/archives old AI chats in the background
+    retention.start()
+    app.aboutToQuit.connect(retention.close)
+    app.aboutToQuit.connect(db.close)
 
     # Vault directory (same idea as before)
     base = os.path.dirname(os.path.dirname(__file__))  # desktop_app/
     vault_dir = os.path.join(base, "career_buddy_files")
     os.makedirs(vault_dir, exist_ok=True)
 
-    win = MainWindow(db, vault_dir=vault_dir)
+    win = MainWindow(db, vault_dir=vault_dir, retention=retention)
 
     card: Optional[CardWidget] = None
 
@@ -209,4 +224,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # document parser processes in frozen builds
     main()
@@ -0,0 +1,94 @@
+# ui_qt/async_db.py
+from __future__ import annotations
+
+import itertools
+import weakref
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from PySide6.QtCore import QObject, Signal
+
+from services.db_async import AsyncCareerDB
+
+
+class QtAsyncDB(QObject):
+    """
+    Qt side of AsyncCareerDB: results are delivered back on the GUI thread
+    through a queued signal, so callbacks may touch widgets directly.
+
+        qdb = for_db(self.db)
+        qdb.call(self.db.get_all_jobs, on_result=self._apply_jobs, key="tracker")
+
+    `key` makes a call "latest wins": if another call with the same key is
+    issued before this one resolves, this result is dropped.
+    """
+
+    resolved = Signal(int, object, object)  # ticket, result, error
+
+    def __init__(self, db, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.adb = AsyncCareerDB(db)
+        self._tickets = itertools.count(1)
+        self._pending: Dict[int, Tuple[Optional[str], Optional[Callable], Optional[Callable]]] = {}
+        self._latest: Dict[str, int] = {}
+        self.resolved.connect(self._dispatch)
+
+    def call(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        on_result: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[BaseException], None]] = None,
+        key: Optional[str] = None,
+    ) -> Future:
+        ticket = next(self._tickets)
+        self._pending[ticket] = (key, on_result, on_error)
+        if key is not None:
+            self._latest[key] = ticket
+
+        fut = self.adb.submit(fn, *args)
+        # done-callback runs on the worker thread -> emit crosses to GUI thread
+        fut.add_done_callback(lambda f, t=ticket: self._emit(t, f))
+        return fut
+
+    def _emit(self, ticket: int, fut: Future) -> None:
+        if fut.cancelled():
+            return
+        err = fut.exception()
+        self.resolved.emit(ticket, None if err else fut.result(), err)
+
+    def _dispatch(self, ticket: int, result: Any, error: Any) -> None:
+        key, on_result, on_error = self._pending.pop(ticket, (None, None, None))
+        if key is not None:
+            if self._latest.get(key) != ticket:
+                return  # superseded by a newer call
+            self._latest.pop(key, None)
+
+        if error is not None:
+            if on_error:
+                on_error(error)
+            else:
+                print("CareerDB async error:", error)
+            return
+        if on_result:
+            on_result(result)
+
+    def shutdown(self) -> None:
+        self.adb.shutdown(wait=True)
+
+
+_INSTANCES: "weakref.WeakKeyDictionary[Any, QtAsyncDB]" = weakref.WeakKeyDictionary()
+
+
+def for_db(db) -> QtAsyncDB:
+    """Shared QtAsyncDB (one worker thread) per CareerDB instance."""
+    inst = _INSTANCES.get(db)
+    if inst is None:
+        inst = QtAsyncDB(db)
+        _INSTANCES[db] = inst
+    return inst
+
+
+def shutdown_all() -> None:
+    for inst in list(_INSTANCES.values()):
+        inst.shutdown()
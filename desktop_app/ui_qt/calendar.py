@@ -1,12 +1,9 @@
 # ui_qt/calendar.py
 from __future__ import annotations
 
-from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, List, Dict
 
-import sqlite3
-
 from PySide6.QtCore import Qt, QDate, QPoint
 from PySide6.QtGui import QPainter, QPen, QColor, QFont
 from PySide6.QtWidgets import (
@@ -15,19 +12,9 @@ from PySide6.QtWidgets import (
     QDialog, QLineEdit, QTextEdit, QComboBox, QTabWidget
 )
 
-from services.db import DB_FILE
+from services.rows import ReminderRow as Event
+from ui_qt.async_db import for_db
 from ui_qt.base import palette
-from ui_qt.analytics import log_activity
-
-
-@dataclass
-class Event:
-    id: int
-    title: str
-    description: str
-    date: str
-    time: str
-    category: str
 
 
 CATEGORIES = ["Interview", "Call", "Assessment", "Deadline", "Other"]
@@ -298,10 +285,14 @@ class PipsCalendar(QCalendarWidget):
 
 
 class CalendarPage(QWidget):
+    # MainWindow re-runs refresh() on the next visit only if one of these tables changed
+    refresh_tables = ("reminders",)
+
     def __init__(self, db):
         super().__init__()
         self.db = db
         self.selected_date = datetime.now().strftime("%Y-%m-%d")
+        self._day_events: Dict[int, Event] = {}  # list_day items carry the reminder id
 
         root = QHBoxLayout(self)
         root.setContentsMargins(0, 0, 0, 0)
@@ -491,26 +482,13 @@ class CalendarPage(QWidget):
         """
         Fetch reminders between [start, end] inclusive.
         """
-        conn = sqlite3.connect(DB_FILE)
-        try:
-            cur = conn.cursor()
-            cur.execute(
-                """
-                SELECT id, title, description, date, time, category
-                FROM reminders
-                WHERE date >= ? AND date <= ?
-                ORDER BY date, time
-                """,
-                (start, end),
-            )
-            rows = cur.fetchall()
-        finally:
-            conn.close()
-
-        out: List[Event] = []
-        for rid, title, desc, date, time, cat in rows:
-            out.append(Event(rid, title, desc or "", date, time or "", cat or "Other"))
-        return out
+        rows = self.db.list_reminders_between(start, end)
+        # rows are used as-is; only ones with NULL fields get a normalised copy
+        return [
+            ev if ev.description is not None and ev.time is not None and ev.category
+            else ev._replace(description=ev.description or "", time=ev.time or "", category=ev.category or "Other")
+            for ev in rows
+        ]
 
     def _refresh_pips_for_visible_month(self):
         # visible month range (pad by 1 week either side to cover prev/next month days in grid)
@@ -521,20 +499,23 @@ class CalendarPage(QWidget):
         start = first.addDays(-14)
         end = first.addMonths(1).addDays(14)
 
-        events = self._fetch_events_in_range(
+        for_db(self.db).call(
+            self._fetch_events_in_range,
             start.toString("yyyy-MM-dd"),
             end.toString("yyyy-MM-dd"),
+            on_result=self._apply_pips,
+            key="calendar.pips",
         )
 
+    def _apply_pips(self, events: List[Event]):
         by_date: Dict[str, List[str]] = {}
         for ev in events:
             by_date.setdefault(ev.date, []).append(ev.category or "Other")
 
         self.cal.set_events_map(by_date)
 
-    def _fetch_for_selected(self) -> List[Event]:
-        # just the selected day
-        events = self._fetch_events_in_range(self.selected_date, self.selected_date)
+    def _fetch_for_day(self, day: str) -> List[Event]:
+        events = self._fetch_events_in_range(day, day)
         # sort by time
         events.sort(key=lambda e: e.time)
         return events
@@ -543,8 +524,16 @@ class CalendarPage(QWidget):
     # Day list + Week agenda
     # --------------------
     def _refresh_day_list(self):
+        for_db(self.db).call(
+            self._fetch_for_day,
+            self.selected_date,
+            on_result=self._render_day_list,
+            key="calendar.day",
+        )
+
+    def _render_day_list(self, events: List[Event]):
         self.list_day.clear()
-        events = self._fetch_for_selected()
+        self._day_events = {ev.id: ev for ev in events}
         if not events:
             it = QListWidgetItem("No events for this day.")
             it.setFlags(Qt.NoItemFlags)
@@ -555,14 +544,13 @@ class CalendarPage(QWidget):
             suit = CAT_SUIT.get(ev.category, "🃏")
             label = f"{ev.time + '  ' if ev.time else ''}{suit} {ev.title}  •  {ev.category}"
             item = QListWidgetItem(label)
-            item.setData(Qt.UserRole, ev)
+            item.setData(Qt.UserRole, ev.id)
             self.list_day.addItem(item)
 
     def _refresh_week_agenda(self):
-        self.list_week.clear()
-
         d = QDate.fromString(self.selected_date, "yyyy-MM-dd")
         if not d.isValid():
+            self.list_week.clear()
             return
 
         # Monday start
@@ -574,11 +562,17 @@ class CalendarPage(QWidget):
             f"Week Agenda — {week_start.toString('dd MMM')} to {week_end.toString('dd MMM')}"
         )
 
-        events = self._fetch_events_in_range(
+        for_db(self.db).call(
+            self._fetch_events_in_range,
             week_start.toString("yyyy-MM-dd"),
             week_end.toString("yyyy-MM-dd"),
+            on_result=lambda events, ws=week_start: self._render_week_agenda(ws, events),
+            key="calendar.week",
         )
 
+    def _render_week_agenda(self, week_start: QDate, events: List[Event]):
+        self.list_week.clear()
+
         # group by date
         grouped: Dict[str, List[Event]] = {}
         for ev in events:
@@ -626,7 +620,7 @@ class CalendarPage(QWidget):
             return
 
         self.db.add_reminder(title, desc, self.selected_date, time, cat)
-        log_activity(f"Added event → {title} ({cat})")
+        self.db.journal.log(f"Added event → {title} ({cat})")
 
         self._refresh_pips_for_visible_month()
         self._refresh_day_list()
@@ -636,8 +630,7 @@ class CalendarPage(QWidget):
         item = self.list_day.currentItem()
         if not item:
             return None
-        ev = item.data(Qt.UserRole)
-        return ev if isinstance(ev, Event) else None
+        return self._day_events.get(item.data(Qt.UserRole))
 
     def _edit_event(self):
         ev = self._get_selected_event()
@@ -653,18 +646,9 @@ class CalendarPage(QWidget):
             QMessageBox.warning(self, "Missing", "Please enter a title.")
             return
 
-        conn = sqlite3.connect(DB_FILE)
-        try:
-            cur = conn.cursor()
-            cur.execute(
-                "UPDATE reminders SET title=?, description=?, time=?, category=? WHERE id=?",
-                (title, desc, time, cat, ev.id),
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        self.db.update_reminder(ev.id, title, desc, ev.date, time, cat)
 
-        log_activity(f"Edited event → {title} ({cat})")
+        self.db.journal.log(f"Edited event → {title} ({cat})")
 
         self._refresh_pips_for_visible_month()
         self._refresh_day_list()
@@ -679,7 +663,7 @@ class CalendarPage(QWidget):
             return
 
         self.db.delete_reminder(ev.id)
-        log_activity(f"Deleted event → {ev.title} ({ev.category})")
+        self.db.journal.log(f"Deleted event → {ev.title} ({ev.category})")
 
         self._refresh_pips_for_visible_month()
         self._refresh_day_list()
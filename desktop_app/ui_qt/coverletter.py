@@ -2,10 +2,9 @@
 from __future__ import annotations
 
 import os
-import re
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
@@ -13,88 +12,29 @@ from PySide6.QtWidgets import (
     QLineEdit, QTextEdit, QFileDialog, QMessageBox, QComboBox
 )
 
+from services.cv_profile import CVProfile, CVProfileStore, analyze_cv, extract_keywords, normalize_spaces
+from services.file_extract import extract_document
+from ui_qt.async_db import for_db
 from ui_qt.base import palette
+from ui_qt.extraction import extraction_for
 
 
-def _read_text_file(path: str) -> str:
-    try:
-        with open(path, "r", encoding="utf-8", errors="ignore") as f:
-            return f.read()
-    except Exception:
-        return ""
+# CVs longer than this are clipped (the extraction cache keeps as much)
+CV_MAX_CHARS = 200_000
 
 
-def _read_docx(path: str) -> str:
-    # optional; works if python-docx is installed
-    try:
-        import docx  # type: ignore
-        d = docx.Document(path)
-        return "\n".join(p.text for p in d.paragraphs)
-    except Exception:
-        return ""
-
-
-def _read_pdf(path: str) -> str:
-    # optional; works if pdfminer.six is installed
-    try:
-        from pdfminer.high_level import extract_text  # type: ignore
-        return extract_text(path) or ""
-    except Exception:
-        return ""
+def load_cv_text(path: str) -> str:
+    """Synchronous CV read through the shared extractor registry (services/extractors.py)."""
+    return extract_document(path, CV_MAX_CHARS).text
 
 
-def load_cv_text(path: str) -> str:
-    ext = os.path.splitext(path)[1].lower()
-    if ext in (".txt", ".md"):
-        return _read_text_file(path)
-    if ext == ".docx":
-        return _read_docx(path)
-    if ext == ".pdf":
-        return _read_pdf(path)
-    return ""
-
-
-def normalize_spaces(s: str) -> str:
-    s = s.replace("\r\n", "\n").replace("\r", "\n")
-    s = re.sub(r"[ \t]+", " ", s)
-    s = re.sub(r"\n{3,}", "\n\n", s)
-    return s.strip()
-
-
-def extract_keywords(text: str) -> List[str]:
-    text = text.lower()
-    # pull “skill-like” words; keep it simple and predictable
-    raw = re.findall(r"[a-z][a-z\+\#\-]{2,}", text)
-    stop = {
-        "the","and","with","that","this","from","your","you","for","are","our","role",
-        "will","have","has","was","were","into","over","within","using","use","used",
-        "able","work","team","teams","skills","skill","experience","experiences",
-        "job","company","position","developer","engineer","data"
-    }
-    out = []
-    for w in raw:
-        if w in stop:
-            continue
-        if len(w) > 22:
-            continue
-        out.append(w)
-    # de-dup preserving order
-    seen = set()
-    uniq = []
-    for w in out:
-        if w not in seen:
-            seen.add(w)
-            uniq.append(w)
-    return uniq[:60]
-
-
-def score_matches(cv_text: str, job_text: str) -> List[Tuple[str, int]]:
-    cv = cv_text.lower()
+def score_matches(cv: CVProfile, job_text: str) -> List[Tuple[str, int]]:
     keys = extract_keywords(job_text)
     scored = []
     for k in keys:
-        # small boost if keyword exists in CV
-        scored.append((k, 2 if k in cv else 0))
+        # small boost if keyword exists in CV (as a word or inside one, e.g. "sql" in "postgresql")
+        present = k in cv.terms or any(k in t for t in cv.terms)
+        scored.append((k, 2 if present else 0))
     scored.sort(key=lambda x: x[1], reverse=True)
     return scored
 
@@ -110,19 +50,19 @@ def generate_cover_letter(
     job_desc: str,
     cv_text: str,
     tone: str,
+    profile: Optional[CVProfile] = None,
 ) -> str:
+    """`profile` is analyze_cv(cv_text) when the caller already has it."""
     today = datetime.now().strftime("%d %B %Y")
-    cv_text = normalize_spaces(cv_text)
+    profile = profile or analyze_cv(cv_text)
     job_desc = normalize_spaces(job_desc)
 
-    matches = score_matches(cv_text, job_desc)
+    matches = score_matches(profile, job_desc)
     present = [k for k, s in matches if s > 0][:10]
     missing = [k for k, s in matches if s == 0][:6]
 
-    # “evidence” bullets: try to pull 2–3 strong CV lines
-    cv_lines = [ln.strip() for ln in cv_text.split("\n") if ln.strip()]
-    strong = [ln for ln in cv_lines if any(x in ln.lower() for x in ("built", "developed", "designed", "led", "implemented", "deployed", "improved", "reduced", "increased", "achieved"))]
-    strong = strong[:3]
+    # “evidence” bullets: 2–3 strong CV lines
+    strong = list(profile.achievements[:3])
 
     if tone == "Confident":
         opener = f"I’m excited to apply for the {job_title} role at {company}."
@@ -175,8 +115,16 @@ Kind regards,
 
 
 class CoverLetterPage(QWidget):
-    def __init__(self):
+    def __init__(self, db=None):
         super().__init__()
+        # with a db, CVs are read in the extraction pool (cached by content)
+        self.db = db
+        self.extraction = extraction_for(db) if db is not None else None
+        self.cv_profiles = CVProfileStore(db) if db is not None else None
+        self._cv_job = None
+        # the CV text the page last analysed, and its profile
+        self._cv_profile_text = ""
+        self._cv_profile: Optional[CVProfile] = None
 
         root = QVBoxLayout(self)
         root.setContentsMargins(0, 0, 0, 0)
@@ -346,7 +294,39 @@ class CoverLetterPage(QWidget):
             return
 
         self.lbl_cv_path.setText(os.path.basename(path))
-        text = load_cv_text(path)
+        if self.extraction is None:
+            self._set_cv_text(load_cv_text(path))
+            return
+
+        if self._cv_job is not None:
+            self._cv_job.cancel()  # a newer pick replaces a CV still being read
+        self.lbl_cv_path.setText(f"{os.path.basename(path)} (reading…)")
+        self._cv_job = self.extraction.extract(
+            path,
+            on_result=lambda entry, p=path: self._on_cv_read(p, entry),
+            on_error=lambda _e, p=path: self._on_cv_read(p, None),
+        )
+
+    def _on_cv_read(self, path: str, entry):
+        self._cv_job = None
+        self.lbl_cv_path.setText(os.path.basename(path))
+        self._set_cv_text(entry.text if entry else "")
+        if entry and entry.text.strip():
+            # stored per file hash: a CV analysed before is not parsed again
+            for_db(self.db).call(
+                self.cv_profiles.profile, entry.content_hash, entry.text,
+                on_result=lambda prof, t=entry.text.strip(): self._remember_profile(t, prof),
+            )
+
+    def _remember_profile(self, text: str, profile: CVProfile):
+        self._cv_profile_text, self._cv_profile = text, profile
+
+    def _profile_for(self, cv_text: str) -> CVProfile:
+        if self._cv_profile is None or cv_text != self._cv_profile_text:
+            self._remember_profile(cv_text, analyze_cv(cv_text))  # pasted or edited CV
+        return self._cv_profile
+
+    def _set_cv_text(self, text: str):
         if not text.strip():
             QMessageBox.information(
                 self,
@@ -391,6 +371,7 @@ class CoverLetterPage(QWidget):
             job_desc=job_text,
             cv_text=cv_text,
             tone=tone,
+            profile=self._profile_for(cv_text),
         )
         self.txt_out.setPlainText(out)
 
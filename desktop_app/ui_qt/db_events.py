@@ -0,0 +1,51 @@
+# ui_qt/db_events.py
+from __future__ import annotations
+
+import weakref
+from typing import Any, Callable, Iterable, Optional, Type
+
+from PySide6.QtCore import QObject, Signal
+
+from services.events import ChangeEvent
+
+
+class QtEventRelay(QObject):
+    """
+    Re-emits CareerDB change events on the GUI thread.
+
+    CareerDB publishes on whichever thread did the write (GUI or DB worker);
+    this relay lives on the GUI thread, so the queued signal delivers every
+    event there and page handlers can touch widgets.
+    """
+
+    changed = Signal(object)
+
+    def __init__(self, db, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._unsubscribe = db.events.subscribe(ChangeEvent, self.changed.emit)
+
+
+_RELAYS: "weakref.WeakKeyDictionary[Any, QtEventRelay]" = weakref.WeakKeyDictionary()
+
+
+def relay_for(db) -> QtEventRelay:
+    relay = _RELAYS.get(db)
+    if relay is None:
+        relay = QtEventRelay(db)
+        _RELAYS[db] = relay
+    return relay
+
+
+def subscribe(
+    db,
+    event_types: Iterable[Type[ChangeEvent]],
+    handler: Callable[[ChangeEvent], None],
+) -> None:
+    """Call handler(event) on the GUI thread for every event of the given types."""
+    types = tuple(event_types)
+
+    def _filter(ev: ChangeEvent) -> None:
+        if isinstance(ev, types):
+            handler(ev)
+
+    relay_for(db).changed.connect(_filter)
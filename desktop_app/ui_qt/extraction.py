@@ -0,0 +1,96 @@
+# ui_qt/extraction.py
+from __future__ import annotations
+
+import weakref
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, Signal
+
+from services.extract_pool import (
+    CANCELLED, DONE, FAILED, INTERACTIVE, RUNNING,
+    ExtractionJob, service_for,
+)
+
+
+class QtExtraction(QObject):
+    """
+    Qt side of ExtractionService: job state changes arrive on the GUI thread
+    as signals, and extract() callbacks run there too, so they may touch
+    widgets directly.
+
+        qx = extraction_for(self.db)
+        job = qx.extract(path, on_result=self._attach)   # entry: CachedExtraction | None
+        job.cancel()
+    """
+
+    started = Signal(int, str)          # job id, path
+    finished = Signal(int, object)      # job id, CachedExtraction | None
+    failed = Signal(int, str)           # job id, error
+    cancelled = Signal(int)             # job id
+    progress = Signal(int, int)         # done, total in the current batch
+
+    _changed = Signal(object)
+
+    def __init__(self, db, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.service = service_for(db)
+        self.service.on_state = self._changed.emit  # service threads -> GUI thread
+        self._callbacks: Dict[int, Tuple[Optional[Callable], Optional[Callable]]] = {}
+        self._changed.connect(self._dispatch)
+
+    def extract(
+        self,
+        path: str,
+        on_result: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[str], None]] = None,
+        priority: int = INTERACTIVE,
+    ) -> ExtractionJob:
+        job = self.service.submit(path, priority)
+        if on_result or on_error:
+            self._callbacks[job.id] = (on_result, on_error)
+        return job
+
+    def prefetch(self, paths: Iterable[str]) -> List[ExtractionJob]:
+        return self.service.prefetch(paths)
+
+    def _dispatch(self, job: ExtractionJob) -> None:
+        state = job.state
+        if state == RUNNING:
+            self.started.emit(job.id, job.path)
+        elif state == DONE:
+            entry = job.future.result()
+            self.finished.emit(job.id, entry)
+            on_result, _ = self._callbacks.pop(job.id, (None, None))
+            if on_result:
+                on_result(entry)
+        elif state == FAILED:
+            msg = str(job.future.exception())
+            self.failed.emit(job.id, msg)
+            _, on_error = self._callbacks.pop(job.id, (None, None))
+            if on_error:
+                on_error(msg)
+        elif state == CANCELLED:
+            self._callbacks.pop(job.id, None)
+            self.cancelled.emit(job.id)
+        self.progress.emit(*self.service.progress())
+
+    def shutdown(self) -> None:
+        self.service.close()
+
+
+_INSTANCES: "weakref.WeakKeyDictionary[Any, QtExtraction]" = weakref.WeakKeyDictionary()
+
+
+def extraction_for(db) -> QtExtraction:
+    """Shared QtExtraction (one process pool) per CareerDB instance."""
+    inst = _INSTANCES.get(db)
+    if inst is None:
+        inst = QtExtraction(db)
+        _INSTANCES[db] = inst
+    return inst
+
+
+def shutdown_all() -> None:
+    for inst in list(_INSTANCES.values()):
+        inst.shutdown()
+
@@ -4,8 +4,7 @@ from __future__ import annotations
 import shutil
 import uuid
 from pathlib import Path
-from typing import Optional, List, Tuple, Dict
-from datetime import datetime
+from typing import Iterable, Optional, List, Tuple, Dict
 
 from PySide6.QtCore import Qt, QUrl, QSize, QRect, QPoint, Signal, QTimer
 from PySide6.QtGui import QDesktopServices, QCursor, QPixmap, QImage
@@ -15,7 +14,9 @@ from PySide6.QtWidgets import (
     QLayoutItem
 )
 
+from ui_qt.async_db import for_db
 from ui_qt.base import palette
+from ui_qt.extraction import extraction_for
 
 
 CATEGORIES = ["All", "CV", "Cover Letters", "Certificates", "Applications", "Other"]
@@ -38,6 +39,14 @@ def normalize_category(cat: str) -> str:
     return c
 
 
+def category_spellings(stored: Iterable[Optional[str]], cat: str) -> Tuple[str, ...]:
+    """
+    The stored category names normalize_category() shows as `cat` (the Tk
+    app saves "CV/Resume"), so the filter can run in SQL and still match
+    exactly what the page displays under that category.
+    """
+    return tuple(c for c in stored if c is not None and normalize_category(c) == cat) or (cat,)
+
 SORT_OPTIONS = [
     "Newest",
     "Oldest",
@@ -46,6 +55,18 @@ SORT_OPTIONS = [
     "Category",
 ]
 
+# SORT_OPTIONS -> CareerDB.list_files_page(order=...)
+SORT_ORDERS = {
+    "Newest": "newest",
+    "Oldest": "oldest",
+    "Name A–Z": "name",
+    "Name Z–A": "name_desc",
+    "Category": "category",
+}
+
+# cards per keyset page (more load as the grid is scrolled)
+PAGE_SIZE = 60
+
 # Option B: PyMuPDF for PDF thumbnails
 try:
     import fitz  # PyMuPDF
@@ -55,13 +76,6 @@ except Exception:
     _HAS_PYMUPDF = False
 
 
-def _safe_date_key(date_str: str) -> datetime:
-    try:
-        return datetime.strptime(date_str, "%Y-%m-%d")
-    except Exception:
-        return datetime.min
-
-
 def infer_category_from_filename(name: str, ext: str) -> str:
     """
     Smarter inference:
@@ -412,6 +426,9 @@ class FileCard(QFrame):
 # Main Page
 # -----------------------------
 class FileVaultPage(QWidget):
+    # MainWindow re-runs refresh() on the next visit only if one of these tables changed
+    refresh_tables = ("files",)
+
     def __init__(self, db, vault_dir: str):
         super().__init__()
         self.db = db
@@ -422,6 +439,11 @@ class FileVaultPage(QWidget):
         self._selected_card: Optional[FileCard] = None
         self._thumb_cache: Dict[str, QPixmap] = {}
 
+        # keyset paging state
+        self._next_key = None
+        self._loading = False
+        self._generation = 0
+
         root = QVBoxLayout(self)
         root.setContentsMargins(0, 0, 0, 0)
         root.setSpacing(12)
@@ -433,6 +455,13 @@ class FileVaultPage(QWidget):
         header.addWidget(title)
         header.addStretch(1)
 
+        # imported documents are read in the background so AI Buddy / Cover Letter hit the cache
+        self.extraction = extraction_for(db)
+        self.lbl_extract = QLabel("")
+        self.lbl_extract.setStyleSheet(f"color:{palette['muted']}; font-weight:700;")
+        self.extraction.progress.connect(self._on_extract_progress)
+        header.addWidget(self.lbl_extract)
+
         self.cmb_sort = QComboBox()
         self.cmb_sort.addItems(SORT_OPTIONS)
         self.cmb_sort.setFixedHeight(36)
@@ -491,6 +520,7 @@ class FileVaultPage(QWidget):
         self.flow = FlowLayout(self.grid_host, margin=6, spacing=14)
         self.grid_host.setLayout(self.flow)
         self.scroll.setWidget(self.grid_host)
+        self.scroll.verticalScrollBar().valueChanged.connect(self._on_scrolled)
 
         card_l.addWidget(self.scroll, 1)
 
@@ -657,61 +687,39 @@ class FileVaultPage(QWidget):
     def _selected_file(self) -> Optional[Tuple[int, str]]:
         return self._selected
 
-    def _sorted_rows(self, rows):
-        mode = self.cmb_sort.currentText()
-
-        if mode == "Newest":
-            return sorted(rows, key=lambda r: _safe_date_key(str(r[4])), reverse=True)
-        if mode == "Oldest":
-            return sorted(rows, key=lambda r: _safe_date_key(str(r[4])), reverse=False)
-        if mode == "Name A–Z":
-            return sorted(rows, key=lambda r: str(r[2]).lower())
-        if mode == "Name Z–A":
-            return sorted(rows, key=lambda r: str(r[2]).lower(), reverse=True)
-        if mode == "Category":
-            return sorted(rows, key=lambda r: str(r[3]).lower())
+    def _page_query(self):
+        return self.cmb_cat.currentText(), SORT_ORDERS.get(self.cmb_sort.currentText(), "newest")
 
-        return rows
+    def _load_page(self, cat: str, order: str, after_key):
+        # DB worker thread: resolve the category to its stored spellings, then page in SQL
+        categories = None if cat == "All" else category_spellings(self.db.file_categories(), cat)
+        return self.db.list_files_page(categories, order, after_key, PAGE_SIZE)
 
     # ---------- data ----------
+    def refresh(self):
+        self.reload()
+
     def reload(self):
         self._selected = None
         if self._selected_card:
             self._selected_card.set_selected(False)
         self._selected_card = None
 
-        selected_cat = self.cmb_cat.currentText()
-
-        # Always load everything from DB first
-        rows = self.db.list_files("All")
-
-        # Normalize category names from DB
-        rows = [(fid, fn, on, normalize_category(cat), da) for (fid, fn, on, cat, da) in rows]
-
-        # Apply category filter locally
-        if selected_cat != "All":
-            rows = [r for r in rows if r[3] == selected_cat]
-
-        # Apply sort
-        rows = self._sorted_rows(rows)
+        # first keyset page (filtered + sorted in SQL, on the DB worker); more on scroll
+        self._generation += 1
+        self._next_key = None
+        self._loading = True
+        cat, order = self._page_query()
+        for_db(self.db).call(
+            self._load_page, cat, order, None,
+            on_result=self._apply_first_page, key="filevault.reload",
+        )
 
+    def _apply_first_page(self, page):
+        rows, self._next_key = page
+        self._loading = False
         self._clear_flow()
-
-        for (file_id, filename, original_name, category, date_added) in rows:
-            full_path = self.vault_dir / str(filename)
-
-            c = FileCard(
-                file_id=int(file_id),
-                stored_name=str(filename),
-                title=str(original_name),
-                category=str(category),
-                date_added=str(date_added),
-                full_path=full_path,
-                thumb_cache=self._thumb_cache,
-            )
-            c.clicked.connect(lambda fid, sname, card=c: self._set_selected(fid, sname, card))
-            c.doubleClicked.connect(lambda fid, sname: self._open_by_ids(fid, sname))
-            self.flow.addWidget(c)
+        self._append_rows(rows)
 
         if not rows:
             empty = QLabel("No files yet. Import your CVs, cover letters, certificates, and applications.")
@@ -727,6 +735,55 @@ class FileVaultPage(QWidget):
             wl.addWidget(empty)
             self.flow.addWidget(wrap)
 
+    def _on_scrolled(self, value: int):
+        if value >= self.scroll.verticalScrollBar().maximum() - 200:
+            self._load_more()
+
+    def _load_more(self):
+        if self._next_key is None or self._loading:
+            return
+        self._loading = True
+        gen = self._generation
+        cat, order = self._page_query()
+        for_db(self.db).call(
+            self._load_page, cat, order, self._next_key,
+            on_result=lambda page, g=gen: self._apply_more(g, page),
+            key="filevault.more",
+        )
+
+    def _apply_more(self, generation: int, page):
+        if generation != self._generation:
+            return  # filter/sort changed since this page was requested
+        rows, self._next_key = page
+        self._loading = False
+        self._append_rows(rows)
+
+    def _fill_viewport(self):
+        # no scrollbar yet -> scrolling can't trigger the next page; ask now
+        if self.scroll.verticalScrollBar().maximum() == 0:
+            self._load_more()
+
+    def _append_rows(self, rows):
+        for row in rows:
+            full_path = self.vault_dir / str(row.filename)
+
+            c = FileCard(
+                file_id=int(row.id),
+                stored_name=str(row.filename),
+                title=str(row.original_name),
+                # normalize legacy category spellings from the DB
+                category=str(normalize_category(row.category)),
+                date_added=str(row.date_added),
+                full_path=full_path,
+                thumb_cache=self._thumb_cache,
+            )
+            c.clicked.connect(lambda fid, sname, card=c: self._set_selected(fid, sname, card))
+            c.doubleClicked.connect(lambda fid, sname: self._open_by_ids(fid, sname))
+            self.flow.addWidget(c)
+
+        if self._next_key is not None:
+            QTimer.singleShot(0, self._fill_viewport)
+
     def import_file(self):
         path, _ = QFileDialog.getOpenFileName(self, "Import file")
         if not path:
@@ -747,6 +804,11 @@ class FileVaultPage(QWidget):
             self.reload()
         except Exception as e:
             QMessageBox.critical(self, "Import failed", str(e))
+            return
+        self.extraction.prefetch([str(dst)])
+
+    def _on_extract_progress(self, done: int, total: int):
+        self.lbl_extract.setText(f"Reading documents {done}/{total}…" if total else "")
 
     # ---------- actions ----------
     def _open_by_ids(self, file_id: int, stored_name: str):
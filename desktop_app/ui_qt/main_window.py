@@ -1,15 +1,18 @@
 # ui_qt/main_window.py
 from __future__ import annotations
 
+import threading
+from pathlib import Path
 from typing import Dict
 
-from PySide6.QtCore import Qt, QEasingCurve, QPropertyAnimation
+from PySide6.QtCore import Qt, QEasingCurve, QPropertyAnimation, Signal
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QLabel, QPushButton,
-    QFrame, QStackedWidget, QSizePolicy
+    QFrame, QStackedWidget, QSizePolicy, QMessageBox
 )
 from fastapi import background
 
+from services.backup import BackupManager
 from ui_qt.base import palette
 from ui_qt.tracker import JobTrackerPage
 
@@ -98,6 +101,18 @@ class Sidebar(QFrame):
         self.btn_minimise.setMinimumHeight(36)
         lay.addWidget(self.btn_minimise)
 
+        self.btn_backup = QPushButton("💾 Back up now")
+        self.btn_backup.setObjectName("ghostBtn")
+        self.btn_backup.setMinimumHeight(36)
+        lay.addWidget(self.btn_backup)
+
+        # one-off maintenance for dbs created before auto_vacuum=INCREMENTAL; hidden otherwise
+        self.btn_vacuum = QPushButton("🧹 Reclaim disk space")
+        self.btn_vacuum.setObjectName("ghostBtn")
+        self.btn_vacuum.setMinimumHeight(36)
+        self.btn_vacuum.setVisible(False)
+        lay.addWidget(self.btn_vacuum)
+
         self.buttons: Dict[str, SidebarButton] = {}
         nav_def = [
             ("📋", "Job Tracker", "job_deck"),
@@ -116,9 +131,9 @@ class Sidebar(QFrame):
 
         lay.addStretch(1)
 
-        footer = QLabel("v6 • Qt Edition ✨")
-        footer.setStyleSheet(f"color:{palette['muted']};font-weight:700;")
-        lay.addWidget(footer)
+        self.footer = QLabel("v6 • Qt Edition ✨")
+        self.footer.setStyleSheet(f"color:{palette['muted']};font-weight:700;")
+        lay.addWidget(self.footer)
 
     def toggle(self):
         self._collapsed = not self._collapsed
@@ -135,12 +150,23 @@ class Sidebar(QFrame):
             b.set_collapsed(self._collapsed)
 
         self.btn_minimise.setText("⬇" if self._collapsed else "⬇ Minimise to Card")
+        if self.btn_backup.isEnabled():
+            self.btn_backup.setText("💾" if self._collapsed else "💾 Back up now")
+        if self.btn_vacuum.isEnabled():
+            self.btn_vacuum.setText("🧹" if self._collapsed else "🧹 Reclaim disk space")
 
 
 class MainWindow(QMainWindow):
-    def __init__(self, db, vault_dir: str):
+    # (BackupReport | None, Exception | None), emitted from the backup thread
+    backup_finished = Signal(object, object)
+    # Exception | None, emitted from the maintenance thread
+    vacuum_finished = Signal(object)
+
+    def __init__(self, db, vault_dir: str, retention=None):
         super().__init__()
         self.db = db
+        self.retention = retention
+        self.backups = BackupManager(Path(db.db_path), Path(vault_dir))
 
         self.setWindowTitle(APP_NAME)
         self.resize(1200, 780)
@@ -169,7 +195,7 @@ class MainWindow(QMainWindow):
         self.page_job_deck = JobTrackerPage(self.db)
         self.page_calendar = CalendarPage(self.db)
         self.page_analytics = AnalyticsPage(self.db)
-        self.page_cover_letter = CoverLetterPage()
+        self.page_cover_letter = CoverLetterPage(self.db)
         self.page_file_vault = FileVaultPage(self.db, vault_dir)
         self.page_whiteboard = WhiteboardPage()
         self.page_notepad = NotepadPage(self.db)
@@ -186,10 +212,23 @@ class MainWindow(QMainWindow):
             "ai_buddy": self.stack.addWidget(self.page_ai),
         }
 
+        # Pages refresh themselves on construction; after that a page is only
+        # refreshed on show if one of its refresh_tables changed (in any process).
+        for key, idx in self.pages.items():
+            tables = getattr(self.stack.widget(idx), "refresh_tables", ())
+            if tables:
+                self.db.versions.mark_fresh(key, tables)
+
         for key, btn in self.sidebar.buttons.items():
             btn.clicked.connect(lambda _=False, k=key: self.show_page(k))
 
         self.sidebar.btn_minimise.clicked.connect(self.minimise_to_card)
+        self.sidebar.btn_backup.clicked.connect(self.start_backup)
+        self.backup_finished.connect(self._on_backup_finished)
+        self.sidebar.btn_vacuum.clicked.connect(self.start_vacuum)
+        self.vacuum_finished.connect(self._on_vacuum_finished)
+        if self.retention is not None:
+            self.sidebar.btn_vacuum.setVisible(not self.retention.incremental_vacuum_enabled())
 
         self.show_page("job_deck")
 
@@ -264,9 +303,62 @@ class MainWindow(QMainWindow):
             self.stack.setCurrentIndex(idx)
 
         page = self.stack.currentWidget()
-        if hasattr(page, "refresh"):
+        tables = getattr(page, "refresh_tables", ())
+        if hasattr(page, "refresh") and tables and self.db.versions.should_refresh(key, tables):
             page.refresh()
-
+        self._update_refresh_stats()
+
+    def _update_refresh_stats(self):
+        performed, skipped = self.db.versions.totals()
+        self.sidebar.footer.setToolTip(f"Page refreshes: {performed} performed • {skipped} skipped")
+
+    def start_backup(self):
+        # snapshot + vault copy run on a worker thread; the result comes back via a queued signal
+        self.db.journal.flush()
+        if self.backups.start_backup(lambda report, err: self.backup_finished.emit(report, err)):
+            self.sidebar.btn_backup.setEnabled(False)
+            self.sidebar.btn_backup.setText("💾" if self.sidebar._collapsed else "💾 Backing up…")
+
+    def _on_backup_finished(self, report, err):
+        self.sidebar.btn_backup.setEnabled(True)
+        self.sidebar.btn_backup.setText("💾" if self.sidebar._collapsed else "💾 Back up now")
+        if err is not None:
+            QMessageBox.warning(self, "Backup", f"Backup failed:\n{err}")
+            return
+        self.sidebar.btn_backup.setToolTip(
+            f"Last backup: {report.archive.name}\n"
+            f"{report.files} files ({report.files_copied} new) • {report.seconds:.1f}s"
+        )
+
+    def start_vacuum(self):
+        answer = QMessageBox.question(
+            self, "Reclaim disk space",
+            "Rewrite the database once so space freed by archived AI chats is returned "
+            "to disk from now on?\n\nThis can take a while on a large database; "
+            "saving is paused until it finishes.",
+        )
+        if answer != QMessageBox.Yes:
+            return
+        self.sidebar.btn_vacuum.setEnabled(False)
+        self.sidebar.btn_vacuum.setText("🧹" if self.sidebar._collapsed else "🧹 Working…")
+
+        def _run():
+            try:
+                self.retention.enable_incremental_vacuum()
+            except Exception as e:
+                self.vacuum_finished.emit(e)
+            else:
+                self.vacuum_finished.emit(None)
+
+        threading.Thread(target=_run, name="vacuum", daemon=True).start()
+
+    def _on_vacuum_finished(self, err):
+        self.sidebar.btn_vacuum.setEnabled(True)
+        self.sidebar.btn_vacuum.setText("🧹" if self.sidebar._collapsed else "🧹 Reclaim disk space")
+        if err is not None:
+            QMessageBox.warning(self, "Reclaim disk space", f"Could not rewrite the database:\n{err}")
+            return
+        self.sidebar.btn_vacuum.setVisible(False)
 
     def minimise_to_card(self):
         self.hide()
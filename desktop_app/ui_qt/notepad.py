@@ -1,9 +1,7 @@
 # ui_qt/notepad.py
 from __future__ import annotations
 
-import sqlite3
-from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional
 
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
@@ -11,15 +9,11 @@ from PySide6.QtWidgets import (
     QListWidget, QListWidgetItem, QTextEdit, QLineEdit, QMessageBox
 )
 
+from services.rows import NoteItem, row_factory
 from ui_qt.base import palette
 
-
-@dataclass
-class NoteItem:
-    id: int
-    title: str
-    content: str
-    updated_at: str
+# list rows per keyset page (more load as the list is scrolled)
+PAGE_SIZE = 50
 
 
 class NotepadPage(QWidget):
@@ -28,15 +22,16 @@ class NotepadPage(QWidget):
     - Left: list of notes
     - Right: title + editor
     - Autosave (debounced)
-    Stored inside your existing career_buddy.db as table note_items.
+    Stored inside your existing career_buddy.db as table note_items
+    (created by services/migrations.py).
     """
 
     def __init__(self, db):
         super().__init__()
         self.db = db
-        self._ensure_schema()
 
         self._current_id: Optional[int] = None
+        self._next_key = None  # keyset cursor of the next list page (None = all loaded)
         self._save_timer = QTimer(self)
         self._save_timer.setSingleShot(True)
         self._save_timer.timeout.connect(self._commit_save)
@@ -72,6 +67,7 @@ class NotepadPage(QWidget):
 
         self.list = QListWidget()
         self.list.itemClicked.connect(self._select_note)
+        self.list.verticalScrollBar().valueChanged.connect(self._on_list_scrolled)
         left_l.addWidget(self.list, 1)
 
         btns = QHBoxLayout()
@@ -143,47 +139,19 @@ class NotepadPage(QWidget):
 
     # ---------- DB helpers ----------
     def _conn(self):
-        return sqlite3.connect(self.db.db_path)
+        # shared per-thread connection from CareerDB (commits on exit)
+        return self.db._conn()
 
-    def _ensure_schema(self):
-        with self._conn() as conn:
-            cur = conn.cursor()
-            cur.execute("""
-                CREATE TABLE IF NOT EXISTS note_items(
-                    id INTEGER PRIMARY KEY,
-                    title TEXT NOT NULL,
-                    content TEXT NOT NULL,
-                    updated_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%d %H:%M:%S','now'))
-                );
-            """)
-            conn.commit()
-
-    def _list_notes(self, q: str = "") -> List[NoteItem]:
-        with self._conn() as conn:
-            cur = conn.cursor()
-            if q.strip():
-                like = f"%{q.strip()}%"
-                cur.execute("""
-                    SELECT id, title, content, updated_at
-                    FROM note_items
-                    WHERE title LIKE ? OR content LIKE ?
-                    ORDER BY updated_at DESC
-                """, (like, like))
-            else:
-                cur.execute("""
-                    SELECT id, title, content, updated_at
-                    FROM note_items
-                    ORDER BY updated_at DESC
-                """)
-            rows = cur.fetchall()
-            return [NoteItem(*r) for r in rows]
+    def _list_notes(self, q: str = "", after_key=None):
+        """One keyset page of (id, title, updated_at) rows + the next cursor; no bodies."""
+        return self.db.list_note_items_page(q, after_key, PAGE_SIZE)
 
     def _get_note(self, note_id: int) -> Optional[NoteItem]:
-        with self._conn() as conn:
+        with self.db._read() as conn:
             cur = conn.cursor()
+            cur.row_factory = row_factory(NoteItem)
             cur.execute("SELECT id, title, content, updated_at FROM note_items WHERE id=?", (note_id,))
-            r = cur.fetchone()
-            return NoteItem(*r) if r else None
+            return cur.fetchone()
 
     def _insert_note(self, title: str, content: str) -> int:
         with self._conn() as conn:
@@ -210,15 +178,11 @@ class NotepadPage(QWidget):
 
     # ---------- UI ----------
     def reload(self):
-        q = self.search.text()
-        notes = self._list_notes(q)
+        rows, self._next_key = self._list_notes(self.search.text())
 
         self.list.blockSignals(True)
         self.list.clear()
-        for n in notes:
-            item = QListWidgetItem(n.title if n.title.strip() else "Untitled")
-            item.setData(Qt.UserRole, n.id)
-            self.list.addItem(item)
+        self._append_list_rows(rows)
         self.list.blockSignals(False)
 
         # keep selection if possible
@@ -229,6 +193,31 @@ class NotepadPage(QWidget):
                     self.list.setCurrentItem(it)
                     break
 
+    def _append_list_rows(self, rows):
+        for note_id, title, _updated_at in rows:
+            item = QListWidgetItem(title if title.strip() else "Untitled")
+            item.setData(Qt.UserRole, note_id)
+            self.list.addItem(item)
+        if self._next_key is not None:
+            QTimer.singleShot(0, self._fill_list)
+
+    def _load_more(self):
+        if self._next_key is None:
+            return
+        rows, self._next_key = self._list_notes(self.search.text(), self._next_key)
+        self.list.blockSignals(True)
+        self._append_list_rows(rows)
+        self.list.blockSignals(False)
+
+    def _on_list_scrolled(self, value: int):
+        if value >= self.list.verticalScrollBar().maximum() - 5:
+            self._load_more()
+
+    def _fill_list(self):
+        # no scrollbar yet -> scrolling can't trigger the next page; ask now
+        if self.list.verticalScrollBar().maximum() == 0:
+            self._load_more()
+
     def _open_first_or_create(self):
         if self.list.count() == 0:
             self.new_note()
@@ -297,4 +286,18 @@ class NotepadPage(QWidget):
         content = self.editor.toPlainText()
         self._update_note(self._current_id, title, content)
         self.status.setText("Saved")
-        self.reload()
+        self._touch_list_item(self._current_id, title)
+
+    def _touch_list_item(self, note_id: int, title: str):
+        """Rename the saved note's row and move it to the top (list is newest-first)."""
+        self.list.blockSignals(True)
+        for i in range(self.list.count()):
+            it = self.list.item(i)
+            if int(it.data(Qt.UserRole)) == note_id:
+                it.setText(title if title.strip() else "Untitled")
+                if i != 0:
+                    self.list.takeItem(i)
+                    self.list.insertItem(0, it)
+                self.list.setCurrentItem(it)
+                break
+        self.list.blockSignals(False)
@@ -1,11 +1,9 @@
 # ui_qt/tracker.py
 from __future__ import annotations
-from ui_qt.analytics import log_activity
 
-from dataclasses import dataclass
 from typing import Optional, List
 
-from PySide6.QtCore import Qt, QMimeData, QPoint
+from PySide6.QtCore import Qt, QMimeData, QPoint, QTimer
 from PySide6.QtGui import QDrag
 from PySide6.QtWidgets import (
     QWidget,
@@ -22,11 +20,18 @@ from PySide6.QtWidgets import (
     QMessageBox,
 )
 
+from services.events import JOB_EVENTS, ChangeEvent, JobDeleted, JobsAdded, JobStatusChanged
+from services.rows import JobCard as Job  # the JobCard name is taken by the card widget
+from ui_qt.async_db import for_db
 from ui_qt.base import palette
+from ui_qt.db_events import subscribe
 
 
 KANBAN = ["To Apply", "Applied", "Interviewing", "Offer", "Rejected"]
 
+# cards fetched per column per scroll step (keyset pages, see CareerDB.list_jobs_page)
+PAGE_SIZE = 40
+
 COLORS = {
     "To Apply": "#3498db",
     "Applied": "#f39c12",
@@ -51,15 +56,6 @@ RANKS = {
 }
 
 
-@dataclass
-class Job:
-    id: int
-    company: str
-    role: str
-    status: str
-    notes: str
-    date_added: str
-
 class DropScrollArea(QScrollArea):
     """Forward drag/drop events from the viewport to the owning column."""
     def __init__(self, owner_column: "DropColumn"):
@@ -87,6 +83,7 @@ class AddJobDialog(QDialog):
         super().__init__(parent)
         self.db = db
         self.job = job
+        self._details_failed = False
 
         self.setWindowTitle("Add Job" if job is None else "Edit Job")
         self.setModal(True)
@@ -143,9 +140,14 @@ class AddJobDialog(QDialog):
             self.ent_company.setText(job.company)
             self.ent_role.setText(job.role)
             self.cmb_status.setCurrentText(job.status)
-            link, notes = self._split_link(job.notes or "")
-            self.ent_link.setText(link)
-            self.txt_notes.setPlainText(notes)
+            # cards don't carry notes; load them now (saving waits so they can't be wiped)
+            self.btn_save = btn_save
+            btn_save.setEnabled(False)
+            self.txt_notes.setPlaceholderText("Loading notes...")
+            for_db(self.db).call(
+                self.db.get_job_details, job.id,
+                on_result=self._apply_details, on_error=self._details_error,
+            )
 
         self.setStyleSheet(f"""
             QDialog {{
@@ -178,6 +180,25 @@ class AddJobDialog(QDialog):
             }}
         """)
 
+    def _apply_details(self, details):
+        self.txt_notes.setPlaceholderText("Description / notes...")
+        if details is not None:
+            notes, link_col = details
+            link, notes = self._split_link(notes)
+            self.ent_link.setText(link or link_col)
+            self.txt_notes.setPlainText(notes)
+        self.btn_save.setEnabled(True)
+
+    def _details_error(self, err: BaseException):
+        # Save works again, but leaves the notes/link it couldn't show untouched
+        print("Job details load error:", err)
+        self._details_failed = True
+        self.txt_notes.setPlaceholderText("Notes couldn't be loaded; saving keeps them as they are.")
+        self.txt_notes.setEnabled(False)
+        self.ent_link.setEnabled(False)
+        self.btn_save.setEnabled(True)
+        QMessageBox.warning(self, "Edit Job", f"Couldn't load this job's notes:\n{err}")
+
     def _split_link(self, notes: str):
         if "Link:" in notes:
             parts = notes.split("Link:", 1)
@@ -201,6 +222,8 @@ class AddJobDialog(QDialog):
             # CareerDB has separate link column, but your list fetch is notes-based.
             # Keep your existing convention; storing link inside notes is fine for now.
             self.db.add_job(company, role, status, notes=full_notes)
+        elif self._details_failed:
+            self.db.edit_job(self.job.id, company, role, status, None, link=None)
         else:
             self.db.edit_job(self.job.id, company, role, status, full_notes, link="")
 
@@ -357,10 +380,15 @@ class JobCard(QFrame):
 
 
 class DropColumn(QFrame):
-    def __init__(self, status: str, on_drop_job_id):
+    def __init__(self, status: str, on_drop_job_id, on_need_more):
         super().__init__()
         self.status = status
         self.on_drop_job_id = on_drop_job_id
+        self.on_need_more = on_need_more
+
+        # keyset cursor of the next page (None = everything loaded)
+        self.next_key = None
+        self.loading = False
         self.setAcceptDrops(True)
         self.setObjectName("DropColumn")
 
@@ -383,6 +411,8 @@ class DropColumn(QFrame):
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(QFrame.NoFrame)
         scroll.setWidget(self.cards_container)
+        scroll.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+        self.scroll = scroll
 
 
         root.addWidget(header)
@@ -416,6 +446,45 @@ class DropColumn(QFrame):
     def add_card(self, card: JobCard):
         self.cards_layout.insertWidget(self.cards_layout.count() - 1, card)
 
+    def insert_card(self, card: JobCard):
+        """Insert keeping newest-first order (same as list_job_cards)."""
+        idx = 0
+        for idx in range(self.cards_layout.count() - 1):
+            w = self.cards_layout.itemAt(idx).widget()
+            if isinstance(w, JobCard) and w.job.date_added <= card.job.date_added:
+                break
+        else:
+            idx = self.cards_layout.count() - 1
+        self.cards_layout.insertWidget(idx, card)
+
+    def remove_card(self, card: JobCard):
+        self.cards_layout.removeWidget(card)
+        card.deleteLater()
+
+    # ----- paging -----
+    def covers(self, job: Job) -> bool:
+        """True if `job` sorts inside the already-loaded (newest-first) window."""
+        if self.next_key is None:
+            return True
+        return (job.date_added, job.id) >= tuple(self.next_key)
+
+    def _on_scrolled(self, value: int):
+        if value >= self.scroll.verticalScrollBar().maximum() - 120:
+            self._request_more()
+
+    def _request_more(self):
+        if self.next_key is not None and not self.loading:
+            self.loading = True
+            self.on_need_more(self.status)
+
+    def fill_viewport(self):
+        def _check():
+            # no scrollbar yet -> scrolling can't trigger the next page; ask now
+            if self.scroll.verticalScrollBar().maximum() == 0:
+                self._request_more()
+
+        QTimer.singleShot(0, _check)
+
     def dragEnterEvent(self, event):
         if event.mimeData().hasText():
             self.setProperty("dragOver", True)
@@ -470,7 +539,7 @@ class JobTrackerPage(QWidget):
 
         self.columns: dict[str, DropColumn] = {}
         for st in KANBAN:
-            col = DropColumn(st, self.on_drop_job)
+            col = DropColumn(st, self.on_drop_job, self._load_more)
             self.columns[st] = col
             self.columns_row.addWidget(col, 1)
 
@@ -478,48 +547,128 @@ class JobTrackerPage(QWidget):
         wrap.setLayout(self.columns_row)
         root.addWidget(wrap, 1)
 
+        self._job_by_id: dict[int, Job] = {}
+        self._cards: dict[int, JobCard] = {}
+        self._reload_pending = False
+        self._generation = 0  # bumped per reload; late pages of older reloads are dropped
+
+        # Patch single cards on DB change events instead of rebuilding the deck
+        subscribe(self.db, JOB_EVENTS, self._on_job_event)
+
         self.reload()
 
-    def _fetch_jobs(self) -> list[Job]:
-        rows = self.db.get_all_jobs()
-        jobs: list[Job] = []
-        for r in rows:
-            job_id, company, role, status, notes, date_added = r
-            jobs.append(Job(job_id, company, role, status, notes or "", date_added or ""))
-        return jobs
+    def _rows_to_jobs(self, rows) -> list[Job]:
+        # rows are used as-is; only legacy NULL dates need a copy
+        return [r if r.date_added is not None else r._replace(date_added="") for r in rows]
 
     def reload(self):
-        jobs = self._fetch_jobs()
-        self._job_by_id = {j.id: j for j in jobs}
+        # first page of every column, queried on the DB worker; more pages load on scroll
+        self._reload_pending = True
+        self._generation += 1
+        for_db(self.db).call(self._load_first_pages, on_result=self._apply_pages, key="tracker.reload")
 
-        for col in self.columns.values():
-            col.clear_cards()
+    def _load_first_pages(self):
+        # runs on the DB worker thread: no widget access here
+        return {st: self.db.list_jobs_page(st, None, PAGE_SIZE) for st in KANBAN}
 
-        for job in jobs:
+    def _apply_pages(self, pages):
+        self._reload_pending = False
+        self._job_by_id = {}
+        self._cards = {}
+
+        for st, col in self.columns.items():
+            col.clear_cards()
+            rows, col.next_key = pages[st]
+            col.loading = False
+            self._append_rows(col, rows)
+
+    def _load_more(self, status: str):
+        col = self.columns[status]
+        gen = self._generation
+        for_db(self.db).call(
+            self.db.list_jobs_page, status, col.next_key, PAGE_SIZE,
+            on_result=lambda page, st=status, g=gen: self._apply_more(st, g, page),
+            key=f"tracker.more.{status}",
+        )
+
+    def _apply_more(self, status: str, generation: int, page):
+        if generation != self._generation:
+            return
+        col = self.columns[status]
+        rows, col.next_key = page
+        col.loading = False
+        self._append_rows(col, rows)
+
+    def _append_rows(self, col: DropColumn, rows):
+        for job in self._rows_to_jobs(rows):
+            if job.id in self._cards:
+                continue  # already placed by a change event
             card = JobCard(job, on_open=self.open_details, on_delete=self.delete_job)
-            self.columns[job.status].add_card(card)
+            self._job_by_id[job.id] = job
+            self._cards[job.id] = card
+            col.add_card(card)
+        col.fill_viewport()
+
+    # --------------------------
+    # Incremental updates
+    # --------------------------
+    def _on_job_event(self, ev: ChangeEvent):
+        if self._reload_pending or isinstance(ev, JobsAdded):
+            # a full reload is in flight and may predate this write, or a bulk
+            # import landed: (re)load the first pages rather than patch card by card
+            self.reload()
+            return
+
+        if isinstance(ev, JobDeleted):
+            self._remove_card(ev.job_id)
+            return
+
+        if isinstance(ev, JobStatusChanged):
+            job = self._job_by_id.get(ev.job_id)
+            if job is not None:
+                self._place_card(job._replace(status=ev.new))
+                return
 
+        # JobAdded / JobUpdated (or a job we haven't seen): fetch just that row
+        for_db(self.db).call(self.db.get_job_card, ev.job_id, on_result=self._on_job_row)
 
+    def _on_job_row(self, row):
+        if row is None:
+            return
+        self._place_card(self._rows_to_jobs([row])[0])
+
+    def _place_card(self, job: Job):
+        self._remove_card(job.id)
+        if not self.columns[job.status].covers(job):
+            return  # older than the loaded window; it arrives with a later page
+        card = JobCard(job, on_open=self.open_details, on_delete=self.delete_job)
+        self._job_by_id[job.id] = job
+        self._cards[job.id] = card
+        self.columns[job.status].insert_card(card)
+
+    def _remove_card(self, job_id: int):
+        self._job_by_id.pop(job_id, None)
+        card = self._cards.pop(job_id, None)
+        if card is not None:
+            self.columns[card.job.status].remove_card(card)
+
+    # --------------------------
+    # Actions (cards update via DB change events)
+    # --------------------------
     def add_job(self):
         dlg = AddJobDialog(self, self.db, job=None)
         if dlg.exec() == QDialog.Accepted:
-            self.reload()
-            # We can’t easily know which row id was inserted without changing db.add_job return handling here,
-            # so log a generic "Added new job" or, if you want, fetch latest job:
-            jobs = self.db.get_all_jobs()
-            if jobs:
-                job_id, company, role, status, notes, date_added = jobs[0]
-                log_activity(f"Added {company} → {status} {SUITS[status]}{RANKS[status]}")
+            company = dlg.ent_company.text().strip()
+            status = dlg.cmb_status.currentText()
+            self.db.journal.log(f"Added {company} → {status} {SUITS[status]}{RANKS[status]}")
 
     def open_details(self, job: Job):
         dlg = AddJobDialog(self, self.db, job=job)
-        if dlg.exec() == QDialog.Accepted:
-            self.reload()
+        dlg.exec()
 
     def delete_job(self, job: Job):
-        log_activity(f"Deleted {job.company} → removed 🃏")
+        self.db.journal.log(f"Deleted {job.company} → removed 🃏")
         self.db.delete_job(job.id)
-        self.reload()
 
 
     def on_drop_job(self, job_id: int, new_status: str):
@@ -529,10 +678,10 @@ class JobTrackerPage(QWidget):
         role = old.role if old else ""
 
         if old_status and old_status != new_status:
-            log_activity(
+            self.db.journal.log(
                 f"Moved {company} {('('+role+')') if role else ''} → {new_status} {SUITS[new_status]}{RANKS[new_status]}"
             )
 
-        self.db.update_job_status(job_id, new_status)
-        self.reload()
+        # off the GUI thread; the card moves when JobStatusChanged comes back
+        for_db(self.db).call(self.db.update_job_status, job_id, new_status)
 